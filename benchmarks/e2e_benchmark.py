@@ -0,0 +1,417 @@
+"""端到端吞吐量基准测试
+
+对本地模拟 WHOIS 服务器运行完整的 main()，覆盖 插件类型 × 进程数 × 线程数 × 输入规模 的组合，
+统计每秒处理域名数、单次查询耗时的 p50/p99、峰值内存与 CPU 时间，结果保存为 JSON，并与基线比较。
+
+每个组合在独立的子进程中运行，峰值内存与 CPU 时间互不影响。统计资源占用使用 resource 模块，仅支持 Linux 和 macOS。
+
+Example:
+    python -m benchmarks.e2e_benchmark --quick --output result.json --baseline benchmarks/baseline/e2e.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional, TypedDict, cast
+
+# 用于解决运行出现 ModuleNotFoundError: No module named 'src' 问题
+ROOT_DIR: str = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from tests.fake_whois_server import FakeWhoisServer, redirect_builtin_plugins
+
+DEFAULT_SIZES: list[int] = [10_000, 100_000, 1_000_000]
+QUICK_SIZES: list[int] = [2_000]
+# 与基线比较的指标-容差 键值对。每秒处理域名数低于基线、其余指标高于基线超过此比例时视为性能下降
+# p99 耗时以毫秒取整且数值较小，同一份代码多次运行相差可达 30%，容差较大
+DEFAULT_TOLERANCES: dict[str, float] = {
+    "domains_per_sec": 0.1,
+    "latency_p99_ms": 0.5,
+    "peak_rss_mb": 0.1,
+    "cpu_time_sec": 0.15,
+}
+HIGHER_IS_BETTER: set[str] = {"domains_per_sec"}  # 越大越好的指标，其余越小越好
+
+# 生成输入时轮流使用的后缀，覆盖不同的 WHOIS 服务器和响应格式
+SUFFIXES: tuple[str, ...] = ("com", "net", "org", "cn", "co.uk", "io", "ch")
+
+
+class BenchmarkCase(TypedDict):
+    """一个基准测试组合"""
+
+    plugin_id: str
+    num_processes: int
+    max_num_threads_per_process: Optional[int]
+    num_domains: int
+
+
+class BenchmarkResult(TypedDict):
+    """一个基准测试组合的结果"""
+
+    case: str
+    domains_per_sec: float
+    latency_p50_ms: float
+    latency_p99_ms: float
+    peak_rss_mb: float  # 主进程与子进程中最大的峰值内存
+    cpu_time_sec: float  # 主进程与全部子进程的用户态加内核态 CPU 时间之和
+    wall_time_sec: float
+
+
+def case_name(case: BenchmarkCase) -> str:
+    """生成组合的名称，用于与基线中的同名组合比较
+
+    Args:
+        case (BenchmarkCase): 基准测试组合
+
+    Returns:
+        str: 如 async_query-p2-tauto-n10000
+    """
+    threads = case["max_num_threads_per_process"]
+    return f"{case['plugin_id']}-p{case['num_processes']}-t{threads if threads is not None else 'auto'}-n{case['num_domains']}"
+
+
+def build_matrix(
+    plugin_ids: list[str],
+    process_counts: list[int],
+    thread_counts: list[Optional[int]],
+    sizes: list[int],
+) -> list[BenchmarkCase]:
+    """生成全部组合。线程数只影响同步型插件，异步型插件只使用默认线程数
+
+    Args:
+        plugin_ids (list[str]): 插件 id
+        process_counts (list[int]): 进程数
+        thread_counts (list[Optional[int]]): 每进程线程数，None 表示默认
+        sizes (list[int]): 输入域名数
+
+    Returns:
+        list[BenchmarkCase]: 全部组合
+    """
+    matrix: list[BenchmarkCase] = []
+    for plugin_id in plugin_ids:
+        for num_processes in process_counts:
+            for threads in thread_counts if plugin_id == "sync_query" else [None]:
+                for num_domains in sizes:
+                    matrix.append(
+                        {
+                            "plugin_id": plugin_id,
+                            "num_processes": num_processes,
+                            "max_num_threads_per_process": threads,
+                            "num_domains": num_domains,
+                        }
+                    )
+    return matrix
+
+
+def write_input_file(path: str, num_domains: int) -> None:
+    """生成输入文件，每行一个不重复的可注册域名
+
+    Args:
+        path (str): 输入文件路径
+        num_domains (int): 域名数
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(num_domains):
+            # 每 10 个域名中有 1 个未注册，与真实列表中少量可注册域名的比例相近
+            label = f"free{i}" if i % 10 == 0 else f"bench{i}"
+            f.write(f"{label}.{SUFFIXES[i % len(SUFFIXES)]}\n")
+
+
+def percentile(values: list[float], q: float) -> float:
+    """计算百分位数（最近秩法）
+
+    Args:
+        values (list[float]): 数值
+        q (float): 百分位，0 到 100
+
+    Returns:
+        float: 百分位数，values 为空时为 0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def run_case(case: BenchmarkCase, server_address: str, work_dir: str) -> BenchmarkResult:
+    """在独立的子进程中运行一个组合
+
+    Args:
+        case (BenchmarkCase): 基准测试组合
+        server_address (str): 模拟 WHOIS 服务器地址
+        work_dir (str): 存放输入、输出文件的临时目录
+
+    Returns:
+        BenchmarkResult: 结果
+    """
+    input_file = os.path.join(work_dir, f"input-{case['num_domains']}.txt")
+    if not os.path.exists(input_file):
+        write_input_file(input_file, case["num_domains"])
+    result_stream_file = os.path.join(work_dir, f"{case_name(case)}.jsonl")
+
+    env = {**os.environ, "QUIET_FLAG": "True"}
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.e2e_benchmark",
+            "--run-case",
+            json.dumps(case),
+            "--input-file",
+            input_file,
+            "--result-stream-file",
+            result_stream_file,
+            "--work-dir",
+            work_dir,
+            "--server-address",
+            server_address,
+        ],
+        cwd=ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{case_name(case)} failed:\n{completed.stderr[-2000:]}")
+    usage: dict = json.loads(completed.stdout.strip().splitlines()[-1])
+    for name in ("output.txt", "error.txt"):
+        os.remove(os.path.join(work_dir, name))
+
+    latencies: list[float] = []
+    with open(result_stream_file, "r", encoding="utf-8") as f:
+        for line in f:
+            latencies.append(json.loads(line)["latency"])
+    os.remove(result_stream_file)
+
+    return {
+        "case": case_name(case),
+        "domains_per_sec": round(case["num_domains"] / usage["wall_time_sec"], 1),
+        "latency_p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "latency_p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "peak_rss_mb": usage["peak_rss_mb"],
+        "cpu_time_sec": usage["cpu_time_sec"],
+        "wall_time_sec": usage["wall_time_sec"],
+    }
+
+
+def _run_case_in_process(
+    case: BenchmarkCase,
+    input_file: str,
+    result_stream_file: str,
+    work_dir: str,
+    server_address: str,
+) -> None:
+    """在当前（独立的）进程中运行 main()，并在标准输出的最后一行打印资源占用"""
+    from src.main import main
+    from src.plugin_manager import PluginManager
+
+    PluginManager().load_plugin(plugin_dir_path="plugins")
+    # 内置插件的查询全部发送到模拟服务器。替换结果只有以 fork 方式启动的子进程才能继承
+    multiprocessing.set_start_method("fork", force=True)
+    redirect_builtin_plugins(server_address)
+
+    # 模拟服务器不限速，基准测试测的是本程序自身的上限
+    rate_limit_config_file = os.path.join(work_dir, "no-rate-limit.json")
+    with open(rate_limit_config_file, "w", encoding="utf-8") as f:
+        json.dump({"default": {"rate": 0, "concurrency": 0}}, f)
+
+    start_time = time.perf_counter()
+    main(
+        input_file=input_file,
+        output_file=os.path.join(work_dir, "output.txt"),
+        error_file=os.path.join(work_dir, "error.txt"),
+        num_processes=case["num_processes"],
+        max_num_threads_per_process=case["max_num_threads_per_process"],
+        plugin_id=case["plugin_id"],
+        rate_limit_config_file=rate_limit_config_file,
+        max_retries=0,
+        result_stream_file=result_stream_file,
+    )
+    wall_time = time.perf_counter() - start_time
+
+    self_usage = resource.getrusage(resource.RUSAGE_SELF)
+    children_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # Linux 上 ru_maxrss 的单位为 KB，macOS 上为字节
+    rss_unit = 1 if platform.system() == "Darwin" else 1024
+    print(
+        json.dumps(
+            {
+                "wall_time_sec": round(wall_time, 3),
+                "peak_rss_mb": round(
+                    max(self_usage.ru_maxrss, children_usage.ru_maxrss)
+                    * rss_unit
+                    / 1024**2,
+                    1,
+                ),
+                "cpu_time_sec": round(
+                    self_usage.ru_utime
+                    + self_usage.ru_stime
+                    + children_usage.ru_utime
+                    + children_usage.ru_stime,
+                    3,
+                ),
+            }
+        )
+    )
+
+
+def compare_with_baseline(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    tolerances: Optional[dict[str, float]] = None,
+) -> list[str]:
+    """与基线比较每秒处理域名数、p99 耗时、峰值内存与 CPU 时间
+
+    Args:
+        results (list[BenchmarkResult]): 本次结果
+        baseline (list[BenchmarkResult]): 基线结果
+        tolerances (Optional[dict[str, float]], optional): 指标-容差 键值对，未指定的指标使用 DEFAULT_TOLERANCES 中的值
+
+    Returns:
+        list[str]: 性能下降的组合与指标说明，没有下降时为空列表
+    """
+    tolerances = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+    baseline_by_case = {result["case"]: result for result in baseline}
+    regressions: list[str] = []
+    for result in results:
+        base = baseline_by_case.get(result["case"])
+        if base is None:
+            continue
+        for metric, tolerance in tolerances.items():
+            value: float = cast(dict[str, float], result)[metric]
+            base_value: float = cast(dict[str, float], base)[metric]
+            if base_value <= 0:
+                continue
+            ratio = value / base_value
+            if (
+                ratio < 1 - tolerance
+                if metric in HIGHER_IS_BETTER
+                else ratio > 1 + tolerance
+            ):
+                regressions.append(
+                    f"{result['case']}: {metric} {value}, baseline {base_value} ({(ratio - 1) * 100:+.1f}%)"
+                )
+    return regressions
+
+
+def _print_table(results: list[BenchmarkResult]) -> None:
+    print(
+        f"{'case':<36}{'domains/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'RSS MB':>10}{'CPU s':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['case']:<36}{r['domains_per_sec']:>12}{r['latency_p50_ms']:>10}{r['latency_p99_ms']:>10}{r['peak_rss_mb']:>10}{r['cpu_time_sec']:>10}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="端到端吞吐量基准测试")
+    parser.add_argument(
+        "--plugins", nargs="+", default=["async_query", "sync_query"], type=str
+    )
+    parser.add_argument("--processes", nargs="+", default=[1, 2, 4], type=int)
+    parser.add_argument(
+        "--threads", nargs="+", default=[8, 32], type=int, help="同步型插件的每进程线程数"
+    )
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, type=int)
+    parser.add_argument(
+        "--quick", action="store_true", help=f"只使用 {QUICK_SIZES} 个域名，用于快速检查"
+    )
+    parser.add_argument("--latency", default=0.0, type=float, help="模拟服务器的响应延迟")
+    parser.add_argument("--output", type=str, help="保存结果的 JSON 文件")
+    parser.add_argument("--baseline", type=str, help="用于比较的基线 JSON 文件")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        help=f"全部指标使用的容差。未指定时按指标分别使用 {DEFAULT_TOLERANCES}",
+    )
+    # 以下参数仅供内部在子进程中运行单个组合时使用
+    parser.add_argument("--run-case", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--input-file", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--result-stream-file", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--server-address", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case is not None:
+        _run_case_in_process(
+            json.loads(args.run_case),
+            args.input_file,
+            args.result_stream_file,
+            args.work_dir,
+            args.server_address,
+        )
+        return 0
+
+    matrix = build_matrix(
+        args.plugins,
+        args.processes,
+        args.threads,
+        QUICK_SIZES if args.quick else args.sizes,
+    )
+
+    results: list[BenchmarkResult] = []
+    server = FakeWhoisServer(latency=args.latency).start_in_thread()
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            for case in matrix:
+                result = run_case(case, server.address, work_dir)
+                results.append(result)
+                print(
+                    f"{result['case']}: {result['domains_per_sec']} domains/s",
+                    file=sys.stderr,
+                )
+    finally:
+        server.stop()
+
+    _print_table(results)
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"python": platform.python_version(), "results": results}, f, indent=2
+            )
+
+    if args.baseline is not None:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline_file: dict = json.load(f)
+        baseline: list[BenchmarkResult] = baseline_file["results"]
+        # 不同版本的解释器性能差异较大，结果只作参考
+        baseline_python: str = baseline_file.get("python", "")
+        if (
+            baseline_python.rsplit(".", 1)[0]
+            != platform.python_version().rsplit(".", 1)[0]
+        ):
+            print(
+                f"Warning: baseline was produced on Python {baseline_python}, running on Python {platform.python_version()}",
+                file=sys.stderr,
+            )
+        regressions = compare_with_baseline(
+            results,
+            baseline,
+            (
+                {metric: args.tolerance for metric in DEFAULT_TOLERANCES}
+                if args.tolerance is not None
+                else None
+            ),
+        )
+        if regressions:
+            print("Performance regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("No performance regressions against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
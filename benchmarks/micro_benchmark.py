@@ -0,0 +1,233 @@
+"""CPU 热点路径的微基准测试
+
+每个查询成功的域名都会经过：后缀树提取可注册域名、遍历一次 WHOIS 响应得到状态与过期时间字段、
+datetime_string_parser 解析时间、is_datetime_expired 判断是否过期。
+本脚本用接近真实的输入（带条款说明的完整 WHOIS 响应、各种写法的链接）分别测量每个阶段，
+报告每次操作的耗时（ns/op）与临时内存分配（B/op，为 tracemalloc 统计的单次操作峰值内存增量），
+用于找出网络很快时单进程 CPU 上限的来源。
+
+Example:
+    python -m benchmarks.micro_benchmark --output micro.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, TypedDict
+
+# 用于解决运行出现 ModuleNotFoundError: No module named 'src' 问题
+ROOT_DIR: str = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from tests.fake_whois_server import render_response
+
+from src.defined_types import Ok
+from src.utils.date_utils import datetime_string_parser, is_datetime_expired
+from src.utils.date_utils._datetime_parser import _parse_datetime_string
+from src.utils.domain_trie import get_domain_trie
+from src.utils.whois_parser import whois_parser
+from src.utils.whois_parser._whois_parser import _WHOIS_FIELD_PATTERN
+
+DEFAULT_CORPUS_SIZE: int = 1000
+DEFAULT_MIN_TIME: float = 0.5  # 每个阶段至少运行多少秒
+ALLOCATION_SAMPLES: int = 200  # 统计内存分配时采样的操作数
+
+# 真实的 WHOIS 响应大多带有很长的条款说明，过期时间所在的行通常在前部
+TERMS_OF_USE: str = (
+    ">>> Last update of whois database: 2025-01-01T00:00:00Z <<<\r\n\r\n"
+    "For more information on Whois status codes, please visit https://icann.org/epp\r\n\r\n"
+    + "NOTICE: The expiration date displayed in this record is the date the "
+    "registrar's sponsorship of the domain name registration in the registry is "
+    "currently set to expire. This date does not necessarily reflect the expiration "
+    "date of the domain name registrant's agreement with the sponsoring registrar.\r\n\r\n"
+    * 3
+    + "TERMS OF USE: You are not authorized to access or query our Whois database "
+    "through the use of electronic processes that are high-volume and automated "
+    "except as reasonably necessary to register domain names or modify existing "
+    "registrations.\r\n" * 4
+)
+
+URL_TEMPLATES: tuple[str, ...] = (
+    "https://www.{label}.com/path/to/page?id=1",
+    "http://blog.{label}.co.uk/",
+    "{label}.net",
+    "{label}.org/about",
+    "https://{label}.github.io/",
+    "shop.{label}.com.cn",
+    "{label}.io:8080/api",
+)
+
+DATE_STRINGS: tuple[str, ...] = (
+    "2033-12-23T07:59:05Z",
+    "2028-09-13T07:00:00+0000",
+    "2025-01-01T00:00:00.0Z",
+    "2025-11-09 22:31:20+00:00",
+    "2025-01-01 00:00:00",
+    "12-Feb-2026",
+    "24.11.2025",
+)
+
+
+class MicroBenchmarkResult(TypedDict):
+    """一个阶段的结果"""
+
+    stage: str
+    ns_per_op: float
+    alloc_bytes_per_op: float
+
+
+def build_corpus(size: int) -> dict[str, list[Any]]:
+    """生成各阶段使用的输入
+
+    Args:
+        size (int): 每种输入的条数
+
+    Returns:
+        dict[str, list[Any]]: 输入名-输入列表 键值对
+    """
+    suffixes = ("com", "net", "org", "cn", "co.uk", "mk", "ch")
+    raw_responses: list[str] = []
+    for i in range(size):
+        # 每 10 个中有 1 个未注册
+        label = f"free{i}" if i % 10 == 0 else f"example{i}"
+        raw = render_response(f"{label}.{suffixes[i % len(suffixes)]}")
+        if raw[0] not in "01":
+            raw += TERMS_OF_USE
+        raw_responses.append(raw)
+
+    date_strings = [DATE_STRINGS[i % len(DATE_STRINGS)] for i in range(size)]
+    return {
+        "url_lines": [
+            URL_TEMPLATES[i % len(URL_TEMPLATES)].format(label=f"site{i}")
+            for i in range(size)
+        ],
+        "raw_responses": raw_responses,
+        "registered_responses": [
+            raw for raw in raw_responses if whois_parser(raw)["status"][0]
+        ],
+        "date_strings": date_strings,
+        "datetimes": [
+            result.value
+            for result in map(datetime_string_parser, date_strings)
+            if isinstance(result, Ok)
+        ],
+    }
+
+
+def build_stages(
+    corpus: dict[str, list[Any]],
+) -> list[tuple[str, Callable[[Any], Any], list[Any]]]:
+    """生成要测量的阶段
+
+    Args:
+        corpus (dict[str, list[Any]]): build_corpus 生成的输入
+
+    Returns:
+        list[tuple[str, Callable[[Any], Any], list[Any]]]: (阶段名, 单次操作, 输入列表)
+    """
+    return [
+        ("domain_trie", get_domain_trie().match_url, corpus["url_lines"]),
+        (
+            "whois_field_scan",
+            lambda raw: _WHOIS_FIELD_PATTERN.findall("\n" + raw),
+            corpus["raw_responses"],
+        ),
+        ("datetime_string_parser", datetime_string_parser, corpus["date_strings"]),
+        (
+            "datetime_string_parser (uncached)",
+            lambda date_string: _parse_datetime_string.__wrapped__(date_string.strip()),
+            corpus["date_strings"],
+        ),
+        ("is_datetime_expired", is_datetime_expired, corpus["datetimes"]),
+        ("whois_parser (total)", whois_parser, corpus["raw_responses"]),
+        ("whois_parser (registered)", whois_parser, corpus["registered_responses"]),
+    ]
+
+
+def measure(
+    name: str,
+    func: Callable[[Any], Any],
+    inputs: list[Any],
+    min_time: float = DEFAULT_MIN_TIME,
+) -> MicroBenchmarkResult:
+    """测量一个阶段的耗时与内存分配
+
+    Args:
+        name (str): 阶段名
+        func (Callable[[Any], Any]): 单次操作
+        inputs (list[Any]): 输入，循环使用
+        min_time (float, optional): 至少运行多少秒
+
+    Returns:
+        MicroBenchmarkResult: 结果
+    """
+    # 预热，填充各种缓存
+    for item in inputs:
+        func(item)
+
+    ops: int = 0
+    start_ns = time.perf_counter_ns()
+    deadline_ns = start_ns + int(min_time * 1e9)
+    while True:
+        for item in inputs:
+            func(item)
+        ops += len(inputs)
+        end_ns = time.perf_counter_ns()
+        if end_ns >= deadline_ns:
+            break
+
+    # tracemalloc 会显著拖慢运行，单独采样统计
+    samples = inputs[:ALLOCATION_SAMPLES]
+    total_alloc: int = 0
+    tracemalloc.start()
+    for item in samples:
+        tracemalloc.reset_peak()
+        current_before = tracemalloc.get_traced_memory()[0]
+        func(item)
+        total_alloc += tracemalloc.get_traced_memory()[1] - current_before
+    tracemalloc.stop()
+
+    return {
+        "stage": name,
+        "ns_per_op": round((end_ns - start_ns) / ops, 1),
+        "alloc_bytes_per_op": round(total_alloc / len(samples), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CPU 热点路径的微基准测试")
+    parser.add_argument("--corpus-size", default=DEFAULT_CORPUS_SIZE, type=int)
+    parser.add_argument("--min-time", default=DEFAULT_MIN_TIME, type=float)
+    parser.add_argument("--output", type=str, help="保存结果的 JSON 文件")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.corpus_size)
+    results: list[MicroBenchmarkResult] = [
+        measure(name, func, inputs, args.min_time)
+        for name, func, inputs in build_stages(corpus)
+    ]
+
+    print(f"{'stage':<32}{'ns/op':>14}{'B/op':>12}")
+    for r in results:
+        print(f"{r['stage']:<32}{r['ns_per_op']:>14}{r['alloc_bytes_per_op']:>12}")
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "date": datetime.date.today().isoformat(),
+                    "python": sys.version.split()[0],
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
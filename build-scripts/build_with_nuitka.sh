@@ -1,7 +1,7 @@
 #!/bin/bash
 
 echo "build domain-checker"
-python -m nuitka ./src/main.py --standalone --onefile --output-filename=domain-checker --output-dir=bin/domain-checker
+python -m nuitka ./src/main.py --standalone --onefile --include-data-dir=./src/data=src/data --output-filename=domain-checker --output-dir=bin/domain-checker
 
 cp -r plugins bin/domain-checker/plugins
 rm -rf bin/domain-checker/plugins/__pycache__
@@ -67,14 +67,17 @@ async def main():
                 print(e)
         print("✅ Got WHOIS Servers")
 
-    with open("whois_server_list.py", "a", encoding="utf-8") as suffix_list:
-        suffix_list.write("whois_server_dict: dict[str, str] = {\n")
-        for tld_and_whois_server in tld_with_whois_server:
-            suffix_list.write(
-                f'"{tld_and_whois_server[0]}":"{tld_and_whois_server[1]}",\n'
-            )
-        suffix_list.write("}")
-    print("✅ WHOIS Servers written to whois_server_list.py")
+    # 每行为 后缀<TAB>WHOIS 服务器主机名，按后缀排序。替换主程序的 src/data/whois_server_list.tsv 即可更新
+    with open(
+        "whois_server_list.tsv", "w", encoding="utf-8", newline="\n"
+    ) as whois_server_list:
+        whois_server_list.write(
+            "# 顶级域名（后缀）与 WHOIS 服务器的对应表，每行为 后缀<TAB>WHOIS 服务器主机名，按后缀排序\n"
+            "# 由 extra-scripts/get-whois-server-list 生成\n"
+        )
+        for tld, whois_server in sorted(tld_with_whois_server):
+            whois_server_list.write(f"{tld}\t{whois_server.strip()}\n")
+    print("✅ WHOIS Servers written to whois_server_list.tsv")
 
     # get PSL
     async with aiohttp.ClientSession(connector=connector) as session:
@@ -84,6 +87,11 @@ async def main():
         )
     print("✅ Got PSL")
 
+    # 原样保存，替换主程序的 src/data/public_suffix_list.dat 即可更新公共后缀列表
+    with open("public_suffix_list.dat", "w", encoding="utf-8") as suffix_list_dat:
+        suffix_list_dat.write(public_suffix_list_dat)
+    print("✅ Public Suffix List written to public_suffix_list.dat")
+
     public_suffix_list = []
     for line in public_suffix_list_dat.splitlines():
         if line and not line.startswith("//"):
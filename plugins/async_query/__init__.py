@@ -1,6 +1,8 @@
 import asyncio
 
-from .whois_server_list import whois_server_dict
+from src.utils.dns_cache import open_cached_connection
+from src.utils.domain_trie import find_whois_server
+from src.utils.whois_servers import get_whois_server_dict
 
 METADATA = {
     "id": "async_query",
@@ -33,7 +35,9 @@ async def main(domain: str):
 
             return {"code": 503, "raw": raw_whois[1]}
 
-        root_server = whois_server_dict[get_domain_tld(domain)]
+        root_server = find_whois_server(domain)
+        if not root_server:
+            return {"code": 500, "raw": f"No WHOIS server for {domain}"}
         raw_whois = await whois_request(domain, root_server)
         if raw_whois[0] == "Socket error":
             return {"code": 503, "raw": raw_whois[1]}
@@ -46,28 +50,36 @@ async def main(domain: str):
         return {"code": 500, "raw": str(e)}
 
 
-def get_domain_tld(domain: str) -> str:
+def get_whois_server(domain: str, whois_server: str) -> str:
     """
-    解析出域名的顶级域名，并检查其是否在 whois_server_dict 的键中。
+    获取查询该域名时连接的 WHOIS 服务器，主程序据此按服务器限速。
 
     Args:
         domain (str): 完整域名
+        whois_server (str): 内置对应表中该域名的 WHOIS 服务器，找不到时为空字符串
 
     Returns:
-        str: 顶级域名，如果不在字典中则返回空字符串
+        str: WHOIS 服务器主机名，找不到时返回空字符串
     """
-    domain_parts = domain.lower().split(".")
-    for i in range(len(domain_parts)):
-        potential_root = ".".join(domain_parts[i:])
-        if potential_root in whois_server_dict:
-            return potential_root
-    return ""
+    if domain.endswith(".li") or domain.endswith(".ch"):
+        return "whois.nic.ch"
+    return whois_server
+
+
+def get_all_whois_servers() -> set[str]:
+    """
+    获取全部可能连接的 WHOIS 服务器，主程序据此在启动时预先解析主机名。
+
+    Returns:
+        set[str]: WHOIS 服务器主机名
+    """
+    return {"whois.nic.ch", *get_whois_server_dict().values()}
 
 
 async def whois_request(domain: str, server: str, port=43, timeout=15) -> tuple[int, str]:
     try:
         reader, writer = await asyncio.wait_for(
-            asyncio.open_connection(server, port), timeout
+            open_cached_connection(server, port), timeout
         )
         writer.write(f"{domain}\r\n".encode("utf-8"))
         await writer.drain()
@@ -0,0 +1,188 @@
+import asyncio
+import importlib.util
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from .bootstrap import load_bootstrap
+
+METADATA = {
+    "id": "rdap_query",
+    "mode": "async",
+    "author": "HowieHz",
+    "help": "通过 RDAP 协议查询域名信息，复用 HTTP 连接，直接返回结构化的状态与过期时间",
+}
+
+# 安装了 h2 时使用 HTTP/2，同一个 RDAP 服务器的并发查询共用一个连接
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+MAX_CONNECTIONS_PER_SERVER = 32
+MAX_KEEPALIVE_CONNECTIONS_PER_SERVER = 16
+KEEPALIVE_EXPIRY = 30
+REQUEST_TIMEOUT = 15
+
+# 这些 RDAP 状态表示域名已被删除、等待释放，见 RFC 8056
+REDEMPTION_STATUSES = {"redemption period", "pending delete", "pending restore"}
+
+# 顶级域名-RDAP 服务地址 键值对，setup 或首次查询时读取
+_rdap_server_dict: Optional[dict[str, str]] = None
+_bootstrap_lock: Optional[asyncio.Lock] = None
+# RDAP 服务器-HTTP 客户端 键值对。连接不能跨事件循环使用，teardown 时全部关闭
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+async def setup():
+    """
+    每个进程的事件循环中调用一次，预先读取对应表，使按服务器限速从第一个查询起生效。
+    """
+    global _bootstrap_lock
+    _bootstrap_lock = asyncio.Lock()
+    try:
+        await get_rdap_server_dict()
+    except (httpx.HTTPError, OSError, ValueError):
+        pass  # 读取失败时在查询时重新读取
+
+
+async def teardown():
+    """
+    关闭全部 HTTP 客户端及其连接。
+    """
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def main(domain: str):
+    try:
+        rdap_server = get_rdap_server(domain, await get_rdap_server_dict())
+        if not rdap_server:
+            return {"code": 404, "raw": f"No RDAP service for {domain}"}
+
+        ascii_domain = domain.encode("idna").decode("ascii")
+        response = await get_client(rdap_server).get(
+            f"{rdap_server.rstrip('/')}/domain/{ascii_domain}"
+        )
+        if response.status_code == 404:
+            return {
+                "code": 200,
+                "raw": response.text or "404 Not Found",
+                "status": "unregistered",
+            }
+        if response.status_code != 200:
+            # 429 为查询过快，其他错误按状态码处理
+            return {"code": response.status_code, "raw": response.text}
+
+        status, expiry_date = parse_rdap_domain(response.json())
+        ret = {"code": 200, "raw": response.text, "status": status}
+        if expiry_date is not None:
+            ret["expiry_date"] = expiry_date
+        return ret
+    except httpx.TransportError as e:
+        return {"code": 503, "raw": str(e) or type(e).__name__}
+    except Exception as e:
+        return {"code": 500, "raw": str(e)}
+
+
+def get_whois_server(domain: str, whois_server: str) -> str:
+    """
+    获取查询该域名时连接的 RDAP 服务器，主程序据此按服务器限速。
+
+    Args:
+        domain (str): 完整域名
+        whois_server (str): 内置对应表中该域名的 WHOIS 服务器，不使用
+
+    Returns:
+        str: RDAP 服务器主机名，对应表尚未读取或找不到时返回空字符串
+    """
+    if _rdap_server_dict is None:
+        return ""
+    return urlsplit(get_rdap_server(domain, _rdap_server_dict)).hostname or ""
+
+
+async def get_rdap_server_dict() -> dict[str, str]:
+    """
+    获取顶级域名-RDAP 服务地址对应表，同一时间只读取一次。
+
+    Returns:
+        dict[str, str]: 顶级域名-RDAP 服务地址 键值对
+    """
+    global _rdap_server_dict, _bootstrap_lock
+    if _rdap_server_dict is not None:
+        return _rdap_server_dict
+
+    if _bootstrap_lock is None:
+        _bootstrap_lock = asyncio.Lock()
+    async with _bootstrap_lock:
+        if _rdap_server_dict is None:
+            _rdap_server_dict = await load_bootstrap()
+    return _rdap_server_dict
+
+
+def get_rdap_server(domain: str, rdap_server_dict: dict[str, str]) -> str:
+    """
+    查找域名对应的 RDAP 服务地址，优先匹配最长的后缀。
+
+    Args:
+        domain (str): 完整域名
+        rdap_server_dict (dict[str, str]): 顶级域名-RDAP 服务地址 键值对
+
+    Returns:
+        str: RDAP 服务地址，找不到时返回空字符串
+    """
+    domain_parts = domain.lower().split(".")
+    for i in range(1, len(domain_parts)):
+        rdap_server = rdap_server_dict.get(".".join(domain_parts[i:]))
+        if rdap_server is not None:
+            return rdap_server
+    return ""
+
+
+def get_client(rdap_server: str) -> httpx.AsyncClient:
+    """
+    获取连接该 RDAP 服务器使用的 HTTP 客户端，同一个服务器的查询复用连接池，直到 teardown。
+
+    Args:
+        rdap_server (str): RDAP 服务地址
+
+    Returns:
+        httpx.AsyncClient: HTTP 客户端
+    """
+    netloc = urlsplit(rdap_server).netloc
+    client = _clients.get(netloc)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS_PER_SERVER,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS_PER_SERVER,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            # 等待连接池空闲连接的时间不计入超时，并发数由主程序控制
+            timeout=httpx.Timeout(REQUEST_TIMEOUT, pool=None),
+            headers={"Accept": "application/rdap+json"},
+            follow_redirects=True,
+        )
+        _clients[netloc] = client
+    return client
+
+
+def parse_rdap_domain(data: dict) -> tuple[str, Optional[str]]:
+    """
+    从 RDAP 域名查询结果中提取状态与过期时间。
+
+    Args:
+        data (dict): RDAP 返回的 JSON
+
+    Returns:
+        tuple[str, Optional[str]]: 状态（"registered" 或 "redemption"）与过期时间，没有过期时间时为 None
+    """
+    statuses = {str(s).lower() for s in data.get("status", [])}
+    status = "redemption" if statuses & REDEMPTION_STATUSES else "registered"
+
+    expiry_date: Optional[str] = None
+    for event in data.get("events", []):
+        if event.get("eventAction") == "expiration":
+            expiry_date = event.get("eventDate")
+            break
+    return status, expiry_date
@@ -0,0 +1,93 @@
+import json
+import os
+import time
+from typing import Optional
+
+import httpx
+
+# IANA 发布的顶级域名-RDAP 服务地址对应表，见 RFC 9224
+IANA_BOOTSTRAP_URL = "https://data.iana.org/rdap/dns.json"
+# 设置后从此地址下载对应表，而不是 IANA，用于测试
+RDAP_BOOTSTRAP_URL_ENV = "DOMAIN_CHECKER_RDAP_BOOTSTRAP_URL"
+# 设置后对应表缓存到此文件夹，而不是 ~/.cache/domain-checker
+RDAP_CACHE_DIR_ENV = "DOMAIN_CHECKER_RDAP_CACHE_DIR"
+
+BOOTSTRAP_CACHE_FILE_NAME = "rdap_dns.json"
+BOOTSTRAP_MAX_AGE = 7 * 24 * 3600  # 缓存超过此秒数后重新下载，IANA 很少更新此表
+BOOTSTRAP_DOWNLOAD_TIMEOUT = 30
+
+
+def get_cache_path() -> str:
+    """
+    获取对应表缓存文件的路径。
+
+    Returns:
+        str: 缓存文件路径
+    """
+    cache_dir = os.environ.get(RDAP_CACHE_DIR_ENV) or os.path.join(
+        os.path.expanduser("~"), ".cache", "domain-checker"
+    )
+    return os.path.join(cache_dir, BOOTSTRAP_CACHE_FILE_NAME)
+
+
+def parse_bootstrap(bootstrap: dict) -> dict[str, str]:
+    """
+    将 IANA 对应表转为 顶级域名-RDAP 服务地址 键值对。
+
+    Args:
+        bootstrap (dict): 对应表，格式为 {"services": [[["com", "net"], ["https://rdap.verisign.com/com/v1/"]], ...]}
+
+    Returns:
+        dict[str, str]: 顶级域名-RDAP 服务地址 键值对，有多个地址时优先使用 https 地址
+    """
+    rdap_server_dict: dict[str, str] = {}
+    for tlds, urls in bootstrap.get("services", []):
+        if not urls:
+            continue
+        url = next((u for u in urls if u.startswith("https://")), urls[0])
+        for tld in tlds:
+            rdap_server_dict[tld.lower()] = url
+    return rdap_server_dict
+
+
+async def load_bootstrap() -> dict[str, str]:
+    """
+    读取对应表。缓存未过期时直接使用缓存，否则重新下载并缓存；下载失败时使用已过期的缓存。
+
+    Returns:
+        dict[str, str]: 顶级域名-RDAP 服务地址 键值对
+
+    Raises:
+        httpx.HTTPError: 下载失败且没有缓存
+    """
+    cache_path = get_cache_path()
+    cached: Optional[dict] = None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if time.time() - os.path.getmtime(cache_path) < BOOTSTRAP_MAX_AGE:
+            return parse_bootstrap(cached)
+    except (OSError, ValueError):
+        cached = None
+
+    url = os.environ.get(RDAP_BOOTSTRAP_URL_ENV) or IANA_BOOTSTRAP_URL
+    try:
+        async with httpx.AsyncClient(timeout=BOOTSTRAP_DOWNLOAD_TIMEOUT) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+            bootstrap: dict = response.json()
+    except (httpx.HTTPError, ValueError):
+        if cached is not None:
+            return parse_bootstrap(cached)
+        raise
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # 先写入临时文件再替换，避免多个进程同时写入时读到不完整的文件
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(bootstrap, f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # 无法缓存不影响本次查询
+    return parse_bootstrap(bootstrap)
@@ -0,0 +1,52 @@
+import os
+from typing import Optional
+
+from src.utils.replay import REPLAY_FILE_ENV, REPLAY_PLUGIN_ID_ENV, load_replay_archive
+
+METADATA = {
+    "id": "replay_query",
+    "mode": "async",
+    "author": "HowieHz",
+    "help": "从 --record 录制的归档文件中读取 whois 信息，不联网。使用 --replay 指定归档文件，归档中有多个插件的记录时使用 --replay-plugin-id 指定插件",
+}
+
+# 首次查询时读取归档文件，之后直接从内存中返回
+_archive: Optional[dict] = None
+
+
+def _load_archive() -> dict:
+    """
+    读取环境变量指定的归档文件中所选插件的记录。
+
+    Returns:
+        dict: 域名-插件原始返回值 键值对
+
+    Raises:
+        ValueError: 未设置归档文件，或归档中有多个插件的记录而未指定插件
+    """
+    global _archive
+    if _archive is None:
+        replay_file = os.environ.get(REPLAY_FILE_ENV)
+        if not replay_file:
+            raise ValueError(f"{REPLAY_FILE_ENV} is not set")
+        _archive = load_replay_archive(
+            replay_file, os.environ.get(REPLAY_PLUGIN_ID_ENV) or None
+        )
+    return _archive
+
+
+def setup():
+    """
+    开始查询前读取归档。归档无效时直接报错退出，而不是每个域名都查询失败。
+    """
+    _load_archive()
+
+
+async def main(domain: str):
+    try:
+        archive = _load_archive()
+        if domain not in archive:
+            return {"code": 404, "raw": "Not found in replay archive"}
+        return archive[domain]
+    except Exception as e:
+        return {"code": 500, "raw": str(e)}
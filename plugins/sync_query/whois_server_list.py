@@ -1,1196 +0,0 @@
-whois_server_dict: dict[str, str] = {
-    "aaa": "whois.nic.aaa",
-    "aarp": "whois.nic.aarp",
-    "abb": "whois.nic.abb",
-    "abbott": "whois.nic.abbott",
-    "abc": "whois.nic.abc",
-    "abogado": "whois.nic.abogado",
-    "abudhabi": "whois.nic.abudhabi",
-    "ac": "whois.nic.ac",
-    "academy": "whois.nic.academy",
-    "accenture": "whois.nic.accenture",
-    "accountant": "whois.nic.accountant",
-    "accountants": "whois.nic.accountants",
-    "aco": "whois.nic.aco",
-    "actor": "whois.nic.actor",
-    "ad": "whois.nic.ad",
-    "ads": "whois.nic.google",
-    "adult": "whois.nic.adult",
-    "ae": "whois.aeda.net.ae",
-    "aeg": "whois.nic.aeg",
-    "aero": "whois.aero",
-    "af": "whois.nic.af",
-    "afl": "whois.nic.afl",
-    "africa": "whois.nic.africa",
-    "ag": "whois.nic.ag",
-    "agakhan": "whois.nic.agakhan",
-    "agency": "whois.nic.agency",
-    "ai": "whois.nic.ai",
-    "airbus": "whois.nic.airbus",
-    "airforce": "whois.nic.airforce",
-    "airtel": "whois.nic.airtel",
-    "akdn": "whois.nic.akdn",
-    "alibaba": "whois.nic.alibaba",
-    "alipay": "whois.nic.alipay",
-    "allfinanz": "whois.nic.allfinanz",
-    "allstate": "whois.nic.allstate",
-    "ally": "whois.nic.ally",
-    "alsace": "whois.nic.alsace",
-    "alstom": "whois.nic.alstom",
-    "am": "whois.amnic.net",
-    "americanfamily": "whois.nic.americanfamily",
-    "amfam": "whois.nic.amfam",
-    "amsterdam": "whois.nic.amsterdam",
-    "android": "whois.nic.google",
-    "anquan": "whois.teleinfo.cn",
-    "anz": "whois.nic.anz",
-    "aol": "whois.nic.aol",
-    "apartments": "whois.nic.apartments",
-    "app": "whois.nic.google",
-    "apple": "whois.nic.apple",
-    "aquarelle": "whois.nic.aquarelle",
-    "ar": "whois.nic.ar",
-    "arab": "whois.nic.arab",
-    "archi": "whois.nic.archi",
-    "army": "whois.nic.army",
-    "arpa": "whois.iana.org",
-    "art": "whois.nic.art",
-    "arte": "whois.nic.arte",
-    "as": "whois.nic.as",
-    "asda": "whois.nic.asda",
-    "asia": "whois.nic.asia",
-    "associates": "whois.nic.associates",
-    "at": "whois.nic.at",
-    "attorney": "whois.nic.attorney",
-    "au": "whois.auda.org.au",
-    "auction": "whois.nic.auction",
-    "audi": "whois.nic.audi",
-    "audio": "whois.nic.audio",
-    "auspost": "whois.nic.auspost",
-    "auto": "whois.nic.auto",
-    "autos": "whois.nic.autos",
-    "aw": "whois.nic.aw",
-    "ax": "whois.ax",
-    "baby": "whois.nic.baby",
-    "baidu": "whois.gtld.knet.cn",
-    "band": "whois.nic.band",
-    "bank": "whois.nic.bank",
-    "bar": "whois.nic.bar",
-    "barcelona": "whois.nic.barcelona",
-    "barclaycard": "whois.nic.barclaycard",
-    "barclays": "whois.nic.barclays",
-    "barefoot": "whois.nic.barefoot",
-    "bargains": "whois.nic.bargains",
-    "baseball": "whois.nic.baseball",
-    "basketball": "whois.nic.basketball",
-    "bauhaus": "whois.nic.bauhaus",
-    "bayern": "whois.nic.bayern",
-    "bbc": "whois.nic.bbc",
-    "bbt": "whois.nic.bbt",
-    "bcg": "whois.nic.bcg",
-    "bcn": "whois.nic.bcn",
-    "be": "whois.dns.be",
-    "beats": "whois.nic.beats",
-    "beauty": "whois.nic.beauty",
-    "beer": "whois.nic.beer",
-    "bentley": "whois.nic.bentley",
-    "berlin": "whois.nic.berlin",
-    "best": "whois.nic.best",
-    "bestbuy": "whois.nic.bestbuy",
-    "bet": "whois.nic.bet",
-    "bf": "whois.registre.bf",
-    "bg": "whois.register.bg",
-    "bh": "whois.nic.bh",
-    "bi": "whois1.nic.bi",
-    "bible": "whois.nic.bible",
-    "bid": "whois.nic.bid",
-    "bike": "whois.nic.bike",
-    "bingo": "whois.nic.bingo",
-    "bio": "whois.nic.bio",
-    "biz": "whois.nic.biz",
-    "bj": "whois.nic.bj",
-    "black": "whois.nic.black",
-    "blackfriday": "whois.nic.blackfriday",
-    "blockbuster": "whois.nic.blockbuster",
-    "blog": "whois.nic.blog",
-    "bloomberg": "whois.nic.bloomberg",
-    "blue": "whois.nic.blue",
-    "bm": "whois.nic.bm",
-    "bms": "whois.nic.bms",
-    "bmw": "whois.nic.bmw",
-    "bn": "whois.bnnic.bn",
-    "bnpparibas": "whois.nic.bnpparibas",
-    "bo": "whois.nic.bo",
-    "boats": "whois.nic.boats",
-    "boehringer": "whois.nic.boehringer",
-    "bofa": "whois.nic.bofa",
-    "bom": "whois.gtlds.nic.br",
-    "bond": "whois.nic.bond",
-    "boo": "whois.nic.google",
-    "bosch": "whois.nic.bosch",
-    "bostik": "whois.nic.bostik",
-    "boston": "whois.nic.boston",
-    "boutique": "whois.nic.boutique",
-    "box": "whois.nic.box",
-    "br": "whois.registro.br",
-    "bradesco": "whois.nic.bradesco",
-    "bridgestone": "whois.nic.bridgestone",
-    "broadway": "whois.nic.broadway",
-    "broker": "whois.nic.broker",
-    "brother": "whois.nic.brother",
-    "brussels": "whois.nic.brussels",
-    "build": "whois.nic.build",
-    "builders": "whois.nic.builders",
-    "business": "whois.nic.business",
-    "buzz": "whois.nic.buzz",
-    "bw": "whois.nic.net.bw",
-    "by": "whois.cctld.by",
-    "bzh": "whois.nic.bzh",
-    "ca": "whois.cira.ca",
-    "cab": "whois.nic.cab",
-    "cafe": "whois.nic.cafe",
-    "cal": "whois.nic.google",
-    "cam": "whois.nic.cam",
-    "camera": "whois.nic.camera",
-    "camp": "whois.nic.camp",
-    "canon": "whois.nic.canon",
-    "capetown": "whois.nic.capetown",
-    "capital": "whois.nic.capital",
-    "capitalone": "whois.nic.capitalone",
-    "car": "whois.nic.car",
-    "cards": "whois.nic.cards",
-    "care": "whois.nic.care",
-    "careers": "whois.nic.careers",
-    "cars": "whois.nic.cars",
-    "casa": "whois.nic.casa",
-    "case": "whois.nic.case",
-    "cash": "whois.nic.cash",
-    "casino": "whois.nic.casino",
-    "cat": "whois.nic.cat",
-    "catering": "whois.nic.catering",
-    "catholic": "whois.nic.catholic",
-    "cba": "whois.nic.cba",
-    "cc": "ccwhois.verisign-grs.com",
-    "center": "whois.nic.center",
-    "ceo": "whois.nic.ceo",
-    "cern": "whois.nic.cern",
-    "cf": "whois.dot.cf",
-    "cfa": "whois.nic.cfa",
-    "cfd": "whois.nic.cfd",
-    "ch": "whois.nic.ch",
-    "chanel": "whois.nic.chanel",
-    "channel": "whois.nic.google",
-    "charity": "whois.nic.charity",
-    "chat": "whois.nic.chat",
-    "cheap": "whois.nic.cheap",
-    "chintai": "whois.nic.chintai",
-    "christmas": "whois.nic.christmas",
-    "chrome": "whois.nic.google",
-    "church": "whois.nic.church",
-    "ci": "whois.nic.ci",
-    "cipriani": "whois.nic.cipriani",
-    "citadel": "whois.nic.citadel",
-    "city": "whois.nic.city",
-    "cl": "whois.nic.cl",
-    "claims": "whois.nic.claims",
-    "cleaning": "whois.nic.cleaning",
-    "click": "whois.nic.click",
-    "clinic": "whois.nic.clinic",
-    "clinique": "whois.nic.clinique",
-    "clothing": "whois.nic.clothing",
-    "cloud": "whois.nic.cloud",
-    "club": "whois.nic.club",
-    "clubmed": "whois.nic.clubmed",
-    "cn": "whois.cnnic.cn",
-    "co": "whois.nic.co",
-    "coach": "whois.nic.coach",
-    "codes": "whois.nic.codes",
-    "coffee": "whois.nic.coffee",
-    "college": "whois.nic.college",
-    "cologne": "whois.ryce-rsp.com",
-    "com": "whois.verisign-grs.com",
-    "commbank": "whois.nic.commbank",
-    "community": "whois.nic.community",
-    "company": "whois.nic.company",
-    "compare": "whois.nic.compare",
-    "computer": "whois.nic.computer",
-    "comsec": "whois.nic.comsec",
-    "condos": "whois.nic.condos",
-    "construction": "whois.nic.construction",
-    "consulting": "whois.nic.consulting",
-    "contact": "whois.nic.contact",
-    "contractors": "whois.nic.contractors",
-    "cooking": "whois.nic.cooking",
-    "cool": "whois.nic.cool",
-    "coop": "whois.nic.coop",
-    "corsica": "whois.nic.corsica",
-    "country": "whois.nic.country",
-    "coupons": "whois.nic.coupons",
-    "courses": "whois.nic.courses",
-    "cpa": "whois.nic.cpa",
-    "cr": "whois.nic.cr",
-    "credit": "whois.nic.credit",
-    "creditcard": "whois.nic.creditcard",
-    "creditunion": "whois.nic.creditunion",
-    "cricket": "whois.nic.cricket",
-    "crown": "whois.nic.crown",
-    "crs": "whois.nic.crs",
-    "cruise": "whois.nic.cruise",
-    "cruises": "whois.nic.cruises",
-    "cuisinella": "whois.nic.cuisinella",
-    "cv": "whois.nic.cv",
-    "cx": "whois.nic.cx",
-    "cymru": "whois.nic.cymru",
-    "cyou": "whois.nic.cyou",
-    "cz": "whois.nic.cz",
-    "dad": "whois.nic.google",
-    "dance": "whois.nic.dance",
-    "data": "whois.nic.data",
-    "date": "whois.nic.date",
-    "dating": "whois.nic.dating",
-    "datsun": "whois.nic.gmo",
-    "day": "whois.nic.google",
-    "dclk": "whois.nic.google",
-    "dds": "whois.nic.dds",
-    "de": "whois.denic.de",
-    "dealer": "whois.nic.dealer",
-    "deals": "whois.nic.deals",
-    "degree": "whois.nic.degree",
-    "delivery": "whois.nic.delivery",
-    "deloitte": "whois.nic.deloitte",
-    "delta": "whois.nic.delta",
-    "democrat": "whois.nic.democrat",
-    "dental": "whois.nic.dental",
-    "dentist": "whois.nic.dentist",
-    "design": "whois.nic.design",
-    "dev": "whois.nic.google",
-    "diamonds": "whois.nic.diamonds",
-    "diet": "whois.nic.diet",
-    "digital": "whois.nic.digital",
-    "direct": "whois.nic.direct",
-    "directory": "whois.nic.directory",
-    "discount": "whois.nic.discount",
-    "dish": "whois.nic.dish",
-    "diy": "whois.nic.diy",
-    "dk": "whois.punktum.dk",
-    "dm": "whois.dmdomains.dm",
-    "dnp": "whois.nic.dnp",
-    "do": "whois.nic.do",
-    "docs": "whois.nic.google",
-    "doctor": "whois.nic.doctor",
-    "dog": "whois.nic.dog",
-    "domains": "whois.nic.domains",
-    "dot": "whois.nic.dot",
-    "download": "whois.nic.download",
-    "drive": "whois.nic.google",
-    "dtv": "whois.nic.dtv",
-    "dubai": "whois.nic.dubai",
-    "dunlop": "whois.nic.dunlop",
-    "durban": "whois.nic.durban",
-    "dvag": "whois.nic.dvag",
-    "dvr": "whois.nic.dvr",
-    "dz": "whois.nic.dz",
-    "earth": "whois.nic.earth",
-    "eat": "whois.nic.google",
-    "ec": "whois.nic.ec",
-    "eco": "whois.nic.eco",
-    "edeka": "whois.nic.edeka",
-    "edu": "whois.educause.edu",
-    "education": "whois.nic.education",
-    "ee": "whois.tld.ee",
-    "email": "whois.nic.email",
-    "emerck": "whois.nic.emerck",
-    "energy": "whois.nic.energy",
-    "engineer": "whois.nic.engineer",
-    "engineering": "whois.nic.engineering",
-    "enterprises": "whois.nic.enterprises",
-    "epson": "whois.nic.epson",
-    "equipment": "whois.nic.equipment",
-    "ericsson": "whois.nic.ericsson",
-    "erni": "whois.nic.erni",
-    "es": "whois.nic.es",
-    "esq": "whois.nic.google",
-    "estate": "whois.nic.estate",
-    "eu": "whois.eu",
-    "eurovision": "whois.nic.eurovision",
-    "eus": "whois.nic.eus",
-    "events": "whois.nic.events",
-    "exchange": "whois.nic.exchange",
-    "expert": "whois.nic.expert",
-    "exposed": "whois.nic.exposed",
-    "express": "whois.nic.express",
-    "extraspace": "whois.nic.extraspace",
-    "fage": "whois.nic.fage",
-    "fail": "whois.nic.fail",
-    "fairwinds": "whois.nic.fairwinds",
-    "faith": "whois.nic.faith",
-    "family": "whois.nic.family",
-    "fan": "whois.nic.fan",
-    "fans": "whois.nic.fans",
-    "farm": "whois.nic.farm",
-    "fashion": "whois.nic.fashion",
-    "fedex": "whois.nic.fedex",
-    "feedback": "whois.nic.feedback",
-    "ferrari": "whois.nic.ferrari",
-    "fi": "whois.fi",
-    "fidelity": "whois.nic.fidelity",
-    "fido": "whois.nic.fido",
-    "film": "whois.nic.film",
-    "final": "whois.gtlds.nic.br",
-    "finance": "whois.nic.finance",
-    "financial": "whois.nic.financial",
-    "firestone": "whois.nic.firestone",
-    "firmdale": "whois.nic.firmdale",
-    "fish": "whois.nic.fish",
-    "fishing": "whois.nic.fishing",
-    "fit": "whois.nic.fit",
-    "fitness": "whois.nic.fitness",
-    "fj": "www.whois.fj",
-    "flights": "whois.nic.flights",
-    "florist": "whois.nic.florist",
-    "flowers": "whois.nic.flowers",
-    "fly": "whois.nic.google",
-    "fm": "whois.nic.fm",
-    "fo": "whois.nic.fo",
-    "foo": "whois.nic.google",
-    "food": "whois.nic.food",
-    "football": "whois.nic.football",
-    "forex": "whois.nic.forex",
-    "forsale": "whois.nic.forsale",
-    "forum": "whois.nic.forum",
-    "foundation": "whois.nic.foundation",
-    "fox": "whois.nic.fox",
-    "fr": "whois.nic.fr",
-    "fresenius": "whois.nic.fresenius",
-    "frl": "whois.nic.frl",
-    "frogans": "whois.nic.frogans",
-    "fujitsu": "whois.nic.gmo",
-    "fun": "whois.nic.fun",
-    "fund": "whois.nic.fund",
-    "furniture": "whois.nic.furniture",
-    "futbol": "whois.nic.futbol",
-    "fyi": "whois.nic.fyi",
-    "gal": "whois.nic.gal",
-    "gallery": "whois.nic.gallery",
-    "gallo": "whois.nic.gallo",
-    "gallup": "whois.nic.gallup",
-    "game": "whois.nic.game",
-    "games": "whois.nic.games",
-    "garden": "whois.nic.garden",
-    "gay": "whois.nic.gay",
-    "gbiz": "whois.nic.google",
-    "gd": "whois.nic.gd",
-    "gdn": "whois.nic.gdn",
-    "ge": "whois.nic.ge",
-    "gea": "whois.nic.gea",
-    "gent": "whois.nic.gent",
-    "genting": "whois.nic.genting",
-    "george": "whois.nic.george",
-    "gf": "whois.mediaserv.net",
-    "gg": "whois.gg",
-    "ggee": "whois.nic.ggee",
-    "gh": "whois.nic.gh",
-    "gi": "whois.identitydigital.services",
-    "gift": "whois.uniregistry.net",
-    "gifts": "whois.nic.gifts",
-    "gives": "whois.nic.gives",
-    "giving": "whois.nic.giving",
-    "gl": "whois.nic.gl",
-    "glass": "whois.nic.glass",
-    "gle": "whois.nic.google",
-    "global": "whois.nic.global",
-    "globo": "whois.gtlds.nic.br",
-    "gmail": "whois.nic.google",
-    "gmbh": "whois.nic.gmbh",
-    "gmo": "whois.nic.gmo",
-    "gmx": "whois.nic.gmx",
-    "gn": "whois.ande.gov.gn",
-    "godaddy": "whois.nic.godaddy",
-    "gold": "whois.nic.gold",
-    "goldpoint": "whois.nic.goldpoint",
-    "golf": "whois.nic.golf",
-    "goo": "whois.nic.gmo",
-    "goodyear": "whois.nic.goodyear",
-    "goog": "whois.nic.google",
-    "google": "whois.nic.google",
-    "gop": "whois.nic.gop",
-    "gov": "whois.dotgov.gov",
-    "gp": "whois.nic.gp",
-    "gq": "whois.dominio.gq",
-    "graphics": "whois.nic.graphics",
-    "gratis": "whois.nic.gratis",
-    "green": "whois.nic.green",
-    "gripe": "whois.nic.gripe",
-    "grocery": "whois.nic.grocery",
-    "group": "whois.nic.group",
-    "gs": "whois.nic.gs",
-    "guge": "whois.nic.google",
-    "guide": "whois.nic.guide",
-    "guitars": "whois.nic.guitars",
-    "guru": "whois.nic.guru",
-    "gy": "whois.registry.gy",
-    "hair": "whois.nic.hair",
-    "hamburg": "whois.nic.hamburg",
-    "hangout": "whois.nic.google",
-    "haus": "whois.nic.haus",
-    "hdfc": "whois.nic.hdfc",
-    "hdfcbank": "whois.nic.hdfcbank",
-    "healthcare": "whois.nic.healthcare",
-    "help": "whois.nic.help",
-    "helsinki": "whois.nic.helsinki",
-    "here": "whois.nic.google",
-    "hermes": "whois.nic.hermes",
-    "hiphop": "whois.nic.hiphop",
-    "hisamitsu": "whois.nic.gmo",
-    "hitachi": "whois.nic.gmo",
-    "hiv": "whois.nic.hiv",
-    "hk": "whois.hkirc.hk",
-    "hkt": "whois.nic.hkt",
-    "hm": "whois.registry.hm",
-    "hn": "whois.nic.hn",
-    "hockey": "whois.nic.hockey",
-    "holdings": "whois.nic.holdings",
-    "holiday": "whois.nic.holiday",
-    "homedepot": "whois.nic.homedepot",
-    "homes": "whois.nic.homes",
-    "honda": "whois.nic.honda",
-    "horse": "whois.nic.horse",
-    "hospital": "whois.nic.hospital",
-    "host": "whois.nic.host",
-    "hosting": "whois.nic.hosting",
-    "hotels": "whois.nic.hotels",
-    "house": "whois.nic.house",
-    "how": "whois.nic.google",
-    "hr": "whois.dns.hr",
-    "ht": "whois.nic.ht",
-    "hu": "whois.nic.hu",
-    "hughes": "whois.nic.hughes",
-    "hyundai": "whois.nic.hyundai",
-    "ibm": "whois.nic.ibm",
-    "icbc": "whois.nic.icbc",
-    "ice": "whois.nic.ice",
-    "icu": "whois.nic.icu",
-    "id": "whois.id",
-    "ie": "whois.weare.ie",
-    "ifm": "whois.nic.ifm",
-    "ikano": "whois.nic.ikano",
-    "il": "whois.isoc.org.il",
-    "im": "whois.nic.im",
-    "imamat": "whois.nic.imamat",
-    "immo": "whois.nic.immo",
-    "immobilien": "whois.nic.immobilien",
-    "in": "whois.registry.in",
-    "inc": "whois.nic.inc",
-    "industries": "whois.nic.industries",
-    "infiniti": "whois.nic.gmo",
-    "info": "whois.nic.info",
-    "ing": "whois.nic.google",
-    "ink": "whois.nic.ink",
-    "institute": "whois.nic.institute",
-    "insurance": "whois.nic.insurance",
-    "insure": "whois.nic.insure",
-    "int": "whois.iana.org",
-    "international": "whois.nic.international",
-    "investments": "whois.nic.investments",
-    "io": "whois.nic.io",
-    "iq": "whois.cmc.iq",
-    "ir": "whois.nic.ir",
-    "irish": "whois.nic.irish",
-    "is": "whois.isnic.is",
-    "ismaili": "whois.nic.ismaili",
-    "ist": "whois.nic.ist",
-    "istanbul": "whois.nic.istanbul",
-    "it": "whois.nic.it",
-    "itv": "whois.nic.itv",
-    "jaguar": "whois.nic.jaguar",
-    "java": "whois.nic.java",
-    "jcb": "whois.nic.gmo",
-    "je": "whois.je",
-    "jeep": "whois.nic.jeep",
-    "jetzt": "whois.nic.jetzt",
-    "jewelry": "whois.nic.jewelry",
-    "jio": "whois.nic.jio",
-    "jll": "whois.nic.jll",
-    "joburg": "whois.nic.joburg",
-    "jp": "whois.jprs.jp",
-    "jprs": "whois.nic.jprs",
-    "juegos": "whois.uniregistry.net",
-    "juniper": "whois.nic.juniper",
-    "kaufen": "whois.nic.kaufen",
-    "kddi": "whois.nic.kddi",
-    "ke": "whois.kenic.or.ke",
-    "kerryhotels": "whois.nic.kerryhotels",
-    "kerrylogistics": "whois.nic.kerrylogistics",
-    "kerryproperties": "whois.nic.kerryproperties",
-    "kfh": "whois.nic.kfh",
-    "kg": "whois.kg",
-    "ki": "whois.nic.ki",
-    "kia": "whois.nic.kia",
-    "kids": "whois.nic.kids",
-    "kim": "whois.nic.kim",
-    "kitchen": "whois.nic.kitchen",
-    "kiwi": "whois.nic.kiwi",
-    "kn": "whois.nic.kn",
-    "koeln": "whois.ryce-rsp.com",
-    "komatsu": "whois.nic.komatsu",
-    "kosher": "whois.nic.kosher",
-    "kr": "whois.kr",
-    "krd": "whois.nic.krd",
-    "kuokgroup": "whois.nic.kuokgroup",
-    "ky": "whois.kyregistry.ky",
-    "kyoto": "whois.nic.kyoto",
-    "kz": "whois.nic.kz",
-    "la": "whois.nic.la",
-    "lacaixa": "whois.nic.lacaixa",
-    "lamborghini": "whois.nic.lamborghini",
-    "lamer": "whois.nic.lamer",
-    "lancaster": "whois.nic.lancaster",
-    "land": "whois.nic.land",
-    "landrover": "whois.nic.landrover",
-    "lasalle": "whois.nic.lasalle",
-    "lat": "whois.nic.lat",
-    "latino": "whois.nic.latino",
-    "latrobe": "whois.nic.latrobe",
-    "law": "whois.nic.law",
-    "lawyer": "whois.nic.lawyer",
-    "lb": "whois.lbdr.org.lb",
-    "lds": "whois.nic.lds",
-    "lease": "whois.nic.lease",
-    "leclerc": "whois.nic.leclerc",
-    "lefrak": "whois.nic.lefrak",
-    "legal": "whois.nic.legal",
-    "lego": "whois.nic.lego",
-    "lexus": "whois.nic.lexus",
-    "lgbt": "whois.nic.lgbt",
-    "li": "whois.nic.li",
-    "lidl": "whois.nic.lidl",
-    "life": "whois.nic.life",
-    "lifeinsurance": "whois.nic.lifeinsurance",
-    "lifestyle": "whois.nic.lifestyle",
-    "lighting": "whois.nic.lighting",
-    "limited": "whois.nic.limited",
-    "limo": "whois.nic.limo",
-    "link": "whois.uniregistry.net",
-    "lipsy": "whois.nic.lipsy",
-    "live": "whois.nic.live",
-    "living": "whois.nic.living",
-    "llc": "whois.nic.llc",
-    "llp": "whois.nic.llp",
-    "loan": "whois.nic.loan",
-    "loans": "whois.nic.loans",
-    "locker": "whois.nic.locker",
-    "lol": "whois.nic.lol",
-    "london": "whois.nic.london",
-    "lotte": "whois.nic.lotte",
-    "lotto": "whois.nic.lotto",
-    "love": "whois.nic.love",
-    "lpl": "whois.nic.lpl",
-    "lplfinancial": "whois.nic.lplfinancial",
-    "ls": "whois.nic.ls",
-    "lt": "whois.domreg.lt",
-    "ltd": "whois.nic.ltd",
-    "ltda": "whois.nic.ltda",
-    "lu": "whois.dns.lu",
-    "lundbeck": "whois.nic.lundbeck",
-    "luxe": "whois.nic.luxe",
-    "luxury": "whois.nic.luxury",
-    "lv": "whois.nic.lv",
-    "ly": "whois.nic.ly",
-    "ma": "whois.registre.ma",
-    "madrid": "whois.nic.madrid",
-    "maif": "whois.nic.maif",
-    "maison": "whois.nic.maison",
-    "makeup": "whois.nic.makeup",
-    "man": "whois.nic.man",
-    "management": "whois.nic.management",
-    "mango": "whois.nic.mango",
-    "map": "whois.nic.google",
-    "market": "whois.nic.market",
-    "marketing": "whois.nic.marketing",
-    "markets": "whois.nic.markets",
-    "marriott": "whois.nic.marriott",
-    "mba": "whois.nic.mba",
-    "mckinsey": "whois.nic.mckinsey",
-    "md": "whois.nic.md",
-    "me": "whois.nic.me",
-    "media": "whois.nic.media",
-    "meet": "whois.nic.google",
-    "melbourne": "whois.nic.melbourne",
-    "meme": "whois.nic.google",
-    "memorial": "whois.nic.memorial",
-    "men": "whois.nic.men",
-    "menu": "whois.nic.menu",
-    "merckmsd": "whois.nic.merckmsd",
-    "mg": "whois.nic.mg",
-    "miami": "whois.nic.miami",
-    "mini": "whois.nic.mini",
-    "mit": "whois.nic.mit",
-    "mitsubishi": "whois.nic.gmo",
-    "mk": "whois.marnet.mk",
-    "ml": "whois.nic.ml",
-    "mls": "whois.nic.mls",
-    "mm": "whois.registry.gov.mm",
-    "mma": "whois.nic.mma",
-    "mn": "whois.nic.mn",
-    "mo": "whois.monic.mo",
-    "mobi": "whois.nic.mobi",
-    "mobile": "whois.nic.mobile",
-    "moda": "whois.nic.moda",
-    "moe": "whois.nic.moe",
-    "mom": "whois.nic.mom",
-    "monash": "whois.nic.monash",
-    "money": "whois.nic.money",
-    "monster": "whois.nic.monster",
-    "mormon": "whois.nic.mormon",
-    "mortgage": "whois.nic.mortgage",
-    "moscow": "whois.nic.moscow",
-    "moto": "whois.nic.moto",
-    "motorcycles": "whois.nic.motorcycles",
-    "mov": "whois.nic.google",
-    "movie": "whois.nic.movie",
-    "mq": "whois.mediaserv.net",
-    "mr": "whois.nic.mr",
-    "ms": "whois.nic.ms",
-    "msd": "whois.nic.msd",
-    "mtr": "whois.nic.mtr",
-    "mu": "whois.nic.mu",
-    "museum": "whois.nic.museum",
-    "music": "whois.nic.music",
-    "mw": "whois.nic.mw",
-    "mx": "whois.mx",
-    "my": "whois.mynic.my",
-    "mz": "whois.nic.mz",
-    "nab": "whois.nic.nab",
-    "nagoya": "whois.nic.nagoya",
-    "name": "whois.nic.name",
-    "navy": "whois.nic.navy",
-    "nc": "whois.nc",
-    "nec": "whois.nic.nec",
-    "net": "whois.verisign-grs.com",
-    "netbank": "whois.nic.netbank",
-    "network": "whois.nic.network",
-    "new": "whois.nic.google",
-    "news": "whois.nic.news",
-    "next": "whois.nic.next",
-    "nextdirect": "whois.nic.nextdirect",
-    "nexus": "whois.nic.google",
-    "nf": "whois.nic.nf",
-    "ng": "whois.nic.net.ng",
-    "ngo": "whois.nic.ngo",
-    "nhk": "whois.nic.nhk",
-    "nico": "whois.nic.nico",
-    "nikon": "whois.nic.nikon",
-    "ninja": "whois.nic.ninja",
-    "nissan": "whois.nic.gmo",
-    "nissay": "whois.nic.nissay",
-    "nl": "whois.domain-registry.nl",
-    "no": "whois.norid.no",
-    "nokia": "whois.nic.nokia",
-    "norton": "whois.nic.norton",
-    "nowtv": "whois.nic.nowtv",
-    "nra": "whois.nic.nra",
-    "nrw": "whois.nic.nrw",
-    "ntt": "whois.nic.ntt",
-    "nu": "whois.iis.nu",
-    "nyc": "whois.nic.nyc",
-    "nz": "whois.irs.net.nz",
-    "obi": "whois.nic.obi",
-    "observer": "whois.nic.observer",
-    "okinawa": "whois.nic.okinawa",
-    "olayan": "whois.nic.olayan",
-    "olayangroup": "whois.nic.olayangroup",
-    "ollo": "whois.nic.ollo",
-    "om": "whois.registry.om",
-    "one": "whois.nic.one",
-    "ong": "whois.nic.ong",
-    "onl": "whois.nic.onl",
-    "online": "whois.nic.online",
-    "ooo": "whois.nic.ooo",
-    "open": "whois.nic.open",
-    "oracle": "whois.nic.oracle",
-    "orange": "whois.nic.orange",
-    "org": "whois.publicinterestregistry.org",
-    "organic": "whois.nic.organic",
-    "origins": "whois.nic.origins",
-    "osaka": "whois.nic.osaka",
-    "otsuka": "whois.nic.otsuka",
-    "ott": "whois.nic.ott",
-    "ovh": "whois.nic.ovh",
-    "page": "whois.nic.google",
-    "panasonic": "whois.nic.gmo",
-    "paris": "whois.nic.paris",
-    "partners": "whois.nic.partners",
-    "parts": "whois.nic.parts",
-    "party": "whois.nic.party",
-    "pccw": "whois.nic.pccw",
-    "pe": "kero.yachay.pe",
-    "pet": "whois.nic.pet",
-    "pf": "whois.registry.pf",
-    "pharmacy": "whois.nic.pharmacy",
-    "phd": "whois.nic.google",
-    "philips": "whois.nic.philips",
-    "phone": "whois.nic.phone",
-    "photo": "whois.nic.photo",
-    "photography": "whois.nic.photography",
-    "photos": "whois.nic.photos",
-    "physio": "whois.nic.physio",
-    "pics": "whois.nic.pics",
-    "pictet": "whois.nic.pictet",
-    "pictures": "whois.nic.pictures",
-    "pid": "whois.nic.pid",
-    "ping": "whois.nic.ping",
-    "pink": "whois.nic.pink",
-    "pizza": "whois.nic.pizza",
-    "pk": "whois.pknic.net.pk",
-    "pl": "whois.dns.pl",
-    "place": "whois.nic.place",
-    "play": "whois.nic.google",
-    "playstation": "whois.nic.playstation",
-    "plumbing": "whois.nic.plumbing",
-    "plus": "whois.nic.plus",
-    "pm": "whois.nic.pm",
-    "pnc": "whois.nic.pnc",
-    "pohl": "whois.nic.pohl",
-    "poker": "whois.nic.poker",
-    "politie": "whois.nic.politie",
-    "porn": "whois.nic.porn",
-    "post": "whois.dotpostregistry.net",
-    "pr": "whois.afilias-srs.net",
-    "press": "whois.nic.press",
-    "pro": "whois.nic.pro",
-    "prod": "whois.nic.google",
-    "productions": "whois.nic.productions",
-    "prof": "whois.nic.google",
-    "progressive": "whois.nic.progressive",
-    "promo": "whois.nic.promo",
-    "properties": "whois.nic.properties",
-    "property": "whois.nic.property",
-    "protection": "whois.nic.protection",
-    "pt": "whois.dns.pt",
-    "pub": "whois.nic.pub",
-    "pw": "whois.nic.pw",
-    "pwc": "whois.nic.pwc",
-    "qa": "whois.registry.qa",
-    "qpon": "whois.nic.qpon",
-    "quebec": "whois.nic.quebec",
-    "quest": "whois.nic.quest",
-    "racing": "whois.nic.racing",
-    "radio": "whois.nic.radio",
-    "re": "whois.nic.re",
-    "realty": "whois.nic.realty",
-    "recipes": "whois.nic.recipes",
-    "red": "whois.nic.red",
-    "redstone": "whois.nic.redstone",
-    "redumbrella": "whois.nic.redumbrella",
-    "rehab": "whois.nic.rehab",
-    "reise": "whois.nic.reise",
-    "reisen": "whois.nic.reisen",
-    "reit": "whois.nic.reit",
-    "reliance": "whois.nic.reliance",
-    "ren": "whois.nic.ren",
-    "rent": "whois.nic.rent",
-    "rentals": "whois.nic.rentals",
-    "repair": "whois.nic.repair",
-    "report": "whois.nic.report",
-    "republican": "whois.nic.republican",
-    "rest": "whois.nic.rest",
-    "restaurant": "whois.nic.restaurant",
-    "review": "whois.nic.review",
-    "reviews": "whois.nic.reviews",
-    "rexroth": "whois.nic.rexroth",
-    "rich": "whois.nic.rich",
-    "richardli": "whois.nic.richardli",
-    "ricoh": "whois.nic.ricoh",
-    "ril": "whois.nic.ril",
-    "rio": "whois.gtlds.nic.br",
-    "rip": "whois.nic.rip",
-    "ro": "whois.rotld.ro",
-    "rocks": "whois.nic.rocks",
-    "rodeo": "whois.nic.rodeo",
-    "rogers": "whois.nic.rogers",
-    "rs": "whois.rnids.rs",
-    "rsvp": "whois.nic.google",
-    "ru": "whois.tcinet.ru",
-    "rugby": "whois.nic.rugby",
-    "ruhr": "whois.nic.ruhr",
-    "run": "whois.nic.run",
-    "rw": "whois.ricta.org.rw",
-    "rwe": "whois.nic.rwe",
-    "ryukyu": "whois.nic.ryukyu",
-    "sa": "whois.nic.net.sa",
-    "saarland": "whois.nic.saarland",
-    "safety": "whois.nic.safety",
-    "sakura": "whois.nic.sakura",
-    "sale": "whois.nic.sale",
-    "salon": "whois.nic.salon",
-    "samsclub": "whois.nic.samsclub",
-    "samsung": "whois.nic.samsung",
-    "sandvik": "whois.nic.sandvik",
-    "sandvikcoromant": "whois.nic.sandvikcoromant",
-    "sanofi": "whois.nic.sanofi",
-    "sap": "whois.nic.sap",
-    "sarl": "whois.nic.sarl",
-    "saxo": "whois.nic.saxo",
-    "sb": "whois.nic.net.sb",
-    "sbi": "whois.nic.sbi",
-    "sbs": "whois.nic.sbs",
-    "sc": "whois.nic.sc",
-    "scb": "whois.nic.scb",
-    "schaeffler": "whois.afilias-srs.net",
-    "schmidt": "whois.nic.schmidt",
-    "scholarships": "whois.nic.scholarships",
-    "school": "whois.nic.school",
-    "schule": "whois.nic.schule",
-    "schwarz": "whois.nic.schwarz",
-    "science": "whois.nic.science",
-    "scot": "whois.nic.scot",
-    "sd": "whois.nic.sd",
-    "se": "whois.iis.se",
-    "search": "whois.nic.google",
-    "seat": "whois.nic.seat",
-    "security": "whois.nic.security",
-    "seek": "whois.nic.seek",
-    "select": "whois.nic.select",
-    "sener": "whois.nic.rwe",
-    "services": "whois.nic.services",
-    "seven": "whois.nic.seven",
-    "sew": "whois.nic.sew",
-    "sex": "whois.nic.sex",
-    "sexy": "whois.nic.sexy",
-    "sfr": "whois.nic.sfr",
-    "sg": "whois.sgnic.sg",
-    "sh": "whois.nic.sh",
-    "shangrila": "whois.nic.shangrila",
-    "sharp": "whois.nic.gmo",
-    "shiksha": "whois.nic.shiksha",
-    "shoes": "whois.nic.shoes",
-    "shop": "whois.nic.shop",
-    "shopping": "whois.nic.shopping",
-    "shouji": "whois.teleinfo.cn",
-    "show": "whois.nic.show",
-    "si": "whois.register.si",
-    "sina": "whois.nic.sina",
-    "singles": "whois.nic.singles",
-    "site": "whois.nic.site",
-    "sk": "whois.sk-nic.sk",
-    "ski": "whois.nic.ski",
-    "skin": "whois.nic.skin",
-    "sky": "whois.nic.sky",
-    "sling": "whois.nic.sling",
-    "sm": "whois.nic.sm",
-    "smart": "whois.nic.smart",
-    "sn": "whois.nic.sn",
-    "sncf": "whois.nic.sncf",
-    "so": "whois.nic.so",
-    "soccer": "whois.nic.soccer",
-    "social": "whois.nic.social",
-    "softbank": "whois.nic.softbank",
-    "software": "whois.nic.software",
-    "solar": "whois.nic.solar",
-    "solutions": "whois.nic.solutions",
-    "sony": "whois.nic.sony",
-    "soy": "whois.nic.google",
-    "spa": "whois.nic.spa",
-    "space": "whois.nic.space",
-    "sport": "whois.nic.sport",
-    "srl": "whois.nic.srl",
-    "ss": "whois.nic.ss",
-    "st": "whois.nic.st",
-    "stada": "whois.nic.stada",
-    "star": "whois.nic.star",
-    "statebank": "whois.nic.statebank",
-    "stc": "whois.nic.stc",
-    "stcgroup": "whois.nic.stcgroup",
-    "stockholm": "whois.nic.stockholm",
-    "storage": "whois.nic.storage",
-    "store": "whois.nic.store",
-    "stream": "whois.nic.stream",
-    "studio": "whois.nic.studio",
-    "study": "whois.nic.study",
-    "style": "whois.nic.style",
-    "su": "whois.tcinet.ru",
-    "sucks": "whois.nic.sucks",
-    "supplies": "whois.nic.supplies",
-    "supply": "whois.nic.supply",
-    "support": "whois.nic.support",
-    "surf": "whois.nic.surf",
-    "surgery": "whois.nic.surgery",
-    "suzuki": "whois.nic.suzuki",
-    "swiss": "whois.nic.swiss",
-    "sx": "whois.sx",
-    "sy": "whois.tld.sy",
-    "sydney": "whois.nic.sydney",
-    "systems": "whois.nic.systems",
-    "tab": "whois.nic.tab",
-    "taipei": "whois.nic.taipei",
-    "taobao": "whois.nic.taobao",
-    "tatamotors": "whois.nic.tatamotors",
-    "tatar": "whois.nic.tatar",
-    "tattoo": "whois.nic.tattoo",
-    "tax": "whois.nic.tax",
-    "taxi": "whois.nic.taxi",
-    "tc": "whois.nic.tc",
-    "td": "whois.nic.td",
-    "tdk": "whois.nic.tdk",
-    "team": "whois.nic.team",
-    "tech": "whois.nic.tech",
-    "technology": "whois.nic.technology",
-    "tel": "whois.nic.tel",
-    "temasek": "whois.nic.temasek",
-    "tennis": "whois.nic.tennis",
-    "teva": "whois.nic.teva",
-    "tf": "whois.nic.tf",
-    "tg": "whois.nic.tg",
-    "th": "whois.thnic.co.th",
-    "thd": "whois.nic.thd",
-    "theater": "whois.nic.theater",
-    "theatre": "whois.nic.theatre",
-    "tiaa": "whois.nic.tiaa",
-    "tickets": "whois.nic.tickets",
-    "tienda": "whois.nic.tienda",
-    "tips": "whois.nic.tips",
-    "tires": "whois.nic.tires",
-    "tirol": "whois.nic.tirol",
-    "tk": "whois.dot.tk",
-    "tl": "whois.nic.tl",
-    "tm": "whois.nic.tm",
-    "tmall": "whois.nic.tmall",
-    "tn": "whois.ati.tn",
-    "to": "whois.tonic.to",
-    "today": "whois.nic.today",
-    "tokyo": "whois.nic.tokyo",
-    "tools": "whois.nic.tools",
-    "top": "whois.nic.top",
-    "toray": "whois.nic.toray",
-    "toshiba": "whois.nic.toshiba",
-    "total": "whois.nic.total",
-    "tours": "whois.nic.tours",
-    "town": "whois.nic.town",
-    "toyota": "whois.nic.toyota",
-    "toys": "whois.nic.toys",
-    "tr": "whois.trabis.gov.tr",
-    "trade": "whois.nic.trade",
-    "trading": "whois.nic.trading",
-    "training": "whois.nic.training",
-    "travel": "whois.nic.travel",
-    "travelers": "whois.nic.travelers",
-    "travelersinsurance": "whois.nic.travelersinsurance",
-    "trust": "whois.nic.trust",
-    "trv": "whois.nic.trv",
-    "tube": "whois.nic.tube",
-    "tui": "whois.nic.tui",
-    "tv": "whois.nic.tv",
-    "tvs": "whois.nic.tvs",
-    "tw": "whois.twnic.net.tw",
-    "tz": "whois.tznic.or.tz",
-    "ua": "whois.ua",
-    "ubank": "whois.nic.ubank",
-    "ubs": "whois.nic.ubs",
-    "ug": "whois.co.ug",
-    "uk": "whois.nic.uk",
-    "unicom": "whois.nic.unicom",
-    "university": "whois.nic.university",
-    "uno": "whois.nic.uno",
-    "uol": "whois.gtlds.nic.br",
-    "ups": "whois.nic.ups",
-    "us": "whois.nic.us",
-    "uy": "whois.nic.org.uy",
-    "uz": "whois.cctld.uz",
-    "vacations": "whois.nic.vacations",
-    "vana": "whois.nic.vana",
-    "vanguard": "whois.nic.vanguard",
-    "vc": "whois.identitydigital.services",
-    "ve": "whois.nic.ve",
-    "vegas": "whois.nic.vegas",
-    "ventures": "whois.nic.ventures",
-    "verisign": "whois.nic.verisign",
-    "versicherung": "whois.nic.versicherung",
-    "vet": "whois.nic.vet",
-    "vg": "whois.nic.vg",
-    "vi": "virgil.nic.vi",
-    "viajes": "whois.nic.viajes",
-    "video": "whois.nic.video",
-    "vig": "whois.nic.vig",
-    "viking": "whois.nic.viking",
-    "villas": "whois.nic.villas",
-    "vin": "whois.nic.vin",
-    "vip": "whois.nic.vip",
-    "visa": "whois.nic.visa",
-    "vision": "whois.nic.vision",
-    "viva": "whois.nic.viva",
-    "vlaanderen": "whois.nic.vlaanderen",
-    "vodka": "whois.nic.vodka",
-    "volvo": "whois.nic.volvo",
-    "vote": "whois.nic.vote",
-    "voting": "whois.nic.voting",
-    "voto": "whois.nic.voto",
-    "voyage": "whois.nic.voyage",
-    "vu": "whois.dnrs.vu",
-    "wales": "whois.nic.wales",
-    "walmart": "whois.nic.walmart",
-    "walter": "whois.nic.walter",
-    "wang": "whois.gtld.knet.cn",
-    "watch": "whois.nic.watch",
-    "watches": "whois.nic.watches",
-    "webcam": "whois.nic.webcam",
-    "weber": "whois.nic.weber",
-    "website": "whois.nic.website",
-    "wedding": "whois.nic.wedding",
-    "weibo": "whois.nic.weibo",
-    "weir": "whois.nic.weir",
-    "wf": "whois.nic.wf",
-    "whoswho": "whois.nic.whoswho",
-    "wien": "whois.nic.wien",
-    "wiki": "whois.nic.wiki",
-    "win": "whois.nic.win",
-    "wine": "whois.nic.wine",
-    "wme": "whois.nic.wme",
-    "wolterskluwer": "whois.nic.wolterskluwer",
-    "woodside": "whois.nic.woodside",
-    "work": "whois.nic.work",
-    "works": "whois.nic.works",
-    "world": "whois.nic.world",
-    "ws": "whois.website.ws",
-    "wtc": "whois.nic.wtc",
-    "wtf": "whois.nic.wtf",
-    "xerox": "whois.nic.xerox",
-    "xihuan": "whois.teleinfo.cn",
-    "xin": "whois.nic.xin",
-    "कॉम": "whois.nic.xn--11b4c3d",
-    "佛山": "whois.ngtld.cn",
-    "ಭಾರತ": "whois.registry.in",
-    "慈善": "whois.gtld.knet.cn",
-    "集团": "whois.gtld.knet.cn",
-    "在线": "whois.teleinfo.cn",
-    "한국": "whois.kr",
-    "ଭାରତ": "whois.registry.in",
-    "点看": "whois.nic.xn--3pxu8k",
-    "คอม": "whois.nic.xn--42c2d9a",
-    "ভাৰত": "whois.registry.in",
-    "ভারত": "whois.registry.in",
-    "八卦": "whois.gtld.knet.cn",
-    "ישראל": "whois.isoc.org.il",
-    "موقع": "whois.nic.xn--4gbrim",
-    "公益": "whois.conac.cn",
-    "公司": "whois.ngtld.cn",
-    "香格里拉": "whois.nic.xn--5su34j936bgsg",
-    "网站": "whois.nic.xn--5tzm5g",
-    "移动": "whois.nic.xn--6frz82g",
-    "我爱你": "whois.gtld.knet.cn",
-    "москва": "whois.nic.xn--80adxhks",
-    "қаз": "whois.nic.kz",
-    "католик": "whois.nic.xn--80aqecdr1a",
-    "онлайн": "whois.nic.xn--80asehdb",
-    "сайт": "whois.nic.xn--80aswg",
-    "联通": "whois.nic.xn--8y0a063a",
-    "срб": "whois.rnids.rs",
-    "бг": "whois.imena.bg",
-    "бел": "whois.cctld.by",
-    "קום": "whois.nic.xn--9dbq2a",
-    "时尚": "whois.gtld.knet.cn",
-    "微博": "whois.nic.xn--9krt00a",
-    "淡马锡": "whois.nic.xn--b4w605ferd",
-    "орг": "whois.nic.xn--c1avg",
-    "नेट": "whois.nic.xn--c2br7g",
-    "삼성": "whois.kr",
-    "சிங்கப்பூர்": "whois.ta.sgnic.sg",
-    "商店": "whois.nic.xn--czrs0t",
-    "商城": "whois.gtld.knet.cn",
-    "дети": "whois.nic.xn--d1acj3b",
-    "мкд": "whois.marnet.mk",
-    "ею": "whois.eu",
-    "新闻": "whois.nic.xn--efvy88h",
-    "كوم": "whois.nic.xn--fhbei",
-    "中文网": "whois.teleinfo.cn",
-    "中信": "whois.gtld.knet.cn",
-    "中国": "cwhois.cnnic.cn",
-    "中國": "cwhois.cnnic.cn",
-    "娱乐": "whois.nic.xn--fjq720a",
-    "谷歌": "whois.nic.google",
-    "భారత్": "whois.registry.in",
-    "電訊盈科": "whois.nic.xn--fzys8d69uvgm",
-    "ભારત": "whois.registry.in",
-    "भारतम्": "whois.registry.in",
-    "भारत": "whois.registry.in",
-    "भारोत": "whois.registry.in",
-    "网店": "whois.gtld.knet.cn",
-    "संगठन": "whois.nic.xn--i1b6b1a6a2e",
-    "网络": "whois.ngtld.cn",
-    "ком": "whois.nic.xn--j1aef",
-    "укр": "whois.dotukr.com",
-    "香港": "whois.hkirc.hk",
-    "飞利浦": "whois.nic.xn--kcrx77d1x4a",
-    "台湾": "whois.twnic.net.tw",
-    "台灣": "whois.twnic.net.tw",
-    "手机": "whois.nic.xn--kput3i",
-    "الجزائر": "whois.nic.dz",
-    "عمان": "whois.registry.om",
-    "ایران": "whois.nic.ir",
-    "العليان": "whois.nic.xn--mgba7c0bbn0a",
-    "امارات": "whois.aeda.net.ae",
-    "بازار": "whois.nic.xn--mgbab2bd",
-    "موريتانيا": "whois.nic.mr",
-    "بارت": "whois.registry.in",
-    "بھارت": "whois.registry.in",
-    "ابوظبي": "whois.nic.xn--mgbca7dzdo",
-    "السعودية": "whois.nic.net.sa",
-    "ڀارت": "whois.registry.in",
-    "كاثوليك": "whois.nic.xn--mgbi4ecexp",
-    "عراق": "whois.cmc.iq",
-    "مليسيا": "whois.mynic.my",
-    "澳門": "whois.monic.mo",
-    "닷컴": "whois.nic.xn--mk1bu44c",
-    "政府": "whois.nic.xn--mxtq1m",
-    "شبكة": "whois.nic.xn--ngbc5azd",
-    "بيتك": "whois.nic.xn--ngbe9e0a",
-    "عرب": "whois.nic.xn--ngbrx",
-    "机构": "whois.nic.xn--nqv7f",
-    "组织机构": "whois.nic.xn--nqv7fs00ema",
-    "ไทย": "whois.thnic.co.th",
-    "سورية": "whois.tld.sy",
-    "рус": "whois.nic.xn--p1acf",
-    "рф": "whois.tcinet.ru",
-    "تونس": "whois.ati.tn",
-    "大拿": "whois.nic.xn--pssy2u",
-    "ລາວ": "whois.nic.la",
-    "みんな": "whois.nic.google",
-    "グーグル": "whois.nic.google",
-    "ευ": "whois.eu",
-    "ഭാരതം": "whois.registry.in",
-    "ਭਾਰਤ": "whois.registry.in",
-    "网址": "whois.nic.xn--ses554g",
-    "닷넷": "whois.nic.xn--t60b56a",
-    "コム": "whois.nic.xn--tckwe",
-    "天主教": "whois.nic.xn--tiq49xqyj",
-    "游戏": "whois.nic.xn--unup4y",
-    "vermögensberater": "whois.nic.xn--vermgensberater-ctb",
-    "vermögensberatung": "whois.nic.xn--vermgensberatung-pwb",
-    "企业": "whois.nic.xn--vhquv",
-    "信息": "whois.teleinfo.cn",
-    "嘉里大酒店": "whois.nic.xn--w4r85el8fhu5dnra",
-    "嘉里": "whois.nic.xn--w4rs40l",
-    "قطر": "whois.registry.qa",
-    "广东": "whois.ngtld.cn",
-    "இந்தியா": "whois.registry.in",
-    "հայ": "whois.amnic.net",
-    "新加坡": "whois.zh.sgnic.sg",
-    "فلسطين": "whois.pnina.ps",
-    "政务": "whois.conac.cn",
-    "xxx": "whois.nic.xxx",
-    "xyz": "whois.nic.xyz",
-    "yachts": "whois.nic.yachts",
-    "yahoo": "whois.nic.yahoo",
-    "yandex": "whois.nic.yandex",
-    "ye": "whois.y.net.ye",
-    "yodobashi": "whois.nic.gmo",
-    "yoga": "whois.nic.yoga",
-    "yokohama": "whois.nic.yokohama",
-    "youtube": "whois.nic.google",
-    "yt": "whois.nic.yt",
-    "yun": "whois.teleinfo.cn",
-    "zara": "whois.nic.zara",
-    "zip": "whois.nic.google",
-    "zm": "whois.zicta.zm",
-    "zone": "whois.nic.zone",
-    "zuerich": "whois.nic.zuerich",
-}
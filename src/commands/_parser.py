@@ -4,15 +4,29 @@ from typing import Optional
 
 from src.defined_types import RunArgs
 from src.plugin_manager._plugin_manger import PluginManager
+from src.utils.replay import REPLAY_FILE_ENV, REPLAY_PLUGIN_ID_ENV
 from src.utils.text import (
+    CLI_HELP_CACHE,
+    CLI_HELP_DNS_PRECHECK,
+    CLI_HELP_DNS_PREWARM,
+    CLI_HELP_DNS_RESOLVER,
     CLI_HELP_ERROR,
     CLI_HELP_INPUT,
+    CLI_HELP_JOURNAL,
+    CLI_HELP_JSONL,
+    CLI_HELP_MAX_CONCURRENCY,
+    CLI_HELP_MAX_RETRIES,
     CLI_HELP_MESSAGE,
     CLI_HELP_NUM_PROCESSES,
     CLI_HELP_NUM_THREADS,
     CLI_HELP_OUTPUT,
     CLI_HELP_PLUGIN_ID,
     CLI_HELP_QUIET,
+    CLI_HELP_RATE_LIMIT_CONFIG,
+    CLI_HELP_RECORD,
+    CLI_HELP_REPLAY,
+    CLI_HELP_REPLAY_PLUGIN_ID,
+    CLI_HELP_RESUME,
     DESCRIPTION,
 )
 
@@ -47,6 +61,33 @@ def _create_command_parser() -> argparse.ArgumentParser:
         help=CLI_HELP_NUM_THREADS,
         type=int,
     )
+    parser.add_argument(
+        "-c",
+        "--max-concurrency-per-process",
+        help=CLI_HELP_MAX_CONCURRENCY,
+        type=int,
+    )
+    parser.add_argument(
+        "--rate-limit-config",
+        help=CLI_HELP_RATE_LIMIT_CONFIG,
+        type=str,
+    )
+    parser.add_argument(
+        "-r",
+        "--max-retries",
+        help=CLI_HELP_MAX_RETRIES,
+        type=int,
+    )
+    parser.add_argument("--cache", help=CLI_HELP_CACHE, type=str)
+    parser.add_argument("--journal", help=CLI_HELP_JOURNAL, type=str)
+    parser.add_argument("--resume", help=CLI_HELP_RESUME, action="store_true")
+    parser.add_argument("--jsonl", help=CLI_HELP_JSONL, type=str)
+    parser.add_argument("--record", help=CLI_HELP_RECORD, type=str)
+    parser.add_argument("--replay", help=CLI_HELP_REPLAY, type=str)
+    parser.add_argument("--replay-plugin-id", help=CLI_HELP_REPLAY_PLUGIN_ID, type=str)
+    parser.add_argument("--dns-prewarm", help=CLI_HELP_DNS_PREWARM, action="store_true")
+    parser.add_argument("--dns-precheck", help=CLI_HELP_DNS_PRECHECK, action="store_true")
+    parser.add_argument("--dns-resolver", help=CLI_HELP_DNS_RESOLVER, type=str)
     parser.add_argument(
         "-q",
         "--quiet",
@@ -81,6 +122,12 @@ def args_parser() -> RunArgs:
     if args.quiet is not None:
         os.environ["QUIET_FLAG"] = "True"
 
+    # 读取“重放”参数，重放插件从环境变量中读取归档文件路径与要重放的插件 id
+    if args.replay is not None:
+        os.environ[REPLAY_FILE_ENV] = str(args.replay)
+    if args.replay_plugin_id is not None:
+        os.environ[REPLAY_PLUGIN_ID_ENV] = str(args.replay_plugin_id)
+
     # 读取剩余参数
     input_file: str = "input.txt" if args.input is None else str(args.input)
     output_file: Optional[str] = args.output
@@ -88,6 +135,19 @@ def args_parser() -> RunArgs:
     num_processes: int = 1 if args.num_processes is None else int(args.num_processes)
     max_num_threads_per_process: Optional[int] = args.max_num_threads_per_process
     plugin_id: Optional[str] = args.id
+    if plugin_id is None and args.replay is not None:
+        plugin_id = "replay_query"
+    max_concurrency_per_process: Optional[int] = args.max_concurrency_per_process
+    rate_limit_config_file: Optional[str] = args.rate_limit_config
+    max_retries: int = 3 if args.max_retries is None else int(args.max_retries)
+    cache_file: Optional[str] = args.cache
+    journal_file: Optional[str] = args.journal
+    resume: bool = bool(args.resume)
+    result_stream_file: Optional[str] = args.jsonl
+    record_file: Optional[str] = args.record
+    dns_prewarm: bool = bool(args.dns_prewarm)
+    dns_precheck: bool = bool(args.dns_precheck)
+    dns_resolver: Optional[str] = args.dns_resolver
 
     # argparse 设置了 type，参数就会自动格式化为对应 type，但是这里还是特检一次
     for var, var_type in [
@@ -97,6 +157,17 @@ def args_parser() -> RunArgs:
         (num_processes, (int,)),
         (max_num_threads_per_process, (int, type(None))),
         (plugin_id, (str, type(None))),
+        (max_concurrency_per_process, (int, type(None))),
+        (rate_limit_config_file, (str, type(None))),
+        (max_retries, (int,)),
+        (cache_file, (str, type(None))),
+        (journal_file, (str, type(None))),
+        (resume, (bool,)),
+        (result_stream_file, (str, type(None))),
+        (record_file, (str, type(None))),
+        (dns_prewarm, (bool,)),
+        (dns_precheck, (bool,)),
+        (dns_resolver, (str, type(None))),
     ]:
         if type(var) not in var_type:
             raise TypeError(f"{var} must be of type {var_type}")
@@ -108,4 +179,15 @@ def args_parser() -> RunArgs:
         num_processes=num_processes,
         max_num_threads_per_process=max_num_threads_per_process,
         plugin_id=plugin_id,
+        max_concurrency_per_process=max_concurrency_per_process,
+        rate_limit_config_file=rate_limit_config_file,
+        max_retries=max_retries,
+        cache_file=cache_file,
+        journal_file=journal_file,
+        resume=resume,
+        result_stream_file=result_stream_file,
+        record_file=record_file,
+        dns_prewarm=dns_prewarm,
+        dns_precheck=dns_precheck,
+        dns_resolver=dns_resolver,
     )
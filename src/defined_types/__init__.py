@@ -1,4 +1,7 @@
 from ._parsed_whois_data import ParsedWhoisData
 from ._plugin_data_structure import PluginMetadataDict, PluginReturnDict
+from ._query_task import QueryTask
+from ._rate_limit_config import RateLimitConfigDict, RateLimitDict
 from ._result import Err, Ok, Result
+from ._result_record import ResultRecordDict
 from ._run_args import RunArgs
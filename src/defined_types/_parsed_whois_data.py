@@ -12,3 +12,7 @@ class ParsedWhoisData(TypedDict, total=False):
     status: tuple[bool, Literal["registered", "redemption", "unregistered"]]
     raw: str
     registry_expiry_date: Result[datetime.datetime, DatetimeParserErrResult]
+    # 以下为可选项，原始数据中有对应字段时提供
+    registrar: str  # 注册商
+    creation_date: str  # 注册时间，为原始数据中的写法，未解析
+    name_servers: list[str]  # 域名服务器，小写
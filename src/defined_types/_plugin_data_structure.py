@@ -1,4 +1,6 @@
-from typing import Any, Literal, TypedDict
+from typing import Any, Literal, NotRequired, TypedDict
+
+from ._rate_limit_config import RateLimitDict
 
 
 class PluginMetadataDict(TypedDict, total=False):
@@ -8,6 +10,14 @@ class PluginMetadataDict(TypedDict, total=False):
     mode: Literal["sync", "async"]  # 标记是同步型还是异步型
     author: tuple[str] | str
     help: str
+    # 以下为可选项，声明插件的承载能力，主程序据此自动设置并发数与限速
+    max_concurrency: int  # 全部进程合计同时进行的最大查询数
+    rate_limit: RateLimitDict  # 全部进程合计的整体限速，不区分 WHOIS 服务器
+    # 同步型插件的调用方式，默认为 thread
+    executor: Literal["inline", "thread", "process"]
+    # 以下为可选项，插件定义了 main_batch 函数时用于声明批量查询
+    max_batch_size: int  # 一次最多查询的域名数
+    max_batch_delay: float  # 凑一批域名时最多等待的秒数
     # option: str
     # version: str
     # tag: list[str]
@@ -18,3 +28,6 @@ class PluginReturnDict(TypedDict):
 
     code: int
     raw: Any
+    # 以下为可选项，插件能直接得到结构化数据（如 RDAP）时提供，提供 status 后不再解析 raw
+    status: NotRequired[Literal["registered", "redemption", "unregistered"]]
+    expiry_date: NotRequired[str]  # 过期时间，ISO 8601 格式
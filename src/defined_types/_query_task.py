@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class QueryTask:
+    """流水线中待查询的域名及其查询状态"""
+
+    domain: str
+    attempts: int = 0  # 已查询的次数
+    latency: float = 0.0  # 各次查询耗时之和，单位为秒
+    batch_id: Optional[int] = None  # 多进程模式下所属的分发批次
+    # 内置的 后缀-WHOIS 服务器 对应表中该域名的 WHOIS 服务器，读取输入时由后缀树一并得到，找不到时为空字符串
+    whois_server: str = ""
@@ -0,0 +1,17 @@
+from typing import NotRequired, TypedDict
+
+
+class RateLimitDict(TypedDict, total=False):
+    """单个 WHOIS 服务器或插件整体的限速配置"""
+
+    rate: float  # 每秒最多发起的查询数，小于等于 0 表示不限速
+    burst: int  # 令牌桶容量，即允许的瞬时突发查询数
+    concurrency: int  # 同时进行的最大查询数，小于等于 0 表示不限制
+
+
+class RateLimitConfigDict(TypedDict):
+    """限速配置，default 为未单独配置的服务器使用的默认值，servers 为 服务器主机名-限速配置 键值对，plugin 为插件的整体限速"""
+
+    default: RateLimitDict
+    servers: dict[str, RateLimitDict]
+    plugin: NotRequired[RateLimitDict]
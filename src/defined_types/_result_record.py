@@ -0,0 +1,21 @@
+from typing import Literal, Optional, TypedDict
+
+from .domain_query_result import ErrorClass, QueryOutcome
+
+
+class ResultRecordDict(TypedDict):
+    """结构化结果流中单个域名的一行记录"""
+
+    domain: str
+    outcome: QueryOutcome  # 最终处理结果
+    status: Optional[
+        Literal["registered", "redemption", "unregistered"]
+    ]  # 查询失败时为 None
+    expiry_date: Optional[str]  # ISO 8601 格式的过期时间，未获取到时为 None
+    plugin_id: str  # 进行查询的插件 id
+    whois_server: Optional[str]  # 连接的 WHOIS 服务器，插件未提供时为 None
+    error_class: Optional[ErrorClass]  # 查询失败时的错误分类
+    error: Optional[str]  # 查询或解析失败时的错误信息
+    attempts: int  # 已查询的次数，使用缓存结果时为 0
+    latency: float  # 各次查询耗时之和，单位为秒
+    cached: bool  # 是否使用了缓存中的结果
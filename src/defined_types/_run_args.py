@@ -8,3 +8,14 @@ class RunArgs(NamedTuple):
     num_processes: int
     max_num_threads_per_process: Optional[int]
     plugin_id: Optional[str]
+    max_concurrency_per_process: Optional[int]
+    rate_limit_config_file: Optional[str]
+    max_retries: int
+    cache_file: Optional[str]
+    journal_file: Optional[str]
+    resume: bool
+    result_stream_file: Optional[str]
+    record_file: Optional[str]
+    dns_prewarm: bool
+    dns_precheck: bool
+    dns_resolver: Optional[str]
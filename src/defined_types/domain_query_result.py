@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import Literal, TypedDict
 
 
 class MsgErrResult(TypedDict):
@@ -10,3 +10,35 @@ class MsgErrResult(TypedDict):
 class ExceptionErrResult(TypedDict):
     domain: str
     err: Exception
+
+
+# 查询失败的错误分类
+ErrorClass = Literal[
+    "rate_limited",  # 查询过快被服务器限制
+    "network",  # 连接失败、超时等网络错误
+    "server_error",  # 服务器或插件内部错误
+    "empty",  # 返回了空结果
+    "invalid_query",  # 查询本身无效，如没有对应的 WHOIS 服务器，重试无意义
+    "api_error",  # 其他 API 错误，重试无意义
+    "exception",  # 处理过程中抛出异常，重试无意义
+]
+
+
+# 单个域名的最终处理结果
+QueryOutcome = Literal[
+    "unregistered",  # 未注册
+    "redemption",  # 赎回期
+    "expired",  # 已过期
+    "not_expired",  # 未过期
+    "delegated",  # DNS 中有有效的委派，视为已注册，未查询 WHOIS
+    "error",  # 查询或解析失败
+]
+
+
+# DNS 预检查的结果
+DnsPrecheckStatus = Literal[
+    "delegated",  # 有 NS 记录，域名已注册
+    "nxdomain",  # 域名不存在
+    "undelegated",  # 域名存在但没有 NS 记录
+    "unknown",  # 解析失败、超时或响应异常
+]
@@ -1,15 +1,22 @@
 import asyncio
+import contextlib
+import functools
+import itertools
+import math
 import multiprocessing
+import multiprocessing.queues
+import multiprocessing.util
 import os
+import queue
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, Optional, cast
+from types import ModuleType
+from typing import AsyncIterator, Callable, Literal, Optional, Sequence, cast
 
 import aiofiles
-import tldextract
-from tqdm.asyncio import tqdm_asyncio
+from tqdm import tqdm
 
 # 用于解决运行出现 ModuleNotFoundError: No module named 'src' 问题
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)) + "/..")
@@ -20,15 +27,52 @@ from src.defined_types import (
     Ok,
     ParsedWhoisData,
     PluginMetadataDict,
+    PluginReturnDict,
+    QueryTask,
+    RateLimitConfigDict,
     Result,
     RunArgs,
 )
-from src.defined_types.domain_query_result import ExceptionErrResult, MsgErrResult
-from src.plugin_caller import call_async_plugin_by_id, call_sync_plugin_by_id
+from src.defined_types.domain_query_result import (
+    ErrorClass,
+    ExceptionErrResult,
+    MsgErrResult,
+    QueryOutcome,
+)
+from src.plugin_caller import (
+    call_async_batch_plugin_by_id,
+    call_async_plugin_by_id,
+    call_sync_batch_plugin_by_id,
+    call_sync_plugin_by_id,
+)
 from src.plugin_manager import PluginManager
 from src.utils.date_utils import is_datetime_expired
-from src.utils.file_utils import split_file
+from src.utils.dns_cache import dns_cache
+from src.utils.dns_precheck import DnsPrecheck
+from src.utils.domain_trie import DomainMatch, get_domain_trie
+from src.utils.file_utils import (
+    CHANNEL_DONE,
+    BufferedFileWriter,
+    ChannelMessage,
+    ChannelWriter,
+    LineWriter,
+)
+from src.utils.journal import (
+    RETRY_OUTCOME,
+    JournalState,
+    format_journal_entry,
+    load_journal,
+)
 from src.utils.logger import debug, info
+from src.utils.rate_limiter import (
+    ServerRateLimiter,
+    load_rate_limit_config,
+    scale_rate_limit_config,
+)
+from src.utils.replay import format_record_entry
+from src.utils.result_cache import ResultCache, format_cache_entry
+from src.utils.result_stream import build_result_record, format_result_record
+from src.utils.retry import RetryPolicy, RetryQueue, classify_error
 from src.utils.text import (
     CLI_ERROR_INPUT_FILE_NOT_EXIST,
     CLI_ERROR_INVAID_PLUGIN_ID,
@@ -36,41 +80,284 @@ from src.utils.text import (
     INFO_API_ERROR,
     INFO_CHECKING_DATE_EXPIRED,
     INFO_DATE_NOT_FOUND,
+    INFO_DNS_DELEGATED,
+    INFO_DNS_PREWARM,
     INFO_ERROR_PARSING_DATE,
     INFO_EXPIRED,
+    INFO_LOST_TASKS,
     INFO_NOT_EXPIRED,
     INFO_NOT_REGISTER,
     INFO_PUBLIC_SUFFIX_LIST,
     INFO_REDEMPTION_PERIOD,
+    INFO_RESUME,
+    INFO_RETRY,
 )
 
+DEFAULT_MAX_CONCURRENCY: int = 100  # 异步型插件每进程默认的最大并发查询数
+DEFAULT_MAX_RETRIES: int = 3  # 单个域名查询失败后默认最多重试的次数
+DEFAULT_TASK_BATCH_SIZE: int = 100  # 多进程模式下每次分发给子进程的域名数
+TASK_CHANNEL_PUT_TIMEOUT: float = (
+    1.0  # 任务队列已满时，每等待多少秒检查一次子进程是否存活
+)
+DEFAULT_MAX_BATCH_CONCURRENCY: int = 4  # 批量型插件每进程默认同时进行的批量查询数
+DEFAULT_MAX_BATCH_DELAY: float = 0.05  # 批量型插件凑一批域名时最多等待的秒数
 
-async def main_async(
-    file_part: str,
-    output_file: Optional[str],
-    error_file: Optional[str],
-    plugin_id: str,
-    thread_pool_executor=ThreadPoolExecutor,
-):
-    """主协程函数
+
+def _get_max_batch_size(plugin_instance: ModuleType) -> int:
+    """获取插件一次最多查询的域名数。插件定义了 main_batch 函数并在 METADATA 中声明 max_batch_size 时才支持批量查询
 
     Args:
-        file_part (str): 要处理的文件
-        output_file (Optional[str]): 输出文件的路径
-        error_file (Optional[str]): 错误日志文件的路径
-        thread_pool_executor (_type_, optional): 线程池实例
+        plugin_instance (ModuleType): 插件对象
+
+    Returns:
+        int: 一次最多查询的域名数，不支持批量查询时为 1
     """
-    tasks: list[asyncio.Task | asyncio.Future] = []
+    if not hasattr(plugin_instance, "main_batch"):
+        return 1
+    plugin_metadata_dict: PluginMetadataDict = plugin_instance.METADATA
+    return max(1, plugin_metadata_dict.get("max_batch_size", 1))
 
-    loop = asyncio.get_running_loop()
 
-    plugin_metadata_dict: PluginMetadataDict = (
-        PluginManager().get_plugin_instance_by_id(plugin_id).METADATA
+def _get_executor_type(
+    plugin_metadata_dict: PluginMetadataDict,
+) -> Literal["inline", "thread", "process"]:
+    """获取调用插件的方式。异步型插件总是在事件循环中直接调用，同步型插件按 METADATA 中声明的 executor，默认在线程池中调用
+
+    Args:
+        plugin_metadata_dict (PluginMetadataDict): 插件元数据
+
+    Returns:
+        Literal["inline", "thread", "process"]: 在事件循环中直接调用、在线程池中调用或在进程池中调用
+    """
+    if plugin_metadata_dict["mode"] == "async":
+        return "inline"
+    return plugin_metadata_dict.get("executor", "thread")
+
+
+def _init_plugin_process(plugin_id: str) -> None:
+    """进程池中每个进程启动时调用，确保插件已加载，并调用插件的 setup，在进程退出时调用 teardown
+
+    进程池的进程退出时不会调用 atexit 注册的函数，因此通过 multiprocessing.util.Finalize 注册 teardown
+
+    Args:
+        plugin_id (str): 使用的插件 id
+    """
+    if plugin_id not in PluginManager().get_all_plugin_ids():
+        PluginManager().load_plugin(plugin_dir_path="plugins")
+    asyncio.run(PluginManager().setup_plugin(plugin_id))
+    multiprocessing.util.Finalize(
+        None,
+        _teardown_plugin_process,
+        args=(plugin_id,),
+        exitpriority=0,
+    )
+
+
+def _teardown_plugin_process(plugin_id: str) -> None:
+    """进程池中每个进程退出时调用插件的 teardown
+
+    Args:
+        plugin_id (str): 使用的插件 id
+    """
+    asyncio.run(PluginManager().teardown_plugin(plugin_id))
+
+
+def _call_sync_plugin_with_returns(
+    plugin_id: str, domain: str
+) -> tuple[
+    Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult], list[PluginReturnDict]
+]:
+    """在进程池中调用同步型插件，连同插件的原始返回值一起返回，供主进程录制
+
+    Args:
+        plugin_id (str): 使用的插件 id
+        domain (str): 域名
+
+    Returns:
+        tuple[Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult], list[PluginReturnDict]]: 查询结果与插件的原始返回值
+    """
+    rets: list[PluginReturnDict] = []
+    return call_sync_plugin_by_id(plugin_id, domain, rets.append), rets
+
+
+def _call_sync_batch_plugin_with_returns(plugin_id: str, domains: list[str]) -> tuple[
+    dict[str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]],
+    list[tuple[str, PluginReturnDict]],
+]:
+    """在进程池中调用同步型插件的 main_batch，连同每个域名的原始返回值一起返回，供主进程录制
+
+    Args:
+        plugin_id (str): 使用的插件 id
+        domains (list[str]): 域名
+
+    Returns:
+        tuple[dict[str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]], list[tuple[str, PluginReturnDict]]]: 域名-查询结果 键值对与各域名的原始返回值
+    """
+    rets: list[tuple[str, PluginReturnDict]] = []
+    query_results = call_sync_batch_plugin_by_id(
+        plugin_id, domains, lambda domain, ret: rets.append((domain, ret))
     )
+    return query_results, rets
+
+
+def _handle_query_result(
+    query_result: Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult],
+    output_writer: Optional[LineWriter],
+    error_writer: Optional[LineWriter],
+) -> QueryOutcome:
+    """处理单个域名的查询结果，按结果输出信息并写入对应文件
+
+    Args:
+        query_result (Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]): 插件调用的返回值
+        output_writer (Optional[LineWriter]): 输出文件的写入器
+        error_writer (Optional[LineWriter]): 错误日志文件的写入器
+
+    Returns:
+        QueryOutcome: 该域名的最终结果
+    """
+    result_domain: str
+    match query_result:
+        case Err(error):
+            result_domain = error["domain"]
+            if "msg" in error and "code" in error:
+                error = cast(MsgErrResult, error)
+                info(
+                    f"{INFO_API_ERROR}  HTTP-Status-Code:{error['code']}  Info:{error['msg']}".format(
+                        domain=result_domain
+                    )
+                )
+            elif "err" in error:
+                error = cast(ExceptionErrResult, error)
+                info(f"{INFO_API_ERROR} {str(error['err'])}".format(domain=result_domain))
+            else:
+                raise ValueError("Invaid Data")  # 不可能的路径
+
+            # 获取失败的写入 error.txt 文件
+            if error_writer is not None:
+                error_writer.write(result_domain)
+            return "error"
+        case Ok(parsed_whois_data):
+            result_domain = parsed_whois_data["domain"]
+        case _:
+            raise Exception
+
+    domain_status: tuple[bool, Literal["registered", "redemption", "unregistered"]] = (
+        parsed_whois_data["status"]
+    )
+
+    # debug 信息用于检查非注册状态域名的 hwhois
+    if domain_status[1] != "registered":
+        debug(message="parsed whois data", data=parsed_whois_data)
+
+    if domain_status[1] == "unregistered":
+        info(INFO_NOT_REGISTER.format(domain=result_domain))
+        # 未注册，写入 output.txt 文件
+        if output_writer is not None:
+            output_writer.write(result_domain)
+        return "unregistered"
+    elif domain_status[1] == "redemption":
+        info(INFO_REDEMPTION_PERIOD.format(domain=result_domain))
+        # 赎回期，写入 output.txt 文件
+        if output_writer is not None:
+            output_writer.write(result_domain)
+        return "redemption"
+
+    STRICT_MODE: bool = True
+
+    def is_pass_strict_mode(domain: str) -> bool:
+        """有些域名不提供域名信息，所以无法进行严格检查。检查这个域名是否允许跳过检查。
+
+        Args:
+            domain (str): 干净的域名如 a.li
+
+        Returns:
+            bool: 可跳过返回 True，不可跳过返回 False
+        """
+        # 有些域名不提供域名信息，所以无法进行严格检查
+        if domain.endswith(".li") or domain.endswith(".ch"):
+            return True
+        return False
+
+    if STRICT_MODE and not is_pass_strict_mode(domain=result_domain):
+        # 严格检查
+        # 为了保险，再检查下时间是否是过期的。
+        # 检查“是否为赎回期”可能有缺漏，但是可以明确的是赎回期的特征：有域名过期时间但是时间过期了
+        # 查询时间
+        match parsed_whois_data["registry_expiry_date"]:
+            case Err(datetime_paser_error):
+                # 时间解析失败
+                if datetime_paser_error["msg"] == "Error Parsing Date":
+                    info(
+                        f"{INFO_ERROR_PARSING_DATE} err:{datetime_paser_error['err']} raw:{datetime_paser_error['raw']}".format(
+                            domain=result_domain
+                        )
+                    )
+                elif datetime_paser_error["msg"] == "Date not found":
+                    info(
+                        f"{INFO_DATE_NOT_FOUND} raw:{datetime_paser_error['raw']}".format(
+                            domain=result_domain
+                        )
+                    )
+                else:
+                    raise ValueError("Invaid Data")  # 不可能的路径
+
+                # 解析失败的写入 error.txt 文件
+                if error_writer is not None:
+                    error_writer.write(result_domain)
+                return "error"
+            case Ok(expired_date):
+                pass
+            case _:
+                exit(-1)
+
+        # 计算查到的时间是否过期
+        is_expired_result: Result[bool, Exception] = is_datetime_expired(expired_date)
+        match is_expired_result:
+            case Err(e):
+                # 在检查时间是否过期的时候出现错误
+                info(f"{INFO_CHECKING_DATE_EXPIRED} {e}".format(domain=result_domain))
+                # 解析失败的写入 error.txt 文件
+                if error_writer is not None:
+                    error_writer.write(result_domain)
+                return "error"
+            case Ok(is_expired):
+                pass
+
+        # 判断是否过期
+        if is_expired:
+            info(INFO_EXPIRED.format(domain=result_domain))
+            # 已过期的写入 output.txt 文件
+            if output_writer is not None:
+                output_writer.write(result_domain)
+            return "expired"
+
+    # 输出未过期的
+    info(INFO_NOT_EXPIRED.format(domain=result_domain))
+    return "not_expired"
+
+
+async def _read_registrable_domains(
+    input_file: str,
+) -> AsyncIterator[tuple[str, str]]:
+    """读取输入文件，逐个产出去重后的可注册域名，以及匹配时一并得到的 WHOIS 服务器
+
+    多行可能对应同一个可注册域名（如 www.x.com/a 和 blog.x.com/b），只产出第一次出现的；
+    公共后缀列表中的私有后缀（如 github.io）不产出
+
+    Args:
+        input_file (str): 输入文件的路径，一行一个链接
+
+    Returns:
+        AsyncIterator[tuple[str, str]]: (可注册域名, WHOIS 服务器)，如 ("example.com", "whois.verisign-grs.com")，找不到 WHOIS 服务器时为空字符串
+    """
+    # 使用随程序发布的公共后缀列表构建的后缀树，启动时不联网
+    domain_trie = get_domain_trie()
+
+    # 已产出的可注册域名，同一个域名只查询一次
+    seen_domains: set[str] = set()
 
-    extract = tldextract.TLDExtract(include_psl_private_domains=True)
     # 读取文件中的域名，一行一个域名。使用节约内存的读法
-    async with aiofiles.open(file_part, "r", encoding="utf-8") as f:
+    async with aiofiles.open(input_file, "r", encoding="utf-8") as f:
         async for line in f:
             # 跳过空行
             line = line.strip()
@@ -78,190 +365,882 @@ async def main_async(
                 continue
 
             # 提取出域名
-            extracted = extract(line)
-            target_domain = f"{extracted.domain}.{extracted.suffix}"
-            if extracted.is_private:
+            domain_match: DomainMatch = domain_trie.match_url(line)
+            target_domain = f"{domain_match.domain}.{domain_match.suffix}"
+
+            if target_domain in seen_domains:
+                continue
+            seen_domains.add(target_domain)
+
+            if domain_match.is_private:
                 info(f"{INFO_PUBLIC_SUFFIX_LIST}".format(domain=target_domain))
                 continue
 
-            task: asyncio.Task | asyncio.Future
-            # 根据同步或异步创建 Task
-            if plugin_metadata_dict["mode"] == "async":
-                async_task: asyncio.Task = asyncio.create_task(
-                    call_async_plugin_by_id(plugin_id, target_domain)
+            yield target_domain, domain_match.whois_server
+
+
+async def _read_query_tasks(
+    input_file: str, journal_state: Optional[JournalState]
+) -> AsyncIterator[QueryTask]:
+    """逐个产出要查询的任务。从运行日志恢复时，先产出中断时等待重试的域名，再跳过已完成的域名读取输入文件
+
+    Args:
+        input_file (str): 输入文件的路径
+        journal_state (Optional[JournalState]): 从运行日志恢复的进度。如果为 None，则从头开始
+
+    Returns:
+        AsyncIterator[QueryTask]: 查询任务
+    """
+    if journal_state is None:
+        async for target_domain, whois_server in _read_registrable_domains(input_file):
+            yield QueryTask(domain=target_domain, whois_server=whois_server)
+        return
+
+    # 等待重试的域名保留已查询次数，重试次数上限不会因中断而重置
+    for target_domain, attempts in journal_state.retry_attempts.items():
+        yield QueryTask(
+            domain=target_domain,
+            attempts=attempts,
+            whois_server=get_domain_trie().match(target_domain).whois_server,
+        )
+
+    async for target_domain, whois_server in _read_registrable_domains(input_file):
+        if (
+            target_domain in journal_state.completed_domains
+            or target_domain in journal_state.retry_attempts
+        ):
+            continue
+        yield QueryTask(domain=target_domain, whois_server=whois_server)
+
+
+async def main_async(
+    input_file: Optional[str],
+    output_file: Optional[str],
+    error_file: Optional[str],
+    plugin_id: str,
+    max_concurrency: int,
+    rate_limit_config: RateLimitConfigDict,
+    max_retries: int,
+    cache_file: Optional[str],
+    journal_file: Optional[str] = None,
+    journal_state: Optional[JournalState] = None,
+    result_stream_file: Optional[str] = None,
+    record_file: Optional[str] = None,
+    dns_prewarm: bool = False,
+    dns_precheck: bool = False,
+    dns_resolver: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    task_channel: Optional[multiprocessing.queues.Queue] = None,
+    result_channel: Optional[multiprocessing.queues.Queue] = None,
+):
+    """主协程函数
+
+    读取协程将域名放入有界队列，固定数量的分发协程从中取出域名，按 WHOIS 服务器放入各服务器的有界队列。
+    每个服务器由一个调度协程按该服务器的限速依次取出域名发起查询，并在结果返回时立即处理，
+    某个服务器限速较低时只有发往它的域名在其队列中等待，队列已满时分发协程等待，不会无限积压。
+    无论输入文件多大，同时存在的查询任务数和连接数都不会超过 max_concurrency。
+    查询失败且可重试的域名会放入重试队列，按错误分类指数退避后重新查询，期间其他域名的查询照常进行。
+    启用缓存时，缓存中未失效的域名直接使用缓存结果，不再查询。
+    启用运行日志时，每个域名得到最终结果或进入重试时都会记录一行，中断后可据此继续。
+    启用结构化结果流时，每个域名得到最终结果后写入一行包含状态、过期时间、错误分类、耗时等信息的 JSON。
+    启用录制时，插件每次返回的原始结果都会写入归档文件，之后可使用重放插件离线重新处理。
+    启用 DNS 预检查时，域名首次查询前先查询 NS 记录，有有效委派的域名视为已注册，不再占用 WHOIS 查询。
+    开始查询前调用插件的 setup，结束后调用 teardown。
+    插件支持批量查询时，调度协程每次从服务器的队列中取出一批域名，调用一次插件查询，再逐个处理每个域名的结果。
+    插件在 METADATA 中声明了整体限速时，全部查询还需满足该限速；同步型插件按声明的 executor 调用。
+
+    Args:
+        input_file (Optional[str]): 要处理的文件。多进程模式下为 None，改为从 task_channel 领取域名
+        output_file (Optional[str]): 输出文件的路径
+        error_file (Optional[str]): 错误日志文件的路径
+        plugin_id (str): 使用的插件 id
+        max_concurrency (int): 最大并发查询数。批量型插件为同时进行的批量查询数
+        rate_limit_config (RateLimitConfigDict): 本进程使用的按 WHOIS 服务器限速配置，plugin 项为插件的整体限速
+        max_retries (int): 单个域名查询失败后最多重试的次数
+        cache_file (Optional[str]): 查询结果缓存数据库的路径。如果为 None，则不使用缓存
+        journal_file (Optional[str], optional): 运行日志文件的路径。如果为 None，则不记录
+        journal_state (Optional[JournalState], optional): 从运行日志恢复的进度，仅单进程模式下使用。如果为 None，则从头开始
+        result_stream_file (Optional[str], optional): 结构化结果流（JSON Lines）文件的路径。如果为 None，则不写入
+        record_file (Optional[str], optional): 录制插件原始返回值的归档文件路径。如果为 None，则不录制
+        dns_prewarm (bool, optional): 是否在开始查询前预先解析插件可能连接的全部 WHOIS 服务器主机名
+        dns_precheck (bool, optional): 是否在查询 WHOIS 前先检查域名的 DNS 委派
+        dns_resolver (Optional[str], optional): DNS 预检查使用的 DNS 服务器，host 或 host:port 格式。如果为 None，则使用系统配置的 DNS 服务器
+        executor (Optional[Executor], optional): 线程池或进程池实例，按插件声明的 executor 调用同步型插件时使用。如果为 None，则使用事件循环默认的线程池
+        task_channel (Optional[multiprocessing.queues.Queue], optional): 多进程模式下领取待查询域名的队列，每个元素为一批查询任务，None 表示没有更多任务
+        result_channel (Optional[multiprocessing.queues.Queue], optional): 多进程模式下发送结果给主进程的队列。如果为 None，则直接写入文件
+    """
+    loop = asyncio.get_running_loop()
+
+    plugin_instance = PluginManager().get_plugin_instance_by_id(plugin_id)
+    plugin_metadata_dict: PluginMetadataDict = plugin_instance.METADATA
+
+    # 插件可选提供 get_whois_server 函数，告知查询某域名时连接的 WHOIS 服务器，用于按服务器限速
+    get_whois_server: Optional[Callable[[str, str], str]] = getattr(
+        plugin_instance, "get_whois_server", None
+    )
+    rate_limiter = ServerRateLimiter(rate_limit_config)
+    # 插件的整体限速不区分 WHOIS 服务器，全部查询共用一个令牌桶
+    plugin_rate_limiter = ServerRateLimiter(
+        {"default": rate_limit_config.get("plugin", {}), "servers": {}}
+    )
+    executor_type: Literal["inline", "thread", "process"] = _get_executor_type(
+        plugin_metadata_dict
+    )
+    retry_policy = RetryPolicy(max_retries=max_retries)
+
+    # 批量型插件一次查询多个域名，此时 max_concurrency 为同时进行的批量查询数
+    max_batch_size: int = _get_max_batch_size(plugin_instance)
+    max_batch_delay: float = plugin_metadata_dict.get(
+        "max_batch_delay", DEFAULT_MAX_BATCH_DELAY
+    )
+
+    # 队列长度为并发查询的域名数的两倍，保证分发协程不会空等，同时内存占用保持平稳
+    domain_queue: asyncio.Queue[Optional[QueryTask]] = asyncio.Queue(
+        maxsize=max_concurrency * max_batch_size * 2
+    )
+    # 分发协程的数量，即同时进行的 DNS 预检查数
+    num_routers: int = max_concurrency * max_batch_size
+    # 查询失败待重试的域名，到期后送回 domain_queue
+    retry_queue: RetryQueue[Optional[QueryTask]] = RetryQueue()
+    # WHOIS 服务器主机名-该服务器的待查询队列 键值对，服务器第一次出现时创建，并启动它的调度协程
+    server_queues: dict[Optional[str], asyncio.Queue[Optional[QueryTask]]] = {}
+    # 全部服务器合计同时进行的查询数
+    query_slots = asyncio.Semaphore(max_concurrency)
+
+    progress_bar = tqdm(desc="", unit="domain")
+
+    # 每个输出文件只打开一次，由常驻的写入协程批量写入。多进程模式下发送给主进程统一写入
+    output_writer: Optional[LineWriter] = _create_writer(
+        output_file, "output", result_channel
+    )
+    error_writer: Optional[LineWriter] = _create_writer(
+        error_file, "error", result_channel
+    )
+    result_stream_writer: Optional[LineWriter] = _create_writer(
+        result_stream_file, "result_stream", result_channel
+    )
+    record_writer: Optional[LineWriter] = _create_writer(
+        record_file, "record", result_channel
+    )
+    # 运行日志中的域名在恢复时不再查询，须在其他文件写入该域名的结果后才写入运行日志
+    journal_writer: Optional[LineWriter] = _create_writer(
+        journal_file,
+        "journal",
+        result_channel,
+        flush_before=[output_writer, error_writer, result_stream_writer, record_writer],
+    )
+
+    result_cache: Optional[ResultCache] = (
+        ResultCache(cache_file) if cache_file is not None else None
+    )
+    # 多进程模式下子进程只读取缓存，要缓存的结果发送给主进程统一写入，避免多个进程争抢数据库的写锁
+    cache_writer: Optional[LineWriter] = (
+        ChannelWriter(result_channel, "cache")
+        if cache_file is not None and result_channel is not None
+        else None
+    )
+    precheck: Optional[DnsPrecheck] = DnsPrecheck(dns_resolver) if dns_precheck else None
+
+    # 多进程模式下每批任务全部得到最终结果后通知主进程，子进程异常退出时主进程据此找出丢失的任务
+    # 主进程收到完成通知时，这批任务的结果须已全部发出，因此先发送其他写入器中的行
+    batch_done_writer: Optional[LineWriter] = (
+        ChannelWriter(
+            result_channel,
+            "batch_done",
+            flush_before=[
+                writer
+                for writer in (
+                    output_writer,
+                    error_writer,
+                    result_stream_writer,
+                    record_writer,
+                    journal_writer,
+                    cache_writer,
                 )
-                task = async_task
-            else:
-                sync_task: asyncio.Future = loop.run_in_executor(
-                    thread_pool_executor, call_sync_plugin_by_id, plugin_id, target_domain
+                if isinstance(writer, ChannelWriter)
+            ],
+        )
+        if result_channel is not None
+        else None
+    )
+    # 批次-尚未得到最终结果的任务数 键值对
+    batch_remaining_counts: dict[int, int] = {}
+
+    # 已放入队列但还没有得到最终结果（包括等待重试）的域名数
+    pending_count: int = 0
+    is_producer_done: bool = False
+    all_done = asyncio.Event()
+
+    def record(query_task: QueryTask, outcome: QueryOutcome | str) -> None:
+        """在运行日志中记录一个域名的结果"""
+        if journal_writer is not None:
+            journal_writer.write(
+                format_journal_entry(query_task.domain, outcome, query_task.attempts)
+            )
+
+    def write_result_record(
+        query_task: QueryTask,
+        outcome: QueryOutcome,
+        query_result: Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult],
+        cached: bool,
+        whois_server: Optional[str],
+    ) -> None:
+        """在结构化结果流中写入一个域名的最终结果"""
+        if result_stream_writer is None:
+            return
+        result_stream_writer.write(
+            format_result_record(
+                build_result_record(
+                    domain=query_task.domain,
+                    outcome=outcome,
+                    query_result=query_result,
+                    plugin_id=plugin_id,
+                    whois_server=whois_server,
+                    attempts=query_task.attempts,
+                    latency=query_task.latency,
+                    cached=cached,
                 )
-                task = sync_task
+            )
+        )
+
+    def resolve_whois_server(query_task: QueryTask) -> Optional[str]:
+        """获取查询该域名时插件连接的 WHOIS 服务器，插件没有定义 get_whois_server 时为 None"""
+        if get_whois_server is None:
+            return None
+        return get_whois_server(query_task.domain, query_task.whois_server).lower()
+
+    def record_plugin_return(domain: str, ret: PluginReturnDict) -> None:
+        """将插件的原始返回值写入归档文件"""
+        if record_writer is None:
+            return
+        line: str = format_record_entry(plugin_id, domain, ret)
+        if executor_type == "thread":
+            # 同步型插件在线程中返回，写入器只能在事件循环中使用
+            loop.call_soon_threadsafe(record_writer.write, line)
+        else:
+            record_writer.write(line)
+
+    def complete_batch_task(query_task: QueryTask) -> None:
+        """一个域名得到最终结果后调用，所属批次全部完成时通知主进程"""
+        if batch_done_writer is None or query_task.batch_id is None:
+            return
+        batch_remaining_counts[query_task.batch_id] -= 1
+        if batch_remaining_counts[query_task.batch_id] == 0:
+            del batch_remaining_counts[query_task.batch_id]
+            batch_done_writer.write(str(query_task.batch_id))
+
+    def finish_one(query_task: QueryTask) -> None:
+        """一个已放入队列的域名得到最终结果后调用，全部域名处理完毕时通知结束"""
+        nonlocal pending_count
+        pending_count -= 1
+        progress_bar.update()
+        complete_batch_task(query_task)
+        if is_producer_done and pending_count == 0:
+            all_done.set()
 
-            # 加入 task 列表
-            tasks.append(task)
+    async def read_query_tasks() -> AsyncIterator[QueryTask]:
+        """逐个产出要查询的任务。单进程模式下读取输入文件，多进程模式下从主进程分发的任务中领取"""
+        if task_channel is None:
+            async for query_task in _read_query_tasks(
+                cast(str, input_file), journal_state
+            ):
+                yield query_task
+            return
 
-    # 等待任务完成
-    for future in tqdm_asyncio.as_completed(tasks, desc="", total=len(tasks)):
-        query_result: Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult] = (
-            await future
+        while True:
+            # 处理完手上的一批才会领取下一批，处理快的进程自然会领取更多
+            message: Optional[tuple[int, list[QueryTask]]] = await loop.run_in_executor(
+                None, task_channel.get
+            )
+            if message is None:
+                return
+            batch_id, batch = message
+            batch_remaining_counts[batch_id] = len(batch)
+            for query_task in batch:
+                yield query_task
+
+    async def producer() -> None:
+        """将要查询的域名放入队列"""
+        nonlocal pending_count, is_producer_done
+        async for query_task in read_query_tasks():
+            # 缓存中有未失效的结果，直接使用，不再查询
+            if result_cache is not None:
+                cached_result = result_cache.get(query_task.domain)
+                if cached_result is not None:
+                    debug("Result cache hit", query_task.domain)
+                    outcome: QueryOutcome = _handle_query_result(
+                        cached_result, output_writer, error_writer
+                    )
+                    record(query_task, outcome)
+                    write_result_record(
+                        query_task,
+                        outcome,
+                        cached_result,
+                        True,
+                        resolve_whois_server(query_task),
+                    )
+                    progress_bar.update()
+                    complete_batch_task(query_task)
+                    continue
+
+            pending_count += 1
+            # 队列已满时在此等待，实现背压
+            await domain_queue.put(query_task)
+
+        is_producer_done = True
+        if pending_count == 0:
+            all_done.set()
+
+    async def closer() -> None:
+        """全部域名处理完毕后，停止重试队列并为每个分发协程与调度协程放入一个结束标记"""
+        await all_done.wait()
+        retry_queue.close()
+        for _ in range(num_routers):
+            await domain_queue.put(None)
+        for server_queue in server_queues.values():
+            await server_queue.put(None)
+
+    async def skip_by_precheck(query_task: QueryTask) -> bool:
+        """首次查询前先检查 DNS 委派，有委派的域名一定已注册，直接记录结果，不再查询 WHOIS
+
+        Returns:
+            bool: 已记录结果、不需要查询时为 True
+        """
+        if precheck is None or query_task.attempts > 0:
+            return False
+        if await precheck.check(query_task.domain) != "delegated":
+            return False
+        info(INFO_DNS_DELEGATED.format(domain=query_task.domain))
+        record(query_task, "delegated")
+        write_result_record(
+            query_task,
+            "delegated",
+            Ok({"domain": query_task.domain, "status": (True, "registered")}),
+            False,
+            None,
         )
-        result_domain: str
-        match query_result:
-            case Err(error):
-                result_domain = error["domain"]
-                if "msg" in error and "code" in error:
-                    error = cast(MsgErrResult, error)
-                    info(
-                        f"{INFO_API_ERROR}  HTTP-Status-Code:{error['code']}  Info:{error['msg']}".format(
-                            domain=result_domain
-                        )
+        finish_one(query_task)
+        return True
+
+    def handle_query_result(
+        query_task: QueryTask,
+        query_result: Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult],
+        whois_server: Optional[str],
+    ) -> None:
+        """处理一个域名的一次查询结果：可重试的错误放入重试队列，否则记录最终结果"""
+        query_task.attempts += 1
+
+        # 可重试的错误放入重试队列，等待一段时间后重新查询
+        if isinstance(query_result, Err):
+            error_class: ErrorClass = classify_error(query_result.error)
+            if retry_policy.should_retry(error_class, query_task.attempts):
+                delay: float = retry_policy.get_delay(error_class, query_task.attempts)
+                info(
+                    INFO_RETRY.format(
+                        domain=query_task.domain,
+                        error_class=error_class,
+                        retry=query_task.attempts,
+                        max_retries=retry_policy.max_retries,
+                        delay=delay,
                     )
-                elif "err" in error:
-                    error = cast(ExceptionErrResult, error)
-                    info(
-                        f"{INFO_API_ERROR} {str(error['err'])}".format(
-                            domain=result_domain
-                        )
+                )
+                record(query_task, RETRY_OUTCOME)
+                retry_queue.push(query_task, delay)
+                return
+
+        if cache_writer is not None:
+            cache_writer.write(format_cache_entry(query_task.domain, query_result))
+        elif result_cache is not None:
+            result_cache.put(query_task.domain, query_result)
+
+        outcome: QueryOutcome = _handle_query_result(
+            query_result, output_writer, error_writer
+        )
+        record(query_task, outcome)
+        write_result_record(query_task, outcome, query_result, False, whois_server)
+        finish_one(query_task)
+
+    async def call_plugin(
+        domain: str,
+    ) -> Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]:
+        """按插件的类型与 executor 调用插件查询一个域名"""
+        on_plugin_return: Optional[Callable[[PluginReturnDict], None]] = (
+            functools.partial(record_plugin_return, domain)
+            if record_writer is not None
+            else None
+        )
+        if plugin_metadata_dict["mode"] == "async":
+            return await call_async_plugin_by_id(plugin_id, domain, on_plugin_return)
+        if executor_type == "inline":
+            return call_sync_plugin_by_id(plugin_id, domain, on_plugin_return)
+        if executor_type == "process":
+            # 回调函数无法传给其他进程，原始返回值随结果一起返回后再录制
+            query_result, rets = await loop.run_in_executor(
+                executor, _call_sync_plugin_with_returns, plugin_id, domain
+            )
+            if on_plugin_return is not None:
+                for ret in rets:
+                    on_plugin_return(ret)
+            return query_result
+        return await loop.run_in_executor(
+            executor, call_sync_plugin_by_id, plugin_id, domain, on_plugin_return
+        )
+
+    async def call_batch_plugin(
+        domains: list[str],
+    ) -> dict[str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]]:
+        """按插件的类型与 executor 调用插件的 main_batch 查询一批域名"""
+        on_plugin_return: Optional[Callable[[str, PluginReturnDict], None]] = (
+            record_plugin_return if record_writer is not None else None
+        )
+        if plugin_metadata_dict["mode"] == "async":
+            return await call_async_batch_plugin_by_id(
+                plugin_id, domains, on_plugin_return
+            )
+        if executor_type == "inline":
+            return call_sync_batch_plugin_by_id(plugin_id, domains, on_plugin_return)
+        if executor_type == "process":
+            query_results, rets = await loop.run_in_executor(
+                executor, _call_sync_batch_plugin_with_returns, plugin_id, domains
+            )
+            if on_plugin_return is not None:
+                for domain, ret in rets:
+                    on_plugin_return(domain, ret)
+            return query_results
+        return await loop.run_in_executor(
+            executor, call_sync_batch_plugin_by_id, plugin_id, domains, on_plugin_return
+        )
+
+    async def router() -> None:
+        """从队列中取出域名，首次查询前先进行 DNS 预检查，再放入该域名 WHOIS 服务器的队列"""
+        while True:
+            query_task = await domain_queue.get()
+            if query_task is None:
+                return
+
+            if await skip_by_precheck(query_task):
+                continue
+
+            whois_server: Optional[str] = resolve_whois_server(query_task)
+            server_queue = server_queues.get(whois_server)
+            if server_queue is None:
+                server_queue = asyncio.Queue(maxsize=max_concurrency * max_batch_size)
+                server_queues[whois_server] = server_queue
+                task_group.create_task(scheduler(whois_server, server_queue))
+            # 该服务器的队列已满时在此等待，实现背压
+            await server_queue.put(query_task)
+
+    async def get_batch(
+        server_queue: asyncio.Queue[Optional[QueryTask]],
+    ) -> Optional[list[QueryTask]]:
+        """从服务器的队列中取出一批域名，凑满 max_batch_size 个或从取出第一个起等待 max_batch_delay 秒后返回
+
+        Args:
+            server_queue (asyncio.Queue[Optional[QueryTask]]): 服务器的待查询队列
+
+        Returns:
+            Optional[list[QueryTask]]: 一批查询任务，取到结束标记且没有任务时为 None
+        """
+        query_task: Optional[QueryTask] = await server_queue.get()
+        if query_task is None:
+            return None
+
+        batch: list[QueryTask] = [query_task]
+        deadline: float = loop.time() + max_batch_delay
+        while len(batch) < max_batch_size:
+            if server_queue.empty():
+                timeout: float = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    query_task = await asyncio.wait_for(server_queue.get(), timeout)
+                except TimeoutError:
+                    break
+            else:
+                query_task = server_queue.get_nowait()
+            if query_task is None:
+                # 结束标记放回，下一次取出时返回 None
+                server_queue.put_nowait(None)
+                break
+            batch.append(query_task)
+        return batch
+
+    async def scheduler(
+        whois_server: Optional[str], server_queue: asyncio.Queue[Optional[QueryTask]]
+    ) -> None:
+        """依次取出发往同一个 WHOIS 服务器的域名，等到该服务器有额度、且全部查询数未满时发起查询
+
+        Args:
+            whois_server (Optional[str]): WHOIS 服务器主机名。为空时不限速
+            server_queue (asyncio.Queue[Optional[QueryTask]]): 该服务器的待查询队列
+        """
+        while True:
+            batch = await get_batch(server_queue)
+            if batch is None:
+                return
+
+            # 一批为一次请求，计为一次查询
+            await rate_limiter.acquire(whois_server)
+            await query_slots.acquire()
+            task_group.create_task(query(whois_server, batch))
+
+    async def query(whois_server: Optional[str], batch: list[QueryTask]) -> None:
+        """查询一批域名（非批量型插件为一个域名），归还额度后立即处理查询结果
+
+        Args:
+            whois_server (Optional[str]): WHOIS 服务器主机名，已由调度协程占用额度
+            batch (list[QueryTask]): 查询任务
+        """
+        query_results: dict[
+            str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]
+        ]
+        try:
+            async with plugin_rate_limiter.limit(plugin_id):
+                start_time: float = time.perf_counter()
+                if max_batch_size > 1:
+                    query_results = await call_batch_plugin(
+                        [query_task.domain for query_task in batch]
                     )
                 else:
-                    raise ValueError("Invaid Data")  # 不可能的路径
+                    query_results = {batch[0].domain: await call_plugin(batch[0].domain)}
+                latency: float = time.perf_counter() - start_time
+        finally:
+            query_slots.release()
+            rate_limiter.release(whois_server)
 
-                # 获取失败的写入 error.txt 文件
-                if error_file is not None:
-                    async with aiofiles.open(error_file, "a", encoding="utf-8") as f:
-                        await f.write(result_domain + "\n")
-                continue
-            case Ok(parsed_whois_data):
-                result_domain = parsed_whois_data["domain"]
-            case _:
-                raise Exception
-
-        domain_status: tuple[
-            bool, Literal["registered", "redemption", "unregistered"]
-        ] = parsed_whois_data["status"]
-
-        # debug 信息用于检查非注册状态域名的 hwhois
-        if domain_status[1] != "registered":
-            debug(message="parsed whois data", data=parsed_whois_data)
-
-        if domain_status[1] == "unregistered":
-            info(INFO_NOT_REGISTER.format(domain=result_domain))
-            # 未注册，写入 output.txt 文件
-            if output_file is not None:
-                async with aiofiles.open(output_file, "a", encoding="utf-8") as f:
-                    await f.write(result_domain + "\n")
-            continue
-        elif domain_status[1] == "redemption":
-            info(INFO_REDEMPTION_PERIOD.format(domain=result_domain))
-            # 赎回期，写入 output.txt 文件
-            if output_file is not None:
-                async with aiofiles.open(output_file, "a", encoding="utf-8") as f:
-                    await f.write(result_domain + "\n")
-            continue
+        for query_task in batch:
+            query_task.latency += latency
+            handle_query_result(
+                query_task, query_results[query_task.domain], whois_server
+            )
+
+    # 插件可选提供 get_all_whois_servers 函数，用于预先解析全部 WHOIS 服务器主机名
+    get_all_whois_servers: Optional[Callable[[], set[str]]] = getattr(
+        plugin_instance, "get_all_whois_servers", None
+    )
+    if dns_prewarm and get_all_whois_servers is not None:
+        whois_servers: set[str] = get_all_whois_servers()
+        resolved_count: int = await dns_cache.prewarm(whois_servers)
+        info(INFO_DNS_PREWARM.format(resolved=resolved_count, total=len(whois_servers)))
 
-        STRICT_MODE: bool = True
+    # 按此顺序关闭，运行日志与完成通知在其他写入器之后写完
+    writers: list[LineWriter] = [
+        writer
+        for writer in (
+            output_writer,
+            error_writer,
+            result_stream_writer,
+            record_writer,
+            cache_writer,
+            journal_writer,
+            batch_done_writer,
+        )
+        if writer is not None
+    ]
+    for writer in writers:
+        writer.start()
 
-        def is_pass_strict_mode(domain: str) -> bool:
-            """有些域名不提供域名信息，所以无法进行严格检查。检查这个域名是否允许跳过检查。
+    is_plugin_set_up: bool = False
+    try:
+        # 插件可选提供 setup 与 teardown 函数，在每个进程的事件循环中各调用一次，用于复用连接池等资源
+        # 在进程池中调用的插件由进程池的每个进程各自调用，见 _init_plugin_process
+        if executor_type != "process":
+            await PluginManager().setup_plugin(plugin_id)
+            is_plugin_set_up = True
 
-            Args:
-                domain (str): 干净的域名如 a.li
+        async with asyncio.TaskGroup() as task_group:
+            task_group.create_task(producer())
+            task_group.create_task(retry_queue.run(domain_queue))
+            task_group.create_task(closer())
+            for _ in range(num_routers):
+                task_group.create_task(router())
+    finally:
+        progress_bar.close()
+        if is_plugin_set_up:
+            await PluginManager().teardown_plugin(plugin_id)
+        if result_cache is not None:
+            result_cache.close()
+        if precheck is not None:
+            precheck.close()
+        for writer in writers:
+            await writer.close()
+        if result_channel is not None:
+            result_channel.put(CHANNEL_DONE)
 
-            Returns:
-                bool: 可跳过返回 True，不可跳过返回 False
-            """
-            # 有些域名不提供域名信息，所以无法进行严格检查
-            if domain.endswith(".li") or domain.endswith(".ch"):
+
+async def _distribute_tasks(
+    input_file: str,
+    task_channel: multiprocessing.queues.Queue,
+    processes: list[multiprocessing.Process],
+    outstanding_batches: dict[int, list[QueryTask]],
+    journal_state: Optional[JournalState] = None,
+    batch_size: int = DEFAULT_TASK_BATCH_SIZE,
+) -> None:
+    """多进程模式下由主进程运行，读取输入文件并将去重后的查询任务分批放入任务队列
+
+    全局去重和从运行日志恢复进度都在此完成，同一个可注册域名只会分发给一个子进程。
+    任务队列已满且全部子进程都已退出时停止分发，不再等待
+
+    Args:
+        input_file (str): 输入文件的路径
+        task_channel (multiprocessing.queues.Queue): 子进程领取任务的队列，每个元素为 (批次编号, 一批查询任务)
+        processes (list[multiprocessing.Process]): 全部子进程，读取完毕后为每个子进程放入一个结束标记 None
+        outstanding_batches (dict[int, list[QueryTask]]): 批次编号-查询任务 键值对，记录已分发但子进程尚未报告完成的批次
+        journal_state (Optional[JournalState], optional): 从运行日志恢复的进度。如果为 None，则从头开始
+        batch_size (int, optional): 每批的域名数
+    """
+    loop = asyncio.get_running_loop()
+    batch_ids = itertools.count()
+
+    async def put(item: Optional[tuple[int, list[QueryTask]]]) -> bool:
+        """放入任务队列，队列已满时在线程中等待，不阻塞写入结果的协程
+
+        Returns:
+            bool: 是否放入成功。全部子进程都已退出时为 False
+        """
+        while True:
+            try:
+                await loop.run_in_executor(
+                    None, task_channel.put, item, True, TASK_CHANNEL_PUT_TIMEOUT
+                )
                 return True
-            return False
+            except queue.Full:
+                if not any(p.is_alive() for p in processes):
+                    return False
 
-        if STRICT_MODE and not is_pass_strict_mode(domain=result_domain):
-            # 严格检查
-            # 为了保险，再检查下时间是否是过期的。
-            # 检查“是否为赎回期”可能有缺漏，但是可以明确的是赎回期的特征：有域名过期时间但是时间过期了
-            # 查询时间
-            match parsed_whois_data["registry_expiry_date"]:
-                case Err(datetime_paser_error):
-                    # 时间解析失败
-                    if datetime_paser_error["msg"] == "Error Parsing Date":
-                        info(
-                            f"{INFO_ERROR_PARSING_DATE} err:{datetime_paser_error['err']} raw:{datetime_paser_error['raw']}".format(
-                                domain=result_domain
-                            )
-                        )
-                    elif datetime_paser_error["msg"] == "Date not found":
-                        info(
-                            f"{INFO_DATE_NOT_FOUND} raw:{datetime_paser_error['raw']}".format(
-                                domain=result_domain
-                            )
-                        )
-                    else:
-                        raise ValueError("Invaid Data")  # 不可能的路径
+    async def put_batch(batch: list[QueryTask]) -> bool:
+        batch_id = next(batch_ids)
+        for query_task in batch:
+            query_task.batch_id = batch_id
+        # 先记录再放入，子进程领取后立即退出时也能找到这一批
+        outstanding_batches[batch_id] = batch
+        return await put((batch_id, batch))
 
-                    # 解析失败的写入 error.txt 文件
-                    if error_file is not None:
-                        async with aiofiles.open(error_file, "a", encoding="utf-8") as f:
-                            await f.write(result_domain + "\n")
-                    continue
-                case Ok(expired_date):
-                    pass
-                case _:
-                    exit(-1)
-
-            # 计算查到的时间是否过期
-            is_expired_result: Result[bool, Exception] = is_datetime_expired(expired_date)
-            match is_expired_result:
-                case Err(e):
-                    # 在检查时间是否过期的时候出现错误
-                    info(f"{INFO_CHECKING_DATE_EXPIRED} {e}".format(domain=result_domain))
-                    # 解析失败的写入 error.txt 文件
-                    if error_file is not None:
-                        async with aiofiles.open(error_file, "a", encoding="utf-8") as f:
-                            await f.write(result_domain + "\n")
-                    continue
-                case Ok(is_expired):
-                    pass
-
-            # 判断是否过期
-            if is_expired:
-                info(INFO_EXPIRED.format(domain=result_domain))
-                # 已过期的写入 output.txt 文件
-                if output_file is not None:
-                    async with aiofiles.open(output_file, "a", encoding="utf-8") as f:
-                        await f.write(result_domain + "\n")
+    batch: list[QueryTask] = []
+    async for query_task in _read_query_tasks(input_file, journal_state):
+        batch.append(query_task)
+        if len(batch) >= batch_size:
+            if not await put_batch(batch):
+                return
+            batch = []
+
+    if batch and not await put_batch(batch):
+        return
+    for _ in processes:
+        if not await put(None):
+            return
+
+
+async def _collect_results(
+    result_channel: multiprocessing.queues.Queue,
+    processes: list[multiprocessing.Process],
+    sink_files: dict[str, Optional[str]],
+    outstanding_batches: dict[int, list[QueryTask]],
+    result_cache: Optional[ResultCache] = None,
+) -> None:
+    """多进程模式下由主进程运行，接收各子进程发回的结果并统一批量写入文件
+
+    全部子进程发送结束消息或全部子进程都已退出时返回
+
+    Args:
+        result_channel (multiprocessing.queues.Queue): 子进程发送结果的队列
+        processes (list[multiprocessing.Process]): 全部子进程
+        sink_files (dict[str, Optional[str]]): 写入目标名-文件路径 键值对，路径为 None 的不写入
+        outstanding_batches (dict[int, list[QueryTask]]): 已分发但尚未完成的批次，收到子进程的完成通知后移除
+        result_cache (Optional[ResultCache], optional): 写入子进程发来的要缓存的结果。如果为 None，则不使用缓存
+    """
+    loop = asyncio.get_running_loop()
+    writers: dict[str, BufferedFileWriter] = {
+        sink: BufferedFileWriter(path)
+        for sink, path in sink_files.items()
+        if path is not None and sink != "journal"
+    }
+    # 运行日志在其他文件写入对应的行之后写入，且最后关闭
+    journal_file: Optional[str] = sink_files.get("journal")
+    if journal_file is not None:
+        writers["journal"] = BufferedFileWriter(
+            journal_file, flush_before=list(writers.values())
+        )
+    for writer in writers.values():
+        writer.start()
+
+    remaining_count: int = len(processes)
+    try:
+        while remaining_count > 0:
+            try:
+                message: ChannelMessage = await loop.run_in_executor(
+                    None, result_channel.get, True, 1.0
+                )
+            except queue.Empty:
+                # 子进程异常退出时不会发送结束消息，全部子进程都退出后不再等待
+                if not any(p.is_alive() for p in processes):
+                    break
+                continue
+
+            if message == CHANNEL_DONE:
+                remaining_count -= 1
+                continue
+
+            sink, lines = message
+            if sink == "batch_done":
+                for line in lines:
+                    outstanding_batches.pop(int(line), None)
+                continue
+            if sink == "cache":
+                if result_cache is not None:
+                    for line in lines:
+                        result_cache.put_entry(line)
                 continue
+            for line in lines:
+                writers[sink].write(line)
+    finally:
+        for writer in writers.values():
+            await writer.close()
 
-        # 输出未过期的
-        info(INFO_NOT_EXPIRED.format(domain=result_domain))
+
+def _create_writer(
+    path: Optional[str],
+    sink: str,
+    result_channel: Optional[multiprocessing.queues.Queue],
+    flush_before: Sequence[Optional[LineWriter]] = (),
+) -> Optional[LineWriter]:
+    """创建结果写入器
+
+    Args:
+        path (Optional[str]): 文件路径。如果为 None，则不写入
+        sink (str): 写入目标名
+        result_channel (Optional[multiprocessing.queues.Queue]): 多进程模式下发送结果给主进程的队列
+        flush_before (Sequence[Optional[LineWriter]], optional): 每次写入前需先写完的写入器，为 None 的忽略
+
+    Returns:
+        Optional[LineWriter]: 单进程模式下直接写文件的写入器，多进程模式下发送给主进程的写入器
+    """
+    if path is None:
+        return None
+    if result_channel is not None:
+        return ChannelWriter(
+            result_channel,
+            sink,
+            flush_before=[
+                writer for writer in flush_before if isinstance(writer, ChannelWriter)
+            ],
+        )
+    return BufferedFileWriter(
+        path,
+        flush_before=[
+            writer for writer in flush_before if isinstance(writer, BufferedFileWriter)
+        ],
+    )
 
 
 def worker(
-    file_part: str,
+    input_file: Optional[str],
     output_file: Optional[str],
     error_file: Optional[str],
     max_num_threads_per_process: Optional[int],
+    max_concurrency_per_process: Optional[int],
     plugin_id: str,
+    rate_limit_config: RateLimitConfigDict,
+    max_retries: int,
+    cache_file: Optional[str],
+    journal_file: Optional[str] = None,
+    journal_state: Optional[JournalState] = None,
+    result_stream_file: Optional[str] = None,
+    record_file: Optional[str] = None,
+    dns_prewarm: bool = False,
+    dns_precheck: bool = False,
+    dns_resolver: Optional[str] = None,
+    task_channel: Optional[multiprocessing.queues.Queue] = None,
+    result_channel: Optional[multiprocessing.queues.Queue] = None,
 ):
     """一个 worker 对应一个进程，用于启动协程任务
 
     Args:
-        file_part (str): 要处理的文件
+        input_file (Optional[str]): 要处理的文件。多进程模式下为 None
         output_file (Optional[str]): 输出文件的路径
         error_file (Optional[str]): 错误日志文件的路径
-        max_num_threads_per_process (Optional[int]): 最大线程数
+        max_num_threads_per_process (Optional[int]): 最大线程数，插件声明 executor 为 process 时为进程池的进程数。如果为 None，则与最大并发查询数一致，两者都为 None 时使用默认值
+        max_concurrency_per_process (Optional[int]): 最大并发查询数。如果为 None，异步型插件使用 DEFAULT_MAX_CONCURRENCY，同步型插件与线程数一致
+        plugin_id (str): 使用的插件 id
+        rate_limit_config (RateLimitConfigDict): 本进程使用的按 WHOIS 服务器限速配置，plugin 项为插件的整体限速
+        max_retries (int): 单个域名查询失败后最多重试的次数
+        cache_file (Optional[str]): 查询结果缓存数据库的路径
+        journal_file (Optional[str], optional): 运行日志文件的路径
+        journal_state (Optional[JournalState], optional): 从运行日志恢复的进度，仅单进程模式下使用
+        result_stream_file (Optional[str], optional): 结构化结果流（JSON Lines）文件的路径
+        record_file (Optional[str], optional): 录制插件原始返回值的归档文件路径
+        dns_prewarm (bool, optional): 是否在开始查询前预先解析全部 WHOIS 服务器主机名
+        dns_precheck (bool, optional): 是否在查询 WHOIS 前先检查域名的 DNS 委派
+        dns_resolver (Optional[str], optional): DNS 预检查使用的 DNS 服务器
+        task_channel (Optional[multiprocessing.queues.Queue], optional): 多进程模式下领取待查询域名的队列
+        result_channel (Optional[multiprocessing.queues.Queue], optional): 多进程模式下发送结果给主进程的队列
     """
-    with ThreadPoolExecutor(
-        max_workers=max_num_threads_per_process
-    ) as thread_pool_executor:
+    # 以 spawn 方式启动的子进程不会继承主进程加载的插件，需重新加载
+    if plugin_id not in PluginManager().get_all_plugin_ids():
+        PluginManager().load_plugin(plugin_dir_path="plugins")
+
+    plugin_instance: ModuleType = PluginManager().get_plugin_instance_by_id(plugin_id)
+    executor_type: Literal["inline", "thread", "process"] = _get_executor_type(
+        plugin_instance.METADATA
+    )
+
+    max_workers: Optional[int] = (
+        max_num_threads_per_process
+        if max_num_threads_per_process is not None
+        else max_concurrency_per_process
+    )
+    executor: Optional[Executor] = None
+    num_workers: int = 1  # 同时调用插件的线程数或进程数
+    if executor_type == "thread":
+        thread_pool_executor = ThreadPoolExecutor(max_workers=max_workers)
+        num_workers = thread_pool_executor._max_workers
+        executor = thread_pool_executor
+    elif executor_type == "process":
+        num_workers = max_workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_plugin_process,
+            initargs=(plugin_id,),
+        )
+
+    try:
+        max_concurrency: int
+        if max_concurrency_per_process is not None:
+            max_concurrency = max_concurrency_per_process
+        elif _get_max_batch_size(plugin_instance) > 1:
+            # 批量型插件每次查询多个域名，少量并发即可
+            max_concurrency = DEFAULT_MAX_BATCH_CONCURRENCY
+        elif plugin_instance.METADATA["mode"] == "async":
+            max_concurrency = DEFAULT_MAX_CONCURRENCY
+        else:
+            # 同步型插件的并发数受线程数（进程数）限制，更多的并发查询只会排队。在事件循环中直接调用时只能为 1
+            max_concurrency = num_workers
+
         asyncio.run(
             main_async(
-                file_part=file_part,
+                input_file=input_file,
                 output_file=output_file,
                 error_file=error_file,
                 plugin_id=plugin_id,
-                thread_pool_executor=thread_pool_executor,
+                max_concurrency=max_concurrency,
+                rate_limit_config=rate_limit_config,
+                max_retries=max_retries,
+                cache_file=cache_file,
+                journal_file=journal_file,
+                journal_state=journal_state,
+                result_stream_file=result_stream_file,
+                record_file=record_file,
+                dns_prewarm=dns_prewarm,
+                dns_precheck=dns_precheck,
+                dns_resolver=dns_resolver,
+                executor=executor,
+                task_channel=task_channel,
+                result_channel=result_channel,
             )
         )
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
 
 def main(
@@ -271,6 +1250,17 @@ def main(
     num_processes: int,
     max_num_threads_per_process: Optional[int],
     plugin_id: Optional[str],
+    max_concurrency_per_process: Optional[int] = None,
+    rate_limit_config_file: Optional[str] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    cache_file: Optional[str] = None,
+    journal_file: Optional[str] = None,
+    resume: bool = False,
+    result_stream_file: Optional[str] = None,
+    record_file: Optional[str] = None,
+    dns_prewarm: bool = False,
+    dns_precheck: bool = False,
+    dns_resolver: Optional[str] = None,
 ):
     """主函数，用于处理输入文件并将结果输出到指定文件
 
@@ -280,9 +1270,22 @@ def main(
         error_file (Optional[str]): 错误日志文件的路径。如果为 None，则不输出错误日志文件
         num_processes (int): 进程数量。如果为 1，则使用单进程模式；否则使用多进程模式
         max_num_threads_per_process (Optional[int]): 每个进程的最大线程数。如果为 None，则使用默认线程数，在 Python 3.13 环境下，默认线程数为 min(32, (os.process_cpu_count() or 1) + 4)
+        plugin_id (Optional[str]): 使用的插件 id。如果为 None，则优先使用 async_query
+        max_concurrency_per_process (Optional[int]): 每个进程的最大并发查询数。如果为 None，则按插件类型自动决定。插件在 METADATA 中声明了 max_concurrency 时，不超过其平均分给每个进程的值
+        rate_limit_config_file (Optional[str]): 按 WHOIS 服务器限速的 JSON 配置文件路径。如果为 None，则不按服务器限速，插件使用 METADATA 中声明的整体限速。配置的限速为全部进程合计的限速
+        max_retries (int): 单个域名查询失败后最多重试的次数。如果为 0，则不重试
+        cache_file (Optional[str]): 查询结果缓存数据库的路径。如果为 None，则不使用缓存
+        journal_file (Optional[str]): 运行日志文件的路径。如果为 None，则不记录
+        resume (bool): 是否从运行日志继续上次中断的查询。如果为 False，则清空已有的运行日志
+        result_stream_file (Optional[str]): 结构化结果流（JSON Lines）文件的路径。如果为 None，则不写入
+        record_file (Optional[str]): 录制插件原始返回值的归档文件路径。如果为 None，则不录制
+        dns_prewarm (bool): 是否在开始查询前预先解析插件可能连接的全部 WHOIS 服务器主机名
+        dns_precheck (bool): 是否在查询 WHOIS 前先查询域名的 NS 记录，有有效委派的域名视为已注册，不再查询 WHOIS
+        dns_resolver (Optional[str]): DNS 预检查使用的 DNS 服务器，host 或 host:port 格式。如果为 None，则使用系统配置的 DNS 服务器
     Raises:
         ValueError("Number of processes must be at least 1"): 进程数至少应该为 1
         ValueError("Max number of threads per process must be at least 1"): 线程数至少应该为 1
+        ValueError("Resume requires a journal file"): 继续上次的查询需要指定运行日志文件
     """
     if len(PluginManager().get_all_plugin_ids()) == 0:
         raise ValueError(CLI_ERROR_NO_AVAILABLE_PLUGIN)
@@ -301,34 +1304,109 @@ def main(
         raise ValueError("Number of processes must be at least 1")
     if max_num_threads_per_process is not None and max_num_threads_per_process < 1:
         raise ValueError("Max number of threads per process must be at least 1")
+    if max_concurrency_per_process is not None and max_concurrency_per_process < 1:
+        raise ValueError("Max concurrency per process must be at least 1")
+    if max_retries < 0:
+        raise ValueError("Max retries must be at least 0")
+    if resume and journal_file is None:
+        raise ValueError("Resume requires a journal file")
+
+    journal_state: Optional[JournalState] = None
+    if journal_file is not None:
+        if resume:
+            journal_state = load_journal(journal_file)
+            info(
+                INFO_RESUME.format(
+                    completed=len(journal_state.completed_domains),
+                    retry=len(journal_state.retry_attempts),
+                )
+            )
+        else:
+            # 不继续上次的查询时，从空的运行日志开始记录
+            open(journal_file, "w", encoding="utf-8").close()
+
+    plugin_metadata_dict: PluginMetadataDict = (
+        PluginManager().get_plugin_instance_by_id(plugin_id).METADATA
+    )
+
+    # 插件声明的最大并发数为全部进程合计的并发数，平均分给每个进程
+    if "max_concurrency" in plugin_metadata_dict:
+        plugin_max_concurrency_per_process: int = max(
+            1, math.ceil(plugin_metadata_dict["max_concurrency"] / num_processes)
+        )
+        max_concurrency_per_process = (
+            plugin_max_concurrency_per_process
+            if max_concurrency_per_process is None
+            else min(max_concurrency_per_process, plugin_max_concurrency_per_process)
+        )
 
-    # 进程数为 1，不分割文件
+    # 配置的限速为全部进程合计的限速，平均分给每个进程
+    rate_limit_config: RateLimitConfigDict = scale_rate_limit_config(
+        load_rate_limit_config(
+            rate_limit_config_file, plugin_metadata_dict.get("rate_limit")
+        ),
+        num_processes,
+    )
+
+    # 进程数为 1，直接在本进程中查询
     if num_processes == 1:
         worker(
-            file_part=input_file,
+            input_file=input_file,
             output_file=output_file,
             error_file=error_file,
             max_num_threads_per_process=max_num_threads_per_process,
+            max_concurrency_per_process=max_concurrency_per_process,
             plugin_id=plugin_id,
+            rate_limit_config=rate_limit_config,
+            max_retries=max_retries,
+            cache_file=cache_file,
+            journal_file=journal_file,
+            journal_state=journal_state,
+            result_stream_file=result_stream_file,
+            record_file=record_file,
+            dns_prewarm=dns_prewarm,
+            dns_precheck=dns_precheck,
+            dns_resolver=dns_resolver,
         )
         return
 
-    # 进程数 > 1 分割文件
-    file_parts = split_file(input_file, num_processes)
+    # 进程数 > 1，主进程读取输入文件并分批分发给常驻的子进程，子进程处理完一批再领取下一批
+    # 任务队列有上限，避免主进程读取速度远快于查询速度时占用大量内存
+    task_channel: multiprocessing.queues.Queue = multiprocessing.Queue(
+        maxsize=num_processes * 2
+    )
+    # 子进程不直接写文件，而是把结果发送给主进程，由主进程统一写入
+    result_channel: multiprocessing.queues.Queue = multiprocessing.Queue()
+    # 缓存同样只由主进程写入。在启动子进程前打开，子进程打开时数据表已经存在
+    result_cache: Optional[ResultCache] = (
+        ResultCache(cache_file) if cache_file is not None else None
+    )
 
     # 创建进程
     processes = []
-    for file_part in file_parts:
+    for _ in range(num_processes):
         processes.append(
             multiprocessing.Process(
                 target=worker,
-                args=(
-                    file_part,
-                    output_file,
-                    error_file,
-                    max_num_threads_per_process,
-                    plugin_id,
-                ),
+                kwargs={
+                    "input_file": None,
+                    "output_file": output_file,
+                    "error_file": error_file,
+                    "max_num_threads_per_process": max_num_threads_per_process,
+                    "max_concurrency_per_process": max_concurrency_per_process,
+                    "plugin_id": plugin_id,
+                    "rate_limit_config": rate_limit_config,
+                    "max_retries": max_retries,
+                    "cache_file": cache_file,
+                    "journal_file": journal_file,
+                    "result_stream_file": result_stream_file,
+                    "record_file": record_file,
+                    "dns_prewarm": dns_prewarm,
+                    "dns_precheck": dns_precheck,
+                    "dns_resolver": dns_resolver,
+                    "task_channel": task_channel,
+                    "result_channel": result_channel,
+                },
             )
         )
 
@@ -336,14 +1414,61 @@ def main(
     for p in processes:
         p.start()
 
-    # 等待进程结束
+    # 已分发但子进程尚未报告完成的批次，子进程异常退出时据此找出丢失的任务
+    outstanding_batches: dict[int, list[QueryTask]] = {}
+
+    async def run_parent() -> None:
+        # 分发任务的同时写入子进程发回的结果，需在等待进程结束前取空结果队列，否则子进程无法退出
+        distribute_task = asyncio.create_task(
+            _distribute_tasks(
+                input_file=input_file,
+                task_channel=task_channel,
+                processes=processes,
+                outstanding_batches=outstanding_batches,
+                journal_state=journal_state,
+            )
+        )
+        try:
+            await _collect_results(
+                result_channel=result_channel,
+                processes=processes,
+                sink_files={
+                    "output": output_file,
+                    "error": error_file,
+                    "journal": journal_file,
+                    "result_stream": result_stream_file,
+                    "record": record_file,
+                },
+                outstanding_batches=outstanding_batches,
+                result_cache=result_cache,
+            )
+        finally:
+            # 全部子进程都已退出时不再分发。分发正常结束时取消无效果，其中的异常照常抛出
+            distribute_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await distribute_task
+
+    try:
+        asyncio.run(run_parent())
+    finally:
+        if result_cache is not None:
+            result_cache.close()
+
+    # 子进程异常退出时，已分发但未完成的域名写入错误日志，不会静默丢失
+    lost_tasks: list[QueryTask] = [
+        query_task for batch in outstanding_batches.values() for query_task in batch
+    ]
+    if lost_tasks:
+        info(INFO_LOST_TASKS.format(count=len(lost_tasks)))
+        if error_file is not None:
+            with open(error_file, "a", encoding="utf-8") as f:
+                f.writelines(f"{query_task.domain}\n" for query_task in lost_tasks)
+
+    # 等待进程结束。子进程可能未领取完队列中剩余的任务，不等待写入任务队列的线程
+    task_channel.cancel_join_thread()
     for p in processes:
         p.join()
 
-    # 删除临时文件
-    for file_part in file_parts:
-        os.remove(file_part)
-
 
 if __name__ == "__main__":
     # 加载插件
@@ -376,6 +1501,17 @@ if __name__ == "__main__":
         num_processes=run_args.num_processes,
         max_num_threads_per_process=run_args.max_num_threads_per_process,
         plugin_id=run_args.plugin_id,
+        max_concurrency_per_process=run_args.max_concurrency_per_process,
+        rate_limit_config_file=run_args.rate_limit_config_file,
+        max_retries=run_args.max_retries,
+        cache_file=run_args.cache_file,
+        journal_file=run_args.journal_file,
+        resume=run_args.resume,
+        result_stream_file=run_args.result_stream_file,
+        record_file=run_args.record_file,
+        dns_prewarm=run_args.dns_prewarm,
+        dns_precheck=run_args.dns_precheck,
+        dns_resolver=run_args.dns_resolver,
     )
     end_time: float = time.time()
     info(f"Total time taken: {end_time - start_time:.3f} seconds")
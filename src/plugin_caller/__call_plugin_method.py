@@ -1,24 +1,64 @@
+from typing import Callable, Optional
+
 from src.defined_types import Err, Ok, ParsedWhoisData, PluginReturnDict, Result
 from src.defined_types.domain_query_result import ExceptionErrResult, MsgErrResult
 from src.plugin_manager import PluginManager
+from src.utils.date_utils import datetime_string_parser
 from src.utils.whois_parser import whois_parser
 
+# 常见的限流提示，插件返回 code 200 时也按限流处理
+THROTTLED_RESPONSE_MESSAGES: tuple[str, ...] = (
+    "Your access is too fast,please try again later.",
+    "Queried interval is too short.",
+)
 
-def call_sync_plugin_by_id(
-    id: str, domain: str
+
+def _parse_plugin_return(ret: PluginReturnDict, domain: str) -> ParsedWhoisData:
+    """解析插件的返回值。插件提供了结构化的 status 时直接使用，否则解析原始 whois 数据
+
+    Args:
+        ret (PluginReturnDict): 插件的返回值，code 为 200
+        domain (str): 查询的域名
+
+    Returns:
+        ParsedWhoisData: 解析后的 Whois 结构化数据
+    """
+    if "status" not in ret:
+        return whois_parser(ret["raw"], domain)
+
+    raw: str = str(ret["raw"])
+    expiry_date: Optional[str] = ret.get("expiry_date")
+    return {
+        "domain": domain,
+        "status": (ret["status"] != "unregistered", ret["status"]),
+        "raw": raw,
+        "registry_expiry_date": (
+            datetime_string_parser(expiry_date)
+            if expiry_date
+            else Err(
+                {
+                    "msg": "Date not found",
+                    "err": ValueError("Date not found"),
+                    "raw": raw,
+                }
+            )
+        ),
+    }
+
+
+def _to_query_result(
+    domain: str, ret: PluginReturnDict
 ) -> Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]:
-    """调用指定 id 插件查询对应 domain 的 whois 数据，插件为同步类型
+    """将单个域名的插件返回值转为查询结果。单个查询与批量查询共用
 
     Args:
-        id (str): 指定 id
         domain (str): 域名
+        ret (PluginReturnDict): 插件的返回值
 
     Returns:
-        ParsedWhoisData: 解析后的 Whois 结构化数据
+        Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]: 查询结果
     """
     try:
-        ret: PluginReturnDict = PluginManager().get_plugin_instance_by_id(id).main(domain)
-
         if ret["code"] != 200:
             # MsgErrResult
             return Err({"domain": domain, "msg": str(ret["raw"]), "code": ret["code"]})
@@ -29,30 +69,52 @@ def call_sync_plugin_by_id(
             )
 
         # 预判常见的 API 错误返回，防止插件作者漏判，导致最终域名误判为未注册
-        if any(
-            msg in ret["raw"]
-            for msg in [
-                "Your access is too fast,please try again later.",
-                "Queried interval is too short.",
-            ]
-        ):
+        if any(msg in ret["raw"] for msg in THROTTLED_RESPONSE_MESSAGES):
             # MsgErrResult
             return Err({"domain": domain, "msg": str(ret["raw"]), "code": 503})
 
-        return Ok({**whois_parser(ret["raw"]), "domain": domain})
+        return Ok(_parse_plugin_return(ret, domain))
+    except Exception as e:
+        # ExceptionErrResult
+        return Err({"domain": domain, "err": e})
+
+
+def call_sync_plugin_by_id(
+    id: str,
+    domain: str,
+    on_plugin_return: Optional[Callable[[PluginReturnDict], None]] = None,
+) -> Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]:
+    """调用指定 id 插件查询对应 domain 的 whois 数据，插件为同步类型
+
+    Args:
+        id (str): 指定 id
+        domain (str): 域名
+        on_plugin_return (Optional[Callable[[PluginReturnDict], None]], optional): 插件返回后、解析前以插件的原始返回值调用，用于录制
+
+    Returns:
+        ParsedWhoisData: 解析后的 Whois 结构化数据
+    """
+    try:
+        ret: PluginReturnDict = PluginManager().get_plugin_instance_by_id(id).main(domain)
+        if on_plugin_return is not None:
+            on_plugin_return(ret)
     except Exception as e:
         # ExceptionErrResult
         return Err({"domain": domain, "err": e})
+    return _to_query_result(domain, ret)
 
 
 async def call_async_plugin_by_id(
-    id: str, domain: str
+    id: str,
+    domain: str,
+    on_plugin_return: Optional[Callable[[PluginReturnDict], None]] = None,
 ) -> Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]:
     """调用指定 id 插件查询对应 domain 的 whois 数据，插件为异步类型
 
     Args:
         id (str): 指定 id
         domain (str): 域名
+        on_plugin_return (Optional[Callable[[PluginReturnDict], None]], optional): 插件返回后、解析前以插件的原始返回值调用，用于录制
 
     Returns:
         ParsedWhoisData: 解析后的 Whois 结构化数据
@@ -61,17 +123,91 @@ async def call_async_plugin_by_id(
         ret: PluginReturnDict = (
             await PluginManager().get_plugin_instance_by_id(id).main(domain)
         )
+        if on_plugin_return is not None:
+            on_plugin_return(ret)
+    except Exception as e:
+        # ExceptionErrResult
+        return Err({"domain": domain, "err": e})
+    return _to_query_result(domain, ret)
 
-        if ret["code"] != 200:
-            # MsgErrResult
-            return Err({"domain": domain, "msg": str(ret["raw"]), "code": ret["code"]})
 
-        if ret["raw"] == "":
-            return Err(
-                {"domain": domain, "msg": "Empty query result", "code": ret["code"]}
+def _to_batch_query_results(
+    domains: list[str],
+    rets: dict[str, PluginReturnDict],
+    on_plugin_return: Optional[Callable[[str, PluginReturnDict], None]],
+) -> dict[str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]]:
+    """将批量查询的插件返回值按域名拆分为各自的查询结果
+
+    Args:
+        domains (list[str]): 查询的域名
+        rets (dict[str, PluginReturnDict]): 插件的返回值，域名-返回值 键值对
+        on_plugin_return (Optional[Callable[[str, PluginReturnDict], None]]): 以每个域名及其原始返回值调用，用于录制
+
+    Returns:
+        dict[str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]]: 域名-查询结果 键值对，包含全部查询的域名
+    """
+    query_results: dict[
+        str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]
+    ] = {}
+    for domain in domains:
+        ret: Optional[PluginReturnDict] = rets.get(domain)
+        if ret is None:
+            # 插件漏掉的域名按服务器错误处理，之后会重试
+            query_results[domain] = Err(
+                {"domain": domain, "msg": "Missing in batch result", "code": 500}
             )
+            continue
+        if on_plugin_return is not None:
+            on_plugin_return(domain, ret)
+        query_results[domain] = _to_query_result(domain, ret)
+    return query_results
+
+
+def call_sync_batch_plugin_by_id(
+    id: str,
+    domains: list[str],
+    on_plugin_return: Optional[Callable[[str, PluginReturnDict], None]] = None,
+) -> dict[str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]]:
+    """调用指定 id 插件的 main_batch 一次查询多个域名的 whois 数据，插件为同步类型
+
+    Args:
+        id (str): 指定 id
+        domains (list[str]): 域名
+        on_plugin_return (Optional[Callable[[str, PluginReturnDict], None]], optional): 插件返回后、解析前以每个域名及其原始返回值调用，用于录制
 
-        return Ok({**whois_parser(ret["raw"]), "domain": domain})
+    Returns:
+        dict[str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]]: 域名-查询结果 键值对，包含全部查询的域名
+    """
+    try:
+        rets: dict[str, PluginReturnDict] = (
+            PluginManager().get_plugin_instance_by_id(id).main_batch(domains)
+        )
     except Exception as e:
         # ExceptionErrResult
-        return Err({"domain": domain, "err": e})
+        return {domain: Err({"domain": domain, "err": e}) for domain in domains}
+    return _to_batch_query_results(domains, rets, on_plugin_return)
+
+
+async def call_async_batch_plugin_by_id(
+    id: str,
+    domains: list[str],
+    on_plugin_return: Optional[Callable[[str, PluginReturnDict], None]] = None,
+) -> dict[str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]]:
+    """调用指定 id 插件的 main_batch 一次查询多个域名的 whois 数据，插件为异步类型
+
+    Args:
+        id (str): 指定 id
+        domains (list[str]): 域名
+        on_plugin_return (Optional[Callable[[str, PluginReturnDict], None]], optional): 插件返回后、解析前以每个域名及其原始返回值调用，用于录制
+
+    Returns:
+        dict[str, Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]]: 域名-查询结果 键值对，包含全部查询的域名
+    """
+    try:
+        rets: dict[str, PluginReturnDict] = (
+            await PluginManager().get_plugin_instance_by_id(id).main_batch(domains)
+        )
+    except Exception as e:
+        # ExceptionErrResult
+        return {domain: Err({"domain": domain, "err": e}) for domain in domains}
+    return _to_batch_query_results(domains, rets, on_plugin_return)
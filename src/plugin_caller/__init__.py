@@ -1 +1,6 @@
-from .__call_plugin_method import call_async_plugin_by_id, call_sync_plugin_by_id
+from .__call_plugin_method import (
+    call_async_batch_plugin_by_id,
+    call_async_plugin_by_id,
+    call_sync_batch_plugin_by_id,
+    call_sync_plugin_by_id,
+)
@@ -1,4 +1,5 @@
 import importlib
+import inspect
 import os
 import sys
 import traceback
@@ -143,6 +144,40 @@ class PluginManager(metaclass=SingletonMeta):
         """
         return self._loaded_plugin[id]
 
+    async def setup_plugin(self, id: str) -> None:
+        """调用指定 id 插件的 setup 函数（可选，同步或异步均可），用于创建在整个查询过程中复用的资源
+
+        每个进程的事件循环中调用一次
+
+        Args:
+            id (str): id
+        """
+        await self._call_plugin_hook(id, "setup")
+
+    async def teardown_plugin(self, id: str) -> None:
+        """调用指定 id 插件的 teardown 函数（可选，同步或异步均可），用于释放 setup 创建的资源
+
+        在调用 setup 的同一个事件循环中调用
+
+        Args:
+            id (str): id
+        """
+        await self._call_plugin_hook(id, "teardown")
+
+    async def _call_plugin_hook(self, id: str, name: str) -> None:
+        """调用插件的可选函数，返回值可等待时等待其完成
+
+        Args:
+            id (str): id
+            name (str): 函数名
+        """
+        hook = getattr(self.get_plugin_instance_by_id(id), name, None)
+        if hook is None:
+            return
+        ret = hook()
+        if inspect.isawaitable(ret):
+            await ret
+
     def get_all_plugin_ids(self) -> list[str]:
         """获取全部加载的插件 id
 
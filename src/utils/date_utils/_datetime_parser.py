@@ -1,10 +1,29 @@
 import datetime
+import functools
+import re
+from typing import Optional
 
 from dateutil import parser
 
 from src.defined_types import Err, Ok, Result
 from src.defined_types.datetime_parser_result import DatetimeParserErrResult
 
+# 缓存的不同日期字符串数量上限。同一注册局的过期时间常常只有日期，重复率高
+DATETIME_CACHE_SIZE: int = 4096
+
+# ISO 8601 日历日期，可带时间与时区。只有这种写法交给 datetime.fromisoformat，避免周日期、序数日期等与 dateutil 结果不一致
+_ISO_DATETIME_PATTERN: re.Pattern[str] = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}(?::?\d{2})?)?)?"
+)
+
+# 常见注册局写法与对应的 strptime 格式，只收录与 dateutil 解析结果相同的写法
+_REGISTRY_DATETIME_FORMATS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"\d{1,2}-[A-Za-z]{3}-\d{4}"), "%d-%b-%Y"),  # .uk 12-Feb-2026
+    (re.compile(r"\d{4}/\d{2}/\d{2}"), "%Y/%m/%d"),  # .jp 2025/01/01
+    (re.compile(r"\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}"), "%Y/%m/%d %H:%M:%S"),
+    (re.compile(r"\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}"), "%Y.%m.%d %H:%M:%S"),
+)
+
 
 def datetime_string_parser(
     original_datetime: str,
@@ -19,12 +38,49 @@ def datetime_string_parser(
         Result[datetime.datetime, DatetimeParserErrResult]: 表示解析后的日期和时间的 datetime 对象，时区为 utc
     """
     try:
-        parsed_datatime: datetime.datetime = parser.parse(original_datetime.strip())
-
-        # 没有时区信息默认 utc
-        if parsed_datatime.tzinfo is None:
-            return Ok(parsed_datatime.replace(tzinfo=datetime.timezone.utc))
-        # 有则转换为 utc
-        return Ok(parsed_datatime.astimezone(datetime.timezone.utc))
+        return Ok(_parse_datetime_string(original_datetime.strip()))
     except Exception as e:
         return Err({"msg": "Error Parsing Date", "err": e, "raw": original_datetime})
+
+
+@functools.lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _parse_datetime_string(datetime_string: str) -> datetime.datetime:
+    """解析日期和时间的字符串，结果按字符串缓存。解析失败时抛出异常，不缓存
+
+    先尝试 ISO 8601 与常见注册局写法，都不符合时才使用 dateutil
+
+    Args:
+        datetime_string (str): 去掉首尾空白的日期和时间的字符串表示
+
+    Returns:
+        datetime.datetime: 解析后的 datetime 对象，时区为 utc
+    """
+    parsed_datetime: Optional[datetime.datetime] = _parse_known_format(datetime_string)
+    if parsed_datetime is None:
+        parsed_datetime = parser.parse(datetime_string)
+
+    # 没有时区信息默认 utc
+    if parsed_datetime.tzinfo is None:
+        return parsed_datetime.replace(tzinfo=datetime.timezone.utc)
+    # 有则转换为 utc
+    return parsed_datetime.astimezone(datetime.timezone.utc)
+
+
+def _parse_known_format(datetime_string: str) -> Optional[datetime.datetime]:
+    """按 ISO 8601 与常见注册局写法解析日期和时间的字符串
+
+    Args:
+        datetime_string (str): 去掉首尾空白的日期和时间的字符串表示
+
+    Returns:
+        Optional[datetime.datetime]: 解析后的 datetime 对象，不符合已知写法或解析失败时为 None
+    """
+    try:
+        if _ISO_DATETIME_PATTERN.fullmatch(datetime_string):
+            return datetime.datetime.fromisoformat(datetime_string)
+        for pattern, datetime_format in _REGISTRY_DATETIME_FORMATS:
+            if pattern.fullmatch(datetime_string):
+                return datetime.datetime.strptime(datetime_string, datetime_format)
+    except ValueError:
+        pass
+    return None
@@ -0,0 +1,6 @@
+from ._dns_cache import (
+    DnsCache,
+    create_cached_connection,
+    dns_cache,
+    open_cached_connection,
+)
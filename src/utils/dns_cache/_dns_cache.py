@@ -0,0 +1,221 @@
+import asyncio
+import socket
+import threading
+import time
+from typing import Any, Iterable, Optional
+
+DEFAULT_DNS_TTL: float = 300.0  # 解析结果的缓存秒数
+NEGATIVE_DNS_TTL: float = 10.0  # 解析失败的缓存秒数，避免无法解析的主机名反复请求解析器
+DEFAULT_PREWARM_CONCURRENCY: int = 32  # 预热时同时进行的解析数
+DEFAULT_PREWARM_TIMEOUT: float = 10.0  # 预热最多等待的秒数，解析器无响应时不拖慢启动
+
+# socket.getaddrinfo 返回的一项：(family, type, proto, canonname, sockaddr)
+AddrInfo = tuple[Any, Any, int, str, Any]
+
+
+class DnsCache:
+    """进程内共享的 WHOIS 服务器主机名解析缓存
+
+    getaddrinfo 不返回记录的 TTL，缓存时间使用固定的 ttl；同一个主机名同时有多个解析请求时只解析一次。
+    同步（线程中）与异步调用共用同一份缓存。
+
+    Example:
+        >>> addr_infos = await dns_cache.resolve_async("whois.verisign-grs.com")
+        >>> addr_infos = dns_cache.resolve("whois.verisign-grs.com")
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_DNS_TTL, negative_ttl: float = NEGATIVE_DNS_TTL
+    ):
+        """
+        Args:
+            ttl (float, optional): 解析结果的缓存秒数
+            negative_ttl (float, optional): 解析失败的缓存秒数
+        """
+        self.ttl: float = ttl
+        self.negative_ttl: float = negative_ttl
+        # 主机名-(失效时间, 解析结果或解析失败的异常) 键值对
+        self._entries: dict[str, tuple[float, list[AddrInfo] | OSError]] = {}
+        self._lock = threading.Lock()
+        # 正在进行的异步解析，同一个事件循环中的并发请求共用
+        self._pending: dict[
+            tuple[asyncio.AbstractEventLoop, str], asyncio.Future[list[AddrInfo]]
+        ] = {}
+
+    def resolve(self, host: str) -> list[AddrInfo]:
+        """同步解析主机名，命中缓存时直接返回
+
+        Args:
+            host (str): 主机名
+
+        Returns:
+            list[AddrInfo]: 解析结果，端口为 0
+
+        Raises:
+            OSError: 解析失败
+        """
+        cached = self._get(host)
+        if cached is not None:
+            return cached
+        try:
+            addr_infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        except OSError as e:
+            self._set(host, e)
+            raise
+        self._set(host, addr_infos)
+        return addr_infos
+
+    async def resolve_async(self, host: str) -> list[AddrInfo]:
+        """异步解析主机名，命中缓存时直接返回，不经过线程池
+
+        Args:
+            host (str): 主机名
+
+        Returns:
+            list[AddrInfo]: 解析结果，端口为 0
+
+        Raises:
+            OSError: 解析失败
+        """
+        cached = self._get(host)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        pending_key = (loop, host)
+        pending = self._pending.get(pending_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[list[AddrInfo]] = loop.create_future()
+        self._pending[pending_key] = future
+        try:
+            addr_infos = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        except OSError as e:
+            self._set(host, e)
+            future.set_exception(e)
+            # 没有其他等待者时避免 “Future exception was never retrieved” 警告
+            future.exception()
+            raise
+        except BaseException:
+            # 发起解析的协程被取消时，让等待同一结果的协程也结束等待
+            future.cancel()
+            raise
+        finally:
+            del self._pending[pending_key]
+        self._set(host, addr_infos)
+        future.set_result(addr_infos)
+        return addr_infos
+
+    async def prewarm(
+        self,
+        hosts: Iterable[str],
+        concurrency: int = DEFAULT_PREWARM_CONCURRENCY,
+        timeout: float = DEFAULT_PREWARM_TIMEOUT,
+    ) -> int:
+        """预先解析一批主机名，解析失败的忽略，超时后未完成的不再等待
+
+        Args:
+            hosts (Iterable[str]): 主机名
+            concurrency (int, optional): 同时进行的解析数
+            timeout (float, optional): 最多等待的秒数
+
+        Returns:
+            int: 解析成功的主机名数
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        resolved_count: int = 0
+
+        async def resolve_one(host: str) -> None:
+            nonlocal resolved_count
+            async with semaphore:
+                try:
+                    await self.resolve_async(host)
+                    resolved_count += 1
+                except OSError:
+                    pass
+
+        try:
+            async with asyncio.timeout(timeout):
+                await asyncio.gather(*(resolve_one(host) for host in set(hosts)))
+        except TimeoutError:
+            pass
+        return resolved_count
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, host: str) -> Optional[list[AddrInfo]]:
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[host]
+                return None
+        if isinstance(value, OSError):
+            # 每次抛出新的异常对象，避免同一个对象上的 traceback 不断累积
+            raise type(value)(*value.args)
+        return value
+
+    def _set(self, host: str, value: list[AddrInfo] | OSError) -> None:
+        ttl: float = self.negative_ttl if isinstance(value, OSError) else self.ttl
+        with self._lock:
+            self._entries[host] = (time.monotonic() + ttl, value)
+
+
+# 进程内共享的实例
+dns_cache = DnsCache()
+
+
+async def open_cached_connection(
+    host: str, port: int
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """与 asyncio.open_connection 相同，但主机名经过解析缓存，依次尝试每个地址
+
+    Args:
+        host (str): 主机名
+        port (int): 端口
+
+    Returns:
+        tuple[asyncio.StreamReader, asyncio.StreamWriter]: 连接的读写对象
+
+    Raises:
+        OSError: 解析失败或全部地址都无法连接
+    """
+    addr_infos = await dns_cache.resolve_async(host)
+    last_error: Optional[OSError] = None
+    for family, _, _, _, sockaddr in addr_infos:
+        try:
+            # 传入 IP 地址时 asyncio 不会再次解析
+            return await asyncio.open_connection(sockaddr[0], port, family=family)
+        except OSError as e:
+            last_error = e
+    raise last_error if last_error is not None else OSError(f"No address for {host}")
+
+
+def create_cached_connection(host: str, port: int, timeout: float) -> socket.socket:
+    """与 socket.create_connection 相同，但主机名经过解析缓存，依次尝试每个地址
+
+    Args:
+        host (str): 主机名
+        port (int): 端口
+        timeout (float): 连接与读写的超时秒数
+
+    Returns:
+        socket.socket: 已连接的 socket
+
+    Raises:
+        OSError: 解析失败或全部地址都无法连接
+    """
+    addr_infos = dns_cache.resolve(host)
+    last_error: Optional[OSError] = None
+    for _, _, _, _, sockaddr in addr_infos:
+        try:
+            return socket.create_connection((sockaddr[0], port), timeout)
+        except OSError as e:
+            last_error = e
+    raise last_error if last_error is not None else OSError(f"No address for {host}")
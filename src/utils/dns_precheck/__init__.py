@@ -0,0 +1,13 @@
+from ._dns_message import (
+    DNS_TYPE_NS,
+    DNS_TYPE_SOA,
+    DnsResponse,
+    build_query,
+    parse_response,
+)
+from ._dns_precheck import (
+    DEFAULT_DNS_RESOLVER,
+    DnsPrecheck,
+    get_system_resolver,
+    parse_resolver_address,
+)
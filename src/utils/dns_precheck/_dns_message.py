@@ -0,0 +1,136 @@
+import struct
+from typing import NamedTuple
+
+DNS_TYPE_NS: int = 2
+DNS_TYPE_SOA: int = 6
+DNS_CLASS_IN: int = 1
+
+DNS_RCODE_NOERROR: int = 0
+DNS_RCODE_NXDOMAIN: int = 3
+
+_HEADER = struct.Struct("!HHHHHH")
+_RR_FIXED = struct.Struct("!HHIH")  # type, class, ttl, rdlength
+_FLAG_RD: int = 0x0100  # 请求递归解析
+_FLAG_QR: int = 0x8000  # 响应报文
+_FLAG_TC: int = 0x0200  # 报文被截断
+_MAX_POINTER_JUMPS: int = 32  # 防止恶意报文中的压缩指针形成循环
+
+
+class DnsResponse(NamedTuple):
+    """解析后的 DNS 响应，只保留判断委派需要的部分"""
+
+    query_id: int
+    rcode: int  # 响应码，0 为 NOERROR，3 为 NXDOMAIN
+    truncated: bool  # 报文是否被截断
+    # 回答部分的 (名称, 记录类型)，名称为小写且不带末尾的点
+    answers: list[tuple[str, int]]
+
+
+def build_query(domain: str, qtype: int, query_id: int) -> bytes:
+    """生成一个请求递归解析的 DNS 查询报文
+
+    Args:
+        domain (str): 查询的域名，如 example.com
+        qtype (int): 记录类型，如 DNS_TYPE_NS
+        query_id (int): 查询 id，0 ~ 65535
+
+    Returns:
+        bytes: 查询报文
+
+    Raises:
+        ValueError: 域名中有空标签或超过 63 字节的标签
+    """
+    qname = bytearray()
+    for label in domain.strip(".").split("."):
+        encoded_label: bytes = label.encode("idna")
+        if not 0 < len(encoded_label) < 64:
+            raise ValueError(f"Invalid domain name: {domain}")
+        qname.append(len(encoded_label))
+        qname.extend(encoded_label)
+    qname.append(0)
+    return (
+        _HEADER.pack(query_id, _FLAG_RD, 1, 0, 0, 0)
+        + bytes(qname)
+        + struct.pack("!HH", qtype, DNS_CLASS_IN)
+    )
+
+
+def _read_name(data: bytes, offset: int) -> tuple[str, int]:
+    """读取报文中的域名，支持压缩指针
+
+    Args:
+        data (bytes): 完整报文
+        offset (int): 域名开始的位置
+
+    Returns:
+        tuple[str, int]: (小写域名, 域名之后的位置)
+
+    Raises:
+        ValueError: 报文格式错误
+    """
+    labels: list[str] = []
+    end_offset: int = -1  # 遇到第一个压缩指针后，域名在原位置的结束位置
+    jumps: int = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated name")
+        length: int = data[offset]
+        if length & 0xC0 == 0xC0:
+            if offset + 1 >= len(data):
+                raise ValueError("Truncated name")
+            jumps += 1
+            if jumps > _MAX_POINTER_JUMPS:
+                raise ValueError("Name compression loop")
+            if end_offset < 0:
+                end_offset = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            continue
+        offset += 1
+        if length == 0:
+            break
+        labels.append(data[offset : offset + length].decode("ascii", "replace"))
+        offset += length
+    return ".".join(labels).lower(), (end_offset if end_offset >= 0 else offset)
+
+
+def parse_response(data: bytes) -> DnsResponse:
+    """解析 DNS 响应报文的头部与回答部分
+
+    Args:
+        data (bytes): 响应报文
+
+    Returns:
+        DnsResponse: 解析结果
+
+    Raises:
+        ValueError: 报文格式错误或不是响应报文
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Truncated header")
+    query_id, flags, qdcount, ancount, _, _ = _HEADER.unpack_from(data)
+    if not flags & _FLAG_QR:
+        raise ValueError("Not a response")
+
+    offset: int = _HEADER.size
+    for _ in range(qdcount):
+        _, offset = _read_name(data, offset)
+        offset += 4  # qtype, qclass
+
+    answers: list[tuple[str, int]] = []
+    truncated: bool = bool(flags & _FLAG_TC)
+    try:
+        for _ in range(ancount):
+            name, offset = _read_name(data, offset)
+            if offset + _RR_FIXED.size > len(data):
+                raise ValueError("Truncated record")
+            rtype, _, _, rdlength = _RR_FIXED.unpack_from(data, offset)
+            offset += _RR_FIXED.size + rdlength
+            answers.append((name, rtype))
+    except ValueError:
+        # 被截断的报文只保留完整读取的记录
+        if not truncated:
+            raise
+
+    return DnsResponse(
+        query_id=query_id, rcode=flags & 0x000F, truncated=truncated, answers=answers
+    )
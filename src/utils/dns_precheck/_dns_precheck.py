@@ -0,0 +1,201 @@
+import asyncio
+import random
+from typing import Optional
+
+from src.defined_types.domain_query_result import DnsPrecheckStatus
+
+from ._dns_message import (
+    DNS_RCODE_NOERROR,
+    DNS_RCODE_NXDOMAIN,
+    DNS_TYPE_NS,
+    DnsResponse,
+    build_query,
+    parse_response,
+)
+
+DNS_PORT: int = 53
+DEFAULT_DNS_RESOLVER: str = "8.8.8.8"  # 读取不到系统 DNS 服务器（如 Windows）时使用
+DEFAULT_DNS_TIMEOUT: float = 2.0  # 单次查询的超时秒数
+DEFAULT_DNS_ATTEMPTS: int = 2  # 超时后最多发送查询的次数
+RESOLV_CONF_PATH: str = "/etc/resolv.conf"
+
+
+def get_system_resolver() -> str:
+    """读取系统配置的第一个 DNS 服务器
+
+    Returns:
+        str: DNS 服务器地址，读取不到时为 DEFAULT_DNS_RESOLVER
+    """
+    try:
+        with open(RESOLV_CONF_PATH, "r", encoding="utf-8") as f:
+            for line in f:
+                fields: list[str] = line.split()
+                if len(fields) >= 2 and fields[0] == "nameserver":
+                    return fields[1]
+    except OSError:
+        pass
+    return DEFAULT_DNS_RESOLVER
+
+
+def parse_resolver_address(address: str) -> tuple[str, int]:
+    """解析 DNS 服务器地址，支持 1.1.1.1、1.1.1.1:5353、::1、[::1]:5353 格式
+
+    Args:
+        address (str): DNS 服务器地址，未指定端口时使用 53
+
+    Returns:
+        tuple[str, int]: 主机和端口
+    """
+    address = address.strip()
+    if address.startswith("["):
+        host, _, port = address[1:].partition("]")
+        return host, int(port.lstrip(":") or DNS_PORT)
+    if address.count(":") == 1:
+        host, _, port = address.partition(":")
+        return host, int(port)
+    return address, DNS_PORT
+
+
+class _DnsClientProtocol(asyncio.DatagramProtocol):
+    """按查询 id 将收到的响应交给等待中的查询"""
+
+    def __init__(self, pending: dict[int, asyncio.Future[DnsResponse]]):
+        self._pending = pending
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        try:
+            response: DnsResponse = parse_response(data)
+        except ValueError:
+            return  # 无法解析的报文直接丢弃，等待中的查询会超时重发
+        future = self._pending.pop(response.query_id, None)
+        if future is not None and not future.done():
+            future.set_result(response)
+
+    def error_received(self, exc: Exception) -> None:
+        # 通常是 DNS 服务器端口不可达，等待中的查询都不会有响应了
+        self._fail_all(exc)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._fail_all(exc or ConnectionError("DNS client closed"))
+
+    def _fail_all(self, exc: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self._pending.clear()
+
+
+class DnsPrecheck:
+    """通过 NS 记录判断域名是否有有效委派的异步 DNS 客户端
+
+    在同一个 UDP socket 上复用全部查询，按查询 id 匹配响应。
+    有委派的域名一定已注册；不存在或没有委派的域名可能未注册，也可能处于赎回期、被暂停解析，需要继续查询 WHOIS。
+
+    Example:
+        >>> precheck = DnsPrecheck("127.0.0.1:5353")
+        >>> await precheck.check("example.com")
+        'delegated'
+        >>> precheck.close()
+    """
+
+    def __init__(
+        self,
+        resolver: Optional[str] = None,
+        timeout: float = DEFAULT_DNS_TIMEOUT,
+        attempts: int = DEFAULT_DNS_ATTEMPTS,
+    ):
+        """
+        Args:
+            resolver (Optional[str], optional): DNS 服务器地址，格式见 parse_resolver_address。如果为 None，则使用系统配置的 DNS 服务器
+            timeout (float, optional): 单次查询的超时秒数
+            attempts (int, optional): 超时后最多发送查询的次数
+        """
+        self.resolver: tuple[str, int] = parse_resolver_address(
+            resolver if resolver is not None else get_system_resolver()
+        )
+        self.timeout: float = timeout
+        self.attempts: int = attempts
+        self._pending: dict[int, asyncio.Future[DnsResponse]] = {}
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    async def check(self, domain: str) -> DnsPrecheckStatus:
+        """查询域名的 NS 记录，判断是否有有效委派
+
+        Args:
+            domain (str): 可注册域名，如 example.com
+
+        Returns:
+            DnsPrecheckStatus: 预检查结果，查询失败时为 "unknown"
+        """
+        try:
+            qname: str = domain.strip(".").encode("idna").decode("ascii").lower()
+            response: DnsResponse = await self.query(qname, DNS_TYPE_NS)
+        except (OSError, TimeoutError, ValueError):
+            return "unknown"
+
+        if response.rcode == DNS_RCODE_NXDOMAIN:
+            return "nxdomain"
+        if response.rcode != DNS_RCODE_NOERROR:
+            # SERVFAIL 等，常见于委派的 DNS 服务器全部不可用，无法判断
+            return "unknown"
+        if (qname, DNS_TYPE_NS) in response.answers:
+            return "delegated"
+        if response.truncated:
+            return "unknown"
+        return "undelegated"
+
+    async def query(self, domain: str, qtype: int) -> DnsResponse:
+        """发送一个 DNS 查询，超时后重发
+
+        Args:
+            domain (str): 查询的域名
+            qtype (int): 记录类型
+
+        Returns:
+            DnsResponse: 响应
+
+        Raises:
+            TimeoutError: 全部尝试均超时
+            OSError: 无法连接 DNS 服务器
+            ValueError: 域名格式错误
+        """
+        transport: asyncio.DatagramTransport = await self._get_transport()
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.attempts):
+            query_id: int = random.getrandbits(16)
+            while query_id in self._pending:
+                query_id = random.getrandbits(16)
+            future: asyncio.Future[DnsResponse] = loop.create_future()
+            self._pending[query_id] = future
+            try:
+                transport.sendto(build_query(domain, qtype, query_id))
+                return await asyncio.wait_for(future, self.timeout)
+            except TimeoutError:
+                if attempt == self.attempts - 1:
+                    raise
+            finally:
+                self._pending.pop(query_id, None)
+        raise TimeoutError  # attempts 小于 1 时
+
+    def close(self) -> None:
+        """关闭 UDP socket"""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    async def _get_transport(self) -> asyncio.DatagramTransport:
+        """首次查询时在当前事件循环中创建 UDP socket"""
+        if self._transport is not None:
+            return self._transport
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._transport is None:
+                loop = asyncio.get_running_loop()
+                self._transport, _ = await loop.create_datagram_endpoint(
+                    lambda: _DnsClientProtocol(self._pending),
+                    remote_addr=self.resolver,
+                )
+        return self._transport
@@ -0,0 +1,7 @@
+from ._domain_trie import (
+    DomainMatch,
+    SuffixTrie,
+    find_whois_server,
+    get_domain_trie,
+    get_whois_server_trie,
+)
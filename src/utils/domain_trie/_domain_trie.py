@@ -0,0 +1,278 @@
+import functools
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+from tldextract.remote import lenient_netloc, looks_like_ip, looks_like_ipv6
+
+from src.utils.public_suffix import PUBLIC_SUFFIX_LIST_FILE
+from src.utils.whois_servers import WHOIS_SERVER_LIST_FILE, get_whois_server_dict
+
+# 公共后缀列表中私有后缀部分的开头
+PRIVATE_DOMAINS_MARKER: str = "===BEGIN PRIVATE DOMAINS==="
+
+
+class DomainMatch(NamedTuple):
+    """一个主机名在后缀树中的匹配结果"""
+
+    domain: str  # 公共后缀左边的一段，如 example。主机名本身就是公共后缀时为空字符串
+    suffix: str  # 公共后缀，如 co.uk。没有匹配的公共后缀时为空字符串
+    is_private: bool  # 公共后缀是否来自公共后缀列表的私有后缀部分，如 github.io
+    whois_server: str  # 最长匹配的 WHOIS 服务器主机名，没有匹配时为空字符串
+
+    @property
+    def registrable_domain(self) -> str:
+        """可注册域名，如 example.co.uk。没有公共后缀或主机名本身就是公共后缀时为空字符串"""
+        if not self.domain or not self.suffix:
+            return ""
+        return f"{self.domain}.{self.suffix}"
+
+
+class _TrieNode:
+    """后缀树的一个节点，对应一段标签"""
+
+    __slots__ = (
+        "children",
+        "is_suffix",
+        "is_private",
+        "wildcard",
+        "exceptions",
+        "whois_server",
+    )
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.is_suffix: bool = False  # 从根到此节点的标签组成一个公共后缀
+        self.is_private: bool = False
+        # 存在 *.此后缀 规则时为该规则是否为私有后缀，否则为 None
+        self.wildcard: Optional[bool] = None
+        self.exceptions: set[str] = set()  # !标签.此后缀 规则的标签
+        self.whois_server: Optional[str] = None
+
+
+def _label_variants(label: str) -> tuple[str, ...]:
+    """获取一段标签的全部写法，非 ASCII 标签同时使用 Unicode 与 Punycode（xn--）写法，查询时不需要再转换
+
+    Args:
+        label (str): 小写的标签
+
+    Returns:
+        tuple[str, ...]: 标签的全部写法
+    """
+    if label.isascii():
+        return (label,)
+    try:
+        return (label, "xn--" + label.encode("punycode").decode("ascii"))
+    except UnicodeError:
+        return (label,)
+
+
+class SuffixTrie:
+    """按反向标签组织的后缀树，同时存放公共后缀规则与 WHOIS 服务器
+
+    从主机名最后一段标签开始逐段向根部以外查找，一次遍历得到公共后缀、可注册域名、是否为私有后缀以及最长匹配的 WHOIS 服务器，
+    查找过程中不拼接字符串。公共后缀的匹配规则与 tldextract 一致（包括通配符与例外规则）。
+
+    Example:
+        >>> trie = SuffixTrie()
+        >>> trie.add_public_suffix_list(["co.uk", "uk"])
+        >>> trie.add_whois_servers({"uk": "whois.nic.uk"})
+        >>> trie.match("www.example.co.uk")
+        DomainMatch(domain='example', suffix='co.uk', is_private=False, whois_server='whois.nic.uk')
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    def _get_node(self, labels: Iterable[str]) -> list[_TrieNode]:
+        """按反向标签创建（或获取）节点，非 ASCII 标签的每种写法各对应一个节点
+
+        Args:
+            labels (Iterable[str]): 后缀的标签，顺序与域名中一致
+
+        Returns:
+            list[_TrieNode]: 后缀的最后一个节点，每种写法组合各一个
+        """
+        nodes: list[_TrieNode] = [self._root]
+        for label in reversed(list(labels)):
+            nodes = [
+                node.children.setdefault(variant, _TrieNode())
+                for node in nodes
+                for variant in _label_variants(label)
+            ]
+        return nodes
+
+    def add_public_suffix(self, rule: str, is_private: bool = False) -> None:
+        """添加一条公共后缀规则
+
+        Args:
+            rule (str): 公共后缀列表中的一条规则，如 co.uk、*.ck、!www.ck
+            is_private (bool, optional): 是否为私有后缀
+        """
+        rule = rule.lower()
+        if rule.startswith("!"):
+            exception_label, _, suffix = rule[1:].partition(".")
+            for node in self._get_node(suffix.split(".")):
+                node.exceptions.update(_label_variants(exception_label))
+        elif rule.startswith("*."):
+            for node in self._get_node(rule[2:].split(".")):
+                node.wildcard = is_private
+        else:
+            for node in self._get_node(rule.split(".")):
+                node.is_suffix = True
+                node.is_private = is_private
+
+    def add_public_suffix_list(
+        self, lines: Iterable[str], include_private: bool = True
+    ) -> None:
+        """添加公共后缀列表（public_suffix_list.dat 格式）中的全部规则
+
+        Args:
+            lines (Iterable[str]): 公共后缀列表的每一行
+            include_private (bool, optional): 是否包含私有后缀，如 github.io
+        """
+        is_private: bool = False
+        for line in lines:
+            line = line.strip()
+            if line.startswith("//"):
+                if PRIVATE_DOMAINS_MARKER in line:
+                    if not include_private:
+                        return
+                    is_private = True
+                continue
+            if line:
+                # 规则为每行第一个空白字符之前的部分
+                self.add_public_suffix(line.split()[0], is_private)
+
+    def add_whois_servers(self, whois_server_dict: dict[str, str]) -> None:
+        """添加 后缀-WHOIS 服务器 对应关系，查找时使用最长匹配的后缀
+
+        Args:
+            whois_server_dict (dict[str, str]): 后缀-WHOIS 服务器主机名 键值对，如 {"cn": "whois.cnnic.cn"}
+        """
+        for suffix, whois_server in whois_server_dict.items():
+            for node in self._get_node(suffix.lower().split(".")):
+                node.whois_server = whois_server
+
+    def match(self, host: str) -> DomainMatch:
+        """查找主机名的公共后缀、可注册域名与 WHOIS 服务器
+
+        Args:
+            host (str): 主机名，如 www.example.co.uk，不区分大小写
+
+        Returns:
+            DomainMatch: 匹配结果，其中的字符串均为小写
+        """
+        labels: list[str] = host.lower().split(".")
+        node: _TrieNode = self._root
+        index: int = len(labels)  # 已匹配到的最左边一段标签的下标
+        suffix_index: int = index
+        is_private: bool = False
+        whois_server: str = ""
+        while index > 0:
+            label: str = labels[index - 1]
+            child: Optional[_TrieNode] = node.children.get(label)
+            if child is None:
+                if node.wildcard is not None:
+                    # 通配符匹配这一段标签，例外规则中的标签不匹配
+                    suffix_index = index if label in node.exceptions else index - 1
+                    is_private = node.wildcard
+                break
+            index -= 1
+            node = child
+            if child.whois_server is not None:
+                whois_server = child.whois_server
+            if child.is_suffix:
+                suffix_index = index
+                is_private = child.is_private
+
+        if suffix_index == len(labels):
+            # 没有匹配的公共后缀，与 tldextract 一致，最后一段视为 domain
+            return DomainMatch(labels[-1], "", False, whois_server)
+        return DomainMatch(
+            labels[suffix_index - 1] if suffix_index > 0 else "",
+            ".".join(labels[suffix_index:]),
+            is_private,
+            whois_server,
+        )
+
+    def match_url(self, url: str) -> DomainMatch:
+        """从链接中取出主机名后查找，链接的写法与 tldextract 支持的一致
+
+        Args:
+            url (str): 链接或主机名，如 https://user@www.example.co.uk:8080/path
+
+        Returns:
+            DomainMatch: 匹配结果。IP 地址的 domain 为整个地址，suffix 为空字符串
+        """
+        host: str = (
+            lenient_netloc(url).replace("。", ".").replace("．", ".").replace("｡", ".")
+        )
+        if host.startswith("[") and host.endswith("]") and looks_like_ipv6(host[1:-1]):
+            return DomainMatch(host, "", False, "")
+        domain_match: DomainMatch = self.match(host)
+        if not domain_match.suffix and looks_like_ip(host):
+            return DomainMatch(host, "", False, "")
+        return domain_match
+
+
+@functools.cache
+def get_domain_trie(
+    path: Path = PUBLIC_SUFFIX_LIST_FILE,
+    whois_server_list_path: Path = WHOIS_SERVER_LIST_FILE,
+) -> SuffixTrie:
+    """获取由随程序发布的公共后缀列表（包含私有后缀）与 后缀-WHOIS 服务器 对应表构建的后缀树，同样的文件在进程内只构建一次
+
+    主程序读取输入时使用，一次匹配同时得到可注册域名与 WHOIS 服务器
+
+    Args:
+        path (Path, optional): 公共后缀列表文件路径
+        whois_server_list_path (Path, optional): 后缀-WHOIS 服务器 对应表文件路径
+
+    Returns:
+        SuffixTrie: 后缀树
+
+    Raises:
+        FileNotFoundError: 公共后缀列表文件或对应表文件不存在
+    """
+    trie = SuffixTrie()
+    with open(path, "r", encoding="utf-8") as f:
+        trie.add_public_suffix_list(f)
+    trie.add_whois_servers(get_whois_server_dict(whois_server_list_path))
+    return trie
+
+
+@functools.cache
+def get_whois_server_trie(
+    whois_server_list_path: Path = WHOIS_SERVER_LIST_FILE,
+) -> SuffixTrie:
+    """获取只由 后缀-WHOIS 服务器 对应表构建的后缀树，不读取公共后缀列表，同样的文件在进程内只构建一次
+
+    只需查找 WHOIS 服务器的插件与子进程使用，构建比 get_domain_trie 快得多，占用的内存也少得多
+
+    Args:
+        whois_server_list_path (Path, optional): 后缀-WHOIS 服务器 对应表文件路径
+
+    Returns:
+        SuffixTrie: 后缀树，匹配结果中只有 whois_server 有意义
+
+    Raises:
+        FileNotFoundError: 对应表文件不存在
+    """
+    trie = SuffixTrie()
+    trie.add_whois_servers(get_whois_server_dict(whois_server_list_path))
+    return trie
+
+
+def find_whois_server(
+    domain: str, whois_server_list_path: Path = WHOIS_SERVER_LIST_FILE
+) -> str:
+    """查找域名最长匹配的后缀对应的 WHOIS 服务器
+
+    Args:
+        domain (str): 完整域名，不区分大小写
+        whois_server_list_path (Path, optional): 后缀-WHOIS 服务器 对应表文件路径
+
+    Returns:
+        str: WHOIS 服务器主机名，找不到时返回空字符串
+    """
+    return get_whois_server_trie(whois_server_list_path).match(domain).whois_server
@@ -1 +1,2 @@
-from ._split_file import split_file
+from ._buffered_writer import BufferedFileWriter
+from ._channel_writer import CHANNEL_DONE, ChannelMessage, ChannelWriter, LineWriter
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import threading
+from typing import Optional, Sequence
+
+DEFAULT_FLUSH_SIZE: int = 1000  # 缓冲区达到多少行时写入文件
+DEFAULT_FLUSH_INTERVAL: float = 1.0  # 缓冲区中的行最多等待多少秒写入文件
+
+
+class BufferedFileWriter:
+    """常驻的文件写入器。文件只打开一次，由一个写入协程从队列中取出行，按行数或时间批量追加写入
+
+    每批写入后都会 flush 并 fsync，即使程序被中断，已写入的批次也不会丢失；
+    被取消时会把缓冲区和队列中剩余的行写完再关闭文件。
+    指定 flush_before 时，每批写入前先等待这些写入器写完此前提交的行，
+    保证本文件中的一行落盘时，在它之前提交给这些写入器的行已经落盘（如运行日志总在结果之后写入）。
+
+    Example:
+        >>> writer = BufferedFileWriter("output.txt")
+        >>> writer.start()
+        >>> writer.write("example.com")
+        >>> await writer.close()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_before: Sequence["BufferedFileWriter"] = (),
+    ):
+        """
+        Args:
+            path (str): 要追加写入的文件路径
+            flush_size (int, optional): 缓冲区达到多少行时写入文件
+            flush_interval (float, optional): 缓冲区中的行最多等待多少秒写入文件
+            flush_before (Sequence[BufferedFileWriter], optional): 每批写入前需先写完的写入器，关闭时需先于本写入器关闭
+        """
+        self._path: str = path
+        self._flush_size: int = flush_size
+        self._flush_interval: float = flush_interval
+        self._flush_before: Sequence[BufferedFileWriter] = flush_before
+        # 队列中的 Future 为 flush 请求，写完在它之前提交的行后设置结果
+        self._queue: asyncio.Queue[Optional[str | asyncio.Future[None]]] = asyncio.Queue()
+        self._file = open(path, "a", encoding="utf-8")
+        # 写入在线程中进行，关闭文件时需等待正在进行的写入完成
+        self._file_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """启动写入协程，需在事件循环中调用"""
+        self._task = asyncio.create_task(self._run())
+
+    def write(self, line: str) -> None:
+        """提交一行要写入的内容（不含换行符），不会阻塞
+
+        Args:
+            line (str): 要写入的行
+        """
+        self._queue.put_nowait(line)
+
+    async def flush(self) -> None:
+        """等待此前提交的全部行写入文件。写入器未启动或已关闭时直接返回"""
+        if self._task is None or self._task.done():
+            return
+        flushed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(flushed)
+        await flushed
+
+    async def close(self) -> None:
+        """写入全部剩余的行并关闭文件"""
+        if self._task is None:
+            self._close_file([], [])
+            return
+        self._queue.put_nowait(None)
+        await self._task
+
+    def _write_lines(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        with self._file_lock:
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _close_file(self, lines: list[str], waiters: list[asyncio.Future[None]]) -> None:
+        # 取出队列中剩余的行一并写入
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if isinstance(item, asyncio.Future):
+                waiters.append(item)
+            elif item is not None:
+                lines.append(item)
+        self._write_lines(lines)
+        with self._file_lock:
+            self._file.close()
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        buffer: list[str] = []
+        waiters: list[asyncio.Future[None]] = []
+        try:
+            is_closing: bool = False
+            while not is_closing:
+                item = await self._queue.get()
+                if item is None:
+                    return
+
+                # 收集一批：达到 flush_size 行、等待超过 flush_interval 秒或收到 flush 请求
+                deadline: float = loop.time() + self._flush_interval
+                while True:
+                    if isinstance(item, asyncio.Future):
+                        waiters.append(item)
+                        break
+                    buffer.append(item)
+                    if len(buffer) >= self._flush_size:
+                        break
+                    timeout: float = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        async with asyncio.timeout(timeout):
+                            item = await self._queue.get()
+                    except TimeoutError:
+                        break
+                    if item is None:
+                        is_closing = True
+                        break
+
+                if buffer:
+                    # 被取消时 buffer 中的行仍会在关闭文件前写入
+                    for writer in self._flush_before:
+                        await writer.flush()
+                    lines, buffer = buffer, []
+                    await asyncio.to_thread(self._write_lines, lines)
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+                waiters = []
+        finally:
+            self._close_file(buffer, waiters)
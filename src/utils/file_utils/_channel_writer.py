@@ -0,0 +1,89 @@
+import asyncio
+import multiprocessing.queues
+from typing import Optional, Protocol, Sequence
+
+from ._buffered_writer import DEFAULT_FLUSH_INTERVAL, DEFAULT_FLUSH_SIZE
+
+# 通道中传递的消息：(写入目标名, 行列表)。子进程结束时发送 CHANNEL_DONE
+ChannelMessage = tuple[str, list[str]]
+CHANNEL_DONE: ChannelMessage = ("", [])
+
+
+class LineWriter(Protocol):
+    """按行写入结果的写入器"""
+
+    def start(self) -> None: ...
+
+    def write(self, line: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class ChannelWriter:
+    """子进程中使用的写入器。不直接写文件，而是把行攒成一批通过进程间队列发送给主进程，由主进程统一写入
+
+    指定 flush_before 时，每次发送前先发送这些写入器缓冲区中的行，主进程按发送顺序收到
+
+    Example:
+        >>> writer = ChannelWriter(result_channel, "output")
+        >>> writer.start()
+        >>> writer.write("example.com")
+        >>> await writer.close()
+    """
+
+    def __init__(
+        self,
+        channel: multiprocessing.queues.Queue,
+        sink: str,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_before: Sequence["ChannelWriter"] = (),
+    ):
+        """
+        Args:
+            channel (multiprocessing.queues.Queue): 发送给主进程的队列
+            sink (str): 写入目标名，主进程据此决定写入哪个文件
+            flush_size (int, optional): 攒够多少行发送一次
+            flush_interval (float, optional): 缓冲区中的行最多等待多少秒发送
+            flush_before (Sequence[ChannelWriter], optional): 每次发送前需先发送的写入器，使用同一个队列
+        """
+        self._channel: multiprocessing.queues.Queue = channel
+        self._sink: str = sink
+        self._flush_size: int = flush_size
+        self._flush_interval: float = flush_interval
+        self._flush_before: Sequence[ChannelWriter] = flush_before
+        self._buffer: list[str] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """启动定时发送协程，需在事件循环中调用"""
+        self._task = asyncio.create_task(self._run())
+
+    def write(self, line: str) -> None:
+        """提交一行要写入的内容（不含换行符），不会阻塞
+
+        Args:
+            line (str): 要写入的行
+        """
+        self._buffer.append(line)
+        if len(self._buffer) >= self._flush_size:
+            self._flush()
+
+    async def close(self) -> None:
+        """发送全部剩余的行"""
+        if self._task is not None:
+            self._task.cancel()
+        self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        for writer in self._flush_before:
+            writer._flush()
+        lines, self._buffer = self._buffer, []
+        self._channel.put((self._sink, lines))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            self._flush()
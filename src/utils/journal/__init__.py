@@ -0,0 +1 @@
+from ._journal import RETRY_OUTCOME, JournalState, format_journal_entry, load_journal
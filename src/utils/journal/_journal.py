@@ -0,0 +1,66 @@
+import json
+import os
+from typing import NamedTuple
+
+from src.defined_types.domain_query_result import QueryOutcome
+
+# 日志中表示域名正在等待重试（尚未完成）的结果
+RETRY_OUTCOME: str = "retry"
+
+
+class JournalState(NamedTuple):
+    """从运行日志中恢复的进度"""
+
+    completed_domains: set[str]  # 已得到最终结果的域名
+    retry_attempts: dict[str, int]  # 中断时正在等待重试的域名-已查询次数
+
+
+def format_journal_entry(domain: str, outcome: QueryOutcome | str, attempts: int) -> str:
+    """生成一行运行日志
+
+    Args:
+        domain (str): 可注册域名
+        outcome (QueryOutcome | str): 最终结果，等待重试时为 RETRY_OUTCOME
+        attempts (int): 已查询的次数
+
+    Returns:
+        str: JSON 格式的一行日志，不含换行符
+    """
+    return json.dumps(
+        {"domain": domain, "outcome": outcome, "attempts": attempts}, ensure_ascii=False
+    )
+
+
+def load_journal(path: str) -> JournalState:
+    """读取运行日志，恢复已完成的域名和等待重试的域名
+
+    程序中断时最后一行可能只写了一半，无法解析的行会被跳过
+
+    Args:
+        path (str): 运行日志文件路径，不存在时视为空日志
+
+    Returns:
+        JournalState: 恢复的进度
+    """
+    completed_domains: set[str] = set()
+    retry_attempts: dict[str, int] = {}
+    if not os.path.exists(path):
+        return JournalState(completed_domains, retry_attempts)
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry: dict = json.loads(line)
+                domain: str = entry["domain"]
+                outcome: str = entry["outcome"]
+                attempts: int = entry["attempts"]
+            except (ValueError, KeyError, TypeError):
+                continue
+
+            if outcome == RETRY_OUTCOME:
+                retry_attempts[domain] = attempts
+            else:
+                completed_domains.add(domain)
+                retry_attempts.pop(domain, None)
+
+    return JournalState(completed_domains, retry_attempts)
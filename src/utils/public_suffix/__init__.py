@@ -0,0 +1,4 @@
+from ._public_suffix import (
+    PUBLIC_SUFFIX_LIST_FILE,
+    get_public_suffix_list_version,
+)
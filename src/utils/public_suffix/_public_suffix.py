@@ -0,0 +1,28 @@
+from pathlib import Path
+from typing import Optional
+
+# 随程序发布的公共后缀列表，使用 extra-scripts/get-whois-server-list 下载新版本后替换此文件即可更新
+PUBLIC_SUFFIX_LIST_FILE: Path = (
+    Path(__file__).resolve().parents[2] / "data" / "public_suffix_list.dat"
+)
+
+
+def get_public_suffix_list_version(
+    path: Path = PUBLIC_SUFFIX_LIST_FILE,
+) -> Optional[str]:
+    """读取公共后缀列表文件头部注释中的版本号
+
+    Args:
+        path (Path, optional): 公共后缀列表文件路径
+
+    Returns:
+        Optional[str]: 版本号，如 2025-04-07_15-51-09_UTC。文件中没有版本号时为 None
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("// VERSION:"):
+                return line.removeprefix("// VERSION:").strip()
+            if line.startswith("// ==="):
+                # 版本号只出现在文件开头的注释中
+                return None
+    return None
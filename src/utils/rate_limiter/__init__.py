@@ -0,0 +1,7 @@
+from ._server_rate_limiter import (
+    DEFAULT_RATE_LIMIT,
+    ServerRateLimiter,
+    load_rate_limit_config,
+    scale_rate_limit_config,
+)
+from ._token_bucket import TokenBucket
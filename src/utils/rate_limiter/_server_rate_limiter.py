@@ -0,0 +1,170 @@
+import asyncio
+import json
+import math
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from src.defined_types import RateLimitConfigDict, RateLimitDict
+
+from ._token_bucket import TokenBucket
+
+DEFAULT_RATE_LIMIT: RateLimitDict = {
+    "rate": 0,
+    "burst": 1,
+    "concurrency": 0,
+}  # 未配置的服务器使用的默认限速，不限速也不限制并发数
+
+
+def load_rate_limit_config(
+    path: Optional[str], plugin_rate_limit: Optional[RateLimitDict] = None
+) -> RateLimitConfigDict:
+    """读取 JSON 格式的限速配置文件，未指定的项使用默认值
+
+    配置文件格式如：
+        {"default": {"rate": 10, "burst": 10, "concurrency": 10},
+         "servers": {"whois.cnnic.cn": {"rate": 1, "concurrency": 2}},
+         "plugin": {"rate": 20, "burst": 20}}
+
+    Args:
+        path (Optional[str]): 配置文件路径。如果为 None，则全部使用默认值
+        plugin_rate_limit (Optional[RateLimitDict], optional): 插件在 METADATA 中声明的整体限速，配置文件中的 plugin 项优先
+
+    Returns:
+        RateLimitConfigDict: 限速配置
+    """
+    config: RateLimitConfigDict = {"default": DEFAULT_RATE_LIMIT.copy(), "servers": {}}
+    if plugin_rate_limit is not None:
+        config["plugin"] = plugin_rate_limit.copy()
+    if path is None:
+        return config
+
+    with open(path, "r", encoding="utf-8") as f:
+        raw_config: dict = json.load(f)
+
+    config["default"].update(raw_config.get("default", {}))
+    if "plugin" in raw_config:
+        config["plugin"] = {**config.get("plugin", {}), **raw_config["plugin"]}
+    for server, server_config in raw_config.get("servers", {}).items():
+        config["servers"][server.lower()] = server_config
+    return config
+
+
+def scale_rate_limit_config(
+    config: RateLimitConfigDict, num_processes: int
+) -> RateLimitConfigDict:
+    """将限速配置平均分给每个进程，使所有进程加起来不超过配置的限速
+
+    Args:
+        config (RateLimitConfigDict): 全局限速配置
+        num_processes (int): 进程数
+
+    Returns:
+        RateLimitConfigDict: 单个进程使用的限速配置
+    """
+
+    def scale(limit: RateLimitDict) -> RateLimitDict:
+        scaled: RateLimitDict = limit.copy()
+        if "rate" in scaled and scaled["rate"] > 0:
+            scaled["rate"] = scaled["rate"] / num_processes
+        if "burst" in scaled:
+            scaled["burst"] = max(1, math.ceil(scaled["burst"] / num_processes))
+        if "concurrency" in scaled and scaled["concurrency"] > 0:
+            scaled["concurrency"] = max(
+                1, math.ceil(scaled["concurrency"] / num_processes)
+            )
+        return scaled
+
+    scaled_config: RateLimitConfigDict = {
+        "default": scale(config["default"]),
+        "servers": {server: scale(limit) for server, limit in config["servers"].items()},
+    }
+    if "plugin" in config:
+        scaled_config["plugin"] = scale(config["plugin"])
+    return scaled_config
+
+
+class ServerRateLimiter:
+    """按 WHOIS 服务器主机名分别限速和限制并发数的调度器，每个服务器有独立的令牌桶和限制并发数的信号量"""
+
+    def __init__(self, config: RateLimitConfigDict):
+        """
+        Args:
+            config (RateLimitConfigDict): 限速配置，单独配置的服务器会与 default 合并
+        """
+        self._config: RateLimitConfigDict = config
+        self._buckets: dict[str, Optional[TokenBucket]] = {}
+        # 限制并发数的信号量，不限制时为 None
+        self._semaphores: dict[str, Optional[asyncio.Semaphore]] = {}
+
+    def _get_server_limit(self, server: str) -> RateLimitDict:
+        limit: RateLimitDict = self._config["default"].copy()
+        limit.update(self._config["servers"].get(server, {}))
+        return limit
+
+    def _create(self, server: str) -> None:
+        limit = self._get_server_limit(server)
+
+        rate: float = limit.get("rate", 0)
+        self._buckets[server] = (
+            TokenBucket(rate, limit.get("burst", 1)) if rate > 0 else None
+        )
+
+        concurrency: int = limit.get("concurrency", 0)
+        self._semaphores[server] = (
+            asyncio.Semaphore(concurrency) if concurrency > 0 else None
+        )
+
+    async def acquire(self, server: Optional[str]) -> None:
+        """等待到可以对 server 发起一次查询为止，占用一个并发额度并取走一个令牌。须在查询结束后调用 release
+
+        Args:
+            server (Optional[str]): WHOIS 服务器主机名。为空时不限速
+        """
+        if not server:
+            return
+
+        server = server.lower()
+        if server not in self._buckets:
+            self._create(server)
+
+        semaphore = self._semaphores[server]
+        if semaphore is not None:
+            await semaphore.acquire()
+
+        bucket = self._buckets[server]
+        if bucket is not None:
+            try:
+                await bucket.acquire()
+            except BaseException:
+                if semaphore is not None:
+                    semaphore.release()
+                raise
+
+    def release(self, server: Optional[str]) -> None:
+        """归还 acquire 占用的并发额度
+
+        Args:
+            server (Optional[str]): WHOIS 服务器主机名
+        """
+        if not server:
+            return
+        semaphore = self._semaphores[server.lower()]
+        if semaphore is not None:
+            semaphore.release()
+
+    @asynccontextmanager
+    async def limit(self, server: Optional[str]) -> AsyncIterator[None]:
+        """在限速范围内执行一次对 server 的查询
+
+        Args:
+            server (Optional[str]): WHOIS 服务器主机名。为空时不限速
+
+        Example:
+            >>> async with rate_limiter.limit("whois.verisign-grs.com"):
+            ...     await query()
+        """
+        await self.acquire(server)
+        try:
+            yield
+        finally:
+            self.release(server)
@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """异步令牌桶。令牌以 rate 个/秒的速度补充，最多存放 capacity 个，每次查询消耗一个令牌"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate (float): 每秒补充的令牌数，必须大于 0
+            capacity (float): 令牌桶容量，至少为 1
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self._rate: float = rate
+        self._capacity: float = max(1.0, capacity)
+        self._tokens: float = self._capacity
+        self._updated_at: float = time.monotonic()
+        # asyncio.Lock 按先来后到唤醒，保证等待令牌的协程依次获得令牌
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """取走一个令牌，令牌不足时等待到有令牌可用为止"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
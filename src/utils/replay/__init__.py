@@ -0,0 +1,6 @@
+from ._replay_archive import (
+    REPLAY_FILE_ENV,
+    REPLAY_PLUGIN_ID_ENV,
+    format_record_entry,
+    load_replay_archive,
+)
@@ -0,0 +1,90 @@
+import json
+import os
+from typing import Optional
+
+from src.defined_types import PluginReturnDict
+
+# 重放插件从此环境变量读取归档文件路径
+REPLAY_FILE_ENV: str = "DOMAIN_CHECKER_REPLAY_FILE"
+# 重放插件从此环境变量读取要重放哪个插件录制的记录
+REPLAY_PLUGIN_ID_ENV: str = "DOMAIN_CHECKER_REPLAY_PLUGIN_ID"
+
+
+def format_record_entry(plugin_id: str, domain: str, ret: PluginReturnDict) -> str:
+    """生成一行插件原始返回值的归档记录
+
+    Args:
+        plugin_id (str): 进行查询的插件 id
+        domain (str): 查询的域名
+        ret (PluginReturnDict): 插件的原始返回值
+
+    Returns:
+        str: JSON 格式的一行记录，不含换行符
+    """
+    entry: dict = {
+        "plugin_id": plugin_id,
+        "domain": domain,
+        "code": ret["code"],
+        "raw": ret["raw"],
+    }
+    # 插件直接提供的结构化结果（如 RDAP）一同录制，重放时不再解析 raw
+    if "status" in ret:
+        entry["status"] = ret["status"]
+    if "expiry_date" in ret:
+        entry["expiry_date"] = ret["expiry_date"]
+    return json.dumps(
+        entry,
+        ensure_ascii=False,
+        default=str,  # raw 为插件自定义的任意值，无法序列化时转为字符串
+    )
+
+
+def load_replay_archive(
+    path: str, plugin_id: Optional[str] = None
+) -> dict[str, PluginReturnDict]:
+    """读取归档文件中某个插件的记录，得到 域名-插件原始返回值 键值对
+
+    同一个域名有多条记录时（如查询失败后重试），使用最后一条，即最终结果所依据的返回值；
+    程序中断时最后一行可能只写了一半，无法解析的行会被跳过
+
+    Args:
+        path (str): 归档文件路径
+        plugin_id (Optional[str], optional): 只读取此插件的记录。如果为 None，则归档中只能有一个插件的记录
+
+    Returns:
+        dict[str, PluginReturnDict]: 域名-插件原始返回值 键值对
+
+    Raises:
+        FileNotFoundError: 归档文件不存在
+        ValueError: 未指定 plugin_id，而归档中有多个插件的记录
+    """
+    archive: dict[str, PluginReturnDict] = {}
+    archive_plugin_ids: set[str] = set()
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry: dict = json.loads(line)
+                domain: str = entry["domain"]
+                ret: PluginReturnDict = {"code": entry["code"], "raw": entry["raw"]}
+            except (ValueError, KeyError, TypeError):
+                continue
+            if "status" in entry:
+                ret["status"] = entry["status"]
+            if "expiry_date" in entry:
+                ret["expiry_date"] = entry["expiry_date"]
+
+            archive_plugin_ids.add(str(entry.get("plugin_id")))
+            if plugin_id is not None and entry.get("plugin_id") != plugin_id:
+                continue
+            archive[domain] = ret
+
+    # 不同插件对同一个域名的记录会互相覆盖，必须指定重放哪个插件
+    if plugin_id is None and len(archive_plugin_ids) > 1:
+        raise ValueError(
+            f"Replay archive {path} contains records from several plugins "
+            f"({', '.join(sorted(archive_plugin_ids))}), choose one plugin id to replay"
+        )
+    return archive
@@ -0,0 +1 @@
+from ._result_cache import ResultCache, compute_expires_at, format_cache_entry
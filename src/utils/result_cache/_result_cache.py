@@ -0,0 +1,276 @@
+import datetime
+import json
+import sqlite3
+import time
+from typing import Literal, Optional, cast
+
+from src.defined_types import Err, Ok, ParsedWhoisData, Result
+from src.defined_types.domain_query_result import ExceptionErrResult, MsgErrResult
+from src.utils.logger import debug
+
+RENEWAL_MARGIN: float = (
+    30 * 24 * 3600
+)  # 距离过期时间不足此秒数的已注册域名，每次都重新查询
+MAX_REGISTERED_TTL: float = 180 * 24 * 3600  # 已注册域名缓存的最长秒数
+SHORT_TTL: float = 24 * 3600  # 未注册、赎回期、临近过期、无过期时间的域名缓存秒数
+ERROR_TTL: float = 3600  # 查询失败的域名缓存秒数
+
+COMMIT_INTERVAL: int = 1000  # 攒够多少条记录提交一次
+COMMIT_MAX_DELAY: float = 1.0  # 记录最多在内存中等待多少秒提交
+MAX_PENDING: int = (
+    10 * COMMIT_INTERVAL
+)  # 提交连续失败时内存中最多保留的记录数，超出则丢弃
+BUSY_TIMEOUT: float = 1.0  # 其他进程占用写锁时最多等待的秒数
+
+CachedStatus = Literal["registered", "redemption", "unregistered", "error"]
+
+# 数据库中的一行：(domain, status, expiry_date, error_msg, error_code, checked_at, expires_at)
+CacheRow = tuple[
+    str, CachedStatus, Optional[str], Optional[str], Optional[int], float, float
+]
+
+
+def compute_expires_at(
+    query_result: Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult],
+    now: float,
+) -> float:
+    """根据查询结果计算缓存的失效时间
+
+    已注册且过期时间还很远的域名缓存到临近过期为止，未注册、赎回期和查询失败的域名只缓存很短的时间
+
+    Args:
+        query_result (Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]): 查询结果
+        now (float): 当前时间戳
+
+    Returns:
+        float: 缓存失效的时间戳
+    """
+    match query_result:
+        case Err(_):
+            return now + ERROR_TTL
+        case Ok(parsed_whois_data):
+            if parsed_whois_data["status"][1] != "registered":
+                return now + SHORT_TTL
+            match parsed_whois_data["registry_expiry_date"]:
+                case Ok(expiry_date):
+                    renew_at: float = expiry_date.timestamp() - RENEWAL_MARGIN
+                    return max(now + SHORT_TTL, min(now + MAX_REGISTERED_TTL, renew_at))
+                case _:
+                    return now + SHORT_TTL
+    raise ValueError("Invaid Data")  # 不可能的路径
+
+
+def build_cache_row(
+    domain: str,
+    query_result: Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult],
+    now: Optional[float] = None,
+) -> CacheRow:
+    """将查询结果转为数据库中的一行，按结果决定缓存时间
+
+    Args:
+        domain (str): 可注册域名
+        query_result (Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]): 查询结果
+        now (Optional[float], optional): 当前时间戳。如果为 None，则使用 time.time()
+
+    Returns:
+        CacheRow: 数据库中的一行
+    """
+    if now is None:
+        now = time.time()
+    status: CachedStatus
+    expiry_date: Optional[str] = None
+    error_msg: Optional[str] = None
+    error_code: Optional[int] = None
+
+    match query_result:
+        case Err(error):
+            status = "error"
+            if "err" in error:
+                error_msg = str(cast(ExceptionErrResult, error)["err"])
+                error_code = 500
+            else:
+                error = cast(MsgErrResult, error)
+                error_msg = error["msg"]
+                error_code = error["code"]
+        case Ok(parsed_whois_data):
+            status = parsed_whois_data["status"][1]
+            match parsed_whois_data["registry_expiry_date"]:
+                case Ok(date):
+                    expiry_date = date.isoformat()
+
+    return (
+        domain,
+        status,
+        expiry_date,
+        error_msg,
+        error_code,
+        now,
+        compute_expires_at(query_result, now),
+    )
+
+
+def format_cache_entry(
+    domain: str,
+    query_result: Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult],
+) -> str:
+    """将查询结果转为一行文本，多进程模式下子进程据此把要缓存的结果发送给主进程
+
+    Args:
+        domain (str): 可注册域名
+        query_result (Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]): 查询结果
+
+    Returns:
+        str: JSON 格式的一行，可传给 ResultCache.put_entry
+    """
+    return json.dumps(build_cache_row(domain, query_result), ensure_ascii=False)
+
+
+class ResultCache:
+    """以可注册域名为键的 WHOIS 查询结果本地缓存，使用 SQLite 存储，可在多个进程间共享
+
+    写入先攒在内存中，攒够 COMMIT_INTERVAL 条或等待超过 COMMIT_MAX_DELAY 秒后在一个短事务中批量提交，
+    写锁只在提交期间持有。其他进程长时间占用数据库时，读取视为未命中，写入留待下次提交，不影响查询。
+    多进程模式下只由主进程写入，子进程只读取。
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): SQLite 数据库文件路径，不存在则自动创建
+        """
+        # 其他进程占用写锁时最多等待 BUSY_TIMEOUT 秒，避免长时间阻塞事件循环
+        self._connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("""CREATE TABLE IF NOT EXISTS whois_cache (
+                domain TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                expiry_date TEXT,
+                error_msg TEXT,
+                error_code INTEGER,
+                checked_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )""")
+        self._connection.commit()
+        # 尚未提交的记录，域名-行 键值对
+        self._pending: dict[str, CacheRow] = {}
+        self._first_pending_at: float = 0.0
+        # 提交失败后，在此时间之前不再尝试提交
+        self._retry_commit_at: float = 0.0
+
+    def get(
+        self, domain: str
+    ) -> Optional[Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]]:
+        """读取未失效的缓存结果
+
+        Args:
+            domain (str): 可注册域名
+
+        Returns:
+            Optional[Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]]: 缓存的查询结果，格式与插件调用的返回值一致。无缓存、已失效或数据库暂时无法读取时返回 None
+        """
+        now: float = time.time()
+        row: Optional[tuple] = None
+        pending_row: Optional[CacheRow] = self._pending.get(domain)
+        if pending_row is not None:
+            if pending_row[6] > now:
+                row = pending_row[1:5]
+        else:
+            try:
+                row = self._connection.execute(
+                    "SELECT status, expiry_date, error_msg, error_code FROM whois_cache"
+                    " WHERE domain = ? AND expires_at > ?",
+                    (domain, now),
+                ).fetchone()
+            except sqlite3.OperationalError as e:
+                # 数据库被其他进程锁定，视为未命中
+                debug(f"Result cache read failed: {e}")
+                return None
+        if row is None:
+            return None
+
+        status, expiry_date, error_msg, error_code = row
+        # 错误信息保持原样，错误分类与实时查询的结果一致。是否来自缓存由调用方记录
+        if status == "error":
+            return Err({"domain": domain, "msg": error_msg, "code": error_code})
+
+        status = cast(Literal["registered", "redemption", "unregistered"], status)
+        return Ok(
+            {
+                "domain": domain,
+                "status": (status != "unregistered", status),
+                "raw": "",
+                "registry_expiry_date": (
+                    Ok(datetime.datetime.fromisoformat(expiry_date))
+                    if expiry_date is not None
+                    else Err(
+                        {
+                            "msg": "Date not found",
+                            "err": ValueError("Date not found"),
+                            "raw": "",
+                        }
+                    )
+                ),
+            }
+        )
+
+    def put(
+        self,
+        domain: str,
+        query_result: Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult],
+    ) -> None:
+        """写入查询结果，按结果决定缓存时间
+
+        Args:
+            domain (str): 可注册域名
+            query_result (Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]): 查询结果
+        """
+        self._put_row(build_cache_row(domain, query_result))
+
+    def put_entry(self, entry: str) -> None:
+        """写入 format_cache_entry 生成的一行，多进程模式下主进程写入子进程发来的结果时使用
+
+        Args:
+            entry (str): format_cache_entry 生成的一行
+        """
+        row = cast(CacheRow, tuple(json.loads(entry)))
+        self._put_row(row)
+
+    def _put_row(self, row: CacheRow) -> None:
+        if not self._pending:
+            self._first_pending_at = time.monotonic()
+        self._pending[row[0]] = row
+
+        if time.monotonic() < self._retry_commit_at:
+            return
+        if (
+            len(self._pending) >= COMMIT_INTERVAL
+            or time.monotonic() - self._first_pending_at >= COMMIT_MAX_DELAY
+        ):
+            self.commit()
+
+    def commit(self) -> None:
+        """在一个短事务中提交尚未提交的写入。数据库被其他进程锁定时保留这些记录，留待下次提交"""
+        if not self._pending:
+            return
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO whois_cache"
+                    " (domain, status, expiry_date, error_msg, error_code, checked_at, expires_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    list(self._pending.values()),
+                )
+        except sqlite3.OperationalError as e:
+            debug(f"Result cache commit failed: {e}")
+            self._retry_commit_at = time.monotonic() + COMMIT_MAX_DELAY
+            # 缓存只用于加速，长时间无法提交时丢弃，避免占用过多内存
+            if len(self._pending) >= MAX_PENDING:
+                self._pending.clear()
+            return
+        self._pending.clear()
+
+    def close(self) -> None:
+        """提交并关闭数据库"""
+        self.commit()
+        self._connection.close()
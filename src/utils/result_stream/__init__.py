@@ -0,0 +1 @@
+from ._result_record import build_result_record, format_result_record
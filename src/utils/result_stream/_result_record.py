@@ -0,0 +1,83 @@
+import json
+from typing import Literal, Optional, cast
+
+from src.defined_types import Err, Ok, ParsedWhoisData, Result, ResultRecordDict
+from src.defined_types.domain_query_result import (
+    ErrorClass,
+    ExceptionErrResult,
+    MsgErrResult,
+    QueryOutcome,
+)
+from src.utils.retry import classify_error
+
+
+def build_result_record(
+    domain: str,
+    outcome: QueryOutcome,
+    query_result: Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult],
+    plugin_id: str,
+    whois_server: Optional[str],
+    attempts: int,
+    latency: float,
+    cached: bool,
+) -> ResultRecordDict:
+    """根据单个域名的查询结果生成结构化记录
+
+    Args:
+        domain (str): 可注册域名
+        outcome (QueryOutcome): 最终处理结果
+        query_result (Result[ParsedWhoisData, MsgErrResult | ExceptionErrResult]): 插件调用的返回值
+        plugin_id (str): 进行查询的插件 id
+        whois_server (Optional[str]): 连接的 WHOIS 服务器，插件未提供时为 None
+        attempts (int): 已查询的次数
+        latency (float): 各次查询耗时之和，单位为秒
+        cached (bool): 是否使用了缓存中的结果
+
+    Returns:
+        ResultRecordDict: 结构化记录
+    """
+    status: Optional[Literal["registered", "redemption", "unregistered"]] = None
+    expiry_date: Optional[str] = None
+    error_class: Optional[ErrorClass] = None
+    error_msg: Optional[str] = None
+
+    match query_result:
+        case Err(error):
+            error_class = classify_error(error)
+            if "err" in error:
+                error_msg = str(cast(ExceptionErrResult, error)["err"])
+            else:
+                error_msg = cast(MsgErrResult, error)["msg"]
+        case Ok(parsed_whois_data):
+            status = parsed_whois_data["status"][1]
+            match parsed_whois_data.get("registry_expiry_date"):
+                case Ok(expired_date):
+                    expiry_date = expired_date.isoformat()
+                case Err(datetime_paser_error):
+                    error_msg = datetime_paser_error["msg"]
+
+    return {
+        "domain": domain,
+        "outcome": outcome,
+        "status": status,
+        "expiry_date": expiry_date,
+        "plugin_id": plugin_id,
+        "whois_server": whois_server,
+        "error_class": error_class,
+        "error": error_msg,
+        "attempts": attempts,
+        "latency": round(latency, 3),
+        "cached": cached,
+    }
+
+
+def format_result_record(record: ResultRecordDict) -> str:
+    """将结构化记录转为一行 JSON
+
+    Args:
+        record (ResultRecordDict): 结构化记录
+
+    Returns:
+        str: JSON 格式的一行记录，不含换行符
+    """
+    return json.dumps(record, ensure_ascii=False)
@@ -0,0 +1,3 @@
+from ._error_classifier import RETRYABLE_ERROR_CLASSES, classify_error
+from ._retry_policy import DEFAULT_BASE_DELAYS, DEFAULT_MAX_DELAY, RetryPolicy
+from ._retry_queue import RetryQueue
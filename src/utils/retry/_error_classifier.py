@@ -0,0 +1,65 @@
+from typing import cast
+
+from src.defined_types.domain_query_result import (
+    ErrorClass,
+    ExceptionErrResult,
+    MsgErrResult,
+)
+
+# 出现以下内容说明查询过快被服务器限制
+RATE_LIMITED_MESSAGES: tuple[str, ...] = (
+    "Your access is too fast,please try again later.",
+    "Queried interval is too short.",
+    "-95",  # .ch .li Access restricted (i.e. wait a while and then try again)
+)
+
+# 以下开头说明查询本身无效，重试也不会得到不同的结果
+INVALID_QUERY_PREFIXES: tuple[str, ...] = (
+    "No WHOIS server for",  # 内置插件找不到对应的 WHOIS 服务器
+)
+
+# .ch .li 返回的表示查询无效的状态码
+INVALID_QUERY_STATUS_CODES: tuple[str, ...] = (
+    "-1",  # Invalid enquiry (i.e. modify enquiry prior to next attempt)
+)
+
+# 值得重试的错误分类
+RETRYABLE_ERROR_CLASSES: frozenset[ErrorClass] = frozenset(
+    ("rate_limited", "network", "server_error", "empty")
+)
+
+
+def classify_error(error: MsgErrResult | ExceptionErrResult) -> ErrorClass:
+    """根据插件调用返回的错误判断错误分类
+
+    Args:
+        error (MsgErrResult | ExceptionErrResult): 插件调用返回的错误
+
+    Returns:
+        ErrorClass: 错误分类
+    """
+    if "err" in error:
+        return "exception"
+
+    error = cast(MsgErrResult, error)
+    code: int = error["code"]
+    msg: str = error["msg"]
+
+    # .ch .li 的返回以状态码开头，后接说明
+    status_code: str = msg.split(maxsplit=1)[0] if msg.strip() else ""
+    if (
+        msg.startswith(INVALID_QUERY_PREFIXES)
+        or status_code in INVALID_QUERY_STATUS_CODES
+    ):
+        return "invalid_query"
+    if code == 429 or any(keyword in msg for keyword in RATE_LIMITED_MESSAGES):
+        return "rate_limited"
+    if code == 200:
+        # code 为 200 但是出错，只有 Empty query result 一种情况
+        return "empty"
+    if code == 503:
+        # 内置插件在连接失败、超时时返回 503
+        return "network"
+    if code >= 500:
+        return "server_error"
+    return "api_error"
@@ -0,0 +1,60 @@
+import random
+
+from src.defined_types.domain_query_result import ErrorClass
+
+from ._error_classifier import RETRYABLE_ERROR_CLASSES
+
+# 各错误分类第一次重试前等待的秒数，之后每次重试等待时间翻倍
+DEFAULT_BASE_DELAYS: dict[ErrorClass, float] = {
+    "rate_limited": 10.0,
+    "network": 2.0,
+    "server_error": 5.0,
+    "empty": 2.0,
+}
+DEFAULT_MAX_DELAY: float = 300.0  # 单次重试最长等待秒数
+
+
+class RetryPolicy:
+    """按错误分类决定是否重试以及重试前等待多久（指数退避）"""
+
+    def __init__(
+        self,
+        max_retries: int,
+        base_delays: dict[ErrorClass, float] = DEFAULT_BASE_DELAYS,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ):
+        """
+        Args:
+            max_retries (int): 单个域名最多重试的次数，为 0 时不重试
+            base_delays (dict[ErrorClass, float], optional): 各错误分类第一次重试前等待的秒数
+            max_delay (float, optional): 单次重试最长等待秒数
+        """
+        self.max_retries: int = max_retries
+        self._base_delays: dict[ErrorClass, float] = base_delays
+        self._max_delay: float = max_delay
+
+    def should_retry(self, error_class: ErrorClass, attempts: int) -> bool:
+        """判断查询失败的域名是否需要重试
+
+        Args:
+            error_class (ErrorClass): 本次失败的错误分类
+            attempts (int): 已查询的次数（包括本次）
+
+        Returns:
+            bool: 需要重试返回 True
+        """
+        return error_class in RETRYABLE_ERROR_CLASSES and attempts <= self.max_retries
+
+    def get_delay(self, error_class: ErrorClass, attempts: int) -> float:
+        """计算下一次重试前等待的秒数。加入随机抖动，避免大量域名在同一时刻重试
+
+        Args:
+            error_class (ErrorClass): 本次失败的错误分类
+            attempts (int): 已查询的次数（包括本次）
+
+        Returns:
+            float: 等待的秒数
+        """
+        base_delay: float = self._base_delays.get(error_class, 1.0)
+        delay: float = min(self._max_delay, base_delay * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
@@ -0,0 +1,64 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class RetryQueue(Generic[T]):
+    """延时队列。放入的元素在等待指定时间后被送回目标队列，由 run 协程负责搬运"""
+
+    def __init__(self):
+        # 堆中元素为 (到期时间, 序号, 元素)，序号保证到期时间相同时先进先出，且不比较元素本身
+        self._heap: list[tuple[float, int, T]] = []
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._closed: bool = False
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: T, delay: float) -> None:
+        """放入一个元素，delay 秒后送回目标队列
+
+        Args:
+            item (T): 元素
+            delay (float): 延时秒数
+        """
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._counter), item))
+        self._wakeup.set()
+
+    def close(self) -> None:
+        """通知 run 协程在送回全部元素后退出"""
+        self._closed = True
+        self._wakeup.set()
+
+    async def run(self, target_queue: asyncio.Queue[T]) -> None:
+        """持续将到期的元素送回目标队列，直到 close 被调用且没有剩余元素
+
+        Args:
+            target_queue (asyncio.Queue[T]): 目标队列
+        """
+        while True:
+            if not self._heap:
+                if self._closed:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            wait_time: float = self._heap[0][0] - time.monotonic()
+            if wait_time > 0:
+                # 等待最早的元素到期，期间有新元素放入则重新计算
+                self._wakeup.clear()
+                try:
+                    async with asyncio.timeout(wait_time):
+                        await self._wakeup.wait()
+                except TimeoutError:
+                    pass
+                continue
+
+            _, _, item = heapq.heappop(self._heap)
+            await target_queue.put(item)
@@ -7,6 +7,31 @@ CLI_HELP_OUTPUT = "指定保存过期域名的文件"
 CLI_HELP_ERROR = "指定保存未能成功查询的域名的文件"
 CLI_HELP_NUM_PROCESSES = "指定并发进程数。未指定则为 1"
 CLI_HELP_NUM_THREADS = "指定每进程最大并发线程数。"
+CLI_HELP_MAX_CONCURRENCY = (
+    "指定每进程最大并发查询数。未指定时，异步型插件为 100，同步型插件与线程数一致"
+)
+CLI_HELP_RATE_LIMIT_CONFIG = (
+    "指定按 WHOIS 服务器限速的 JSON 配置文件。未指定时不按服务器限速"
+)
+CLI_HELP_MAX_RETRIES = "指定单个域名查询失败后最多重试的次数，为 0 时不重试。未指定则为 3"
+CLI_HELP_CACHE = (
+    "指定查询结果缓存数据库文件，不存在则自动创建。缓存中未失效的域名不再重新查询"
+)
+CLI_HELP_JOURNAL = "指定运行日志文件，记录每个域名的处理结果，用于中断后继续查询"
+CLI_HELP_RESUME = "从 --journal 指定的运行日志继续上次中断的查询，跳过已完成的域名。未指定时会清空已有的运行日志"
+CLI_HELP_JSONL = "指定结构化结果流文件（JSON Lines），每个域名写入一行，包含状态、过期时间、插件、WHOIS 服务器、错误分类、查询次数与耗时"
+CLI_HELP_RECORD = (
+    "指定归档文件，录制插件每次返回的原始结果，之后可使用 --replay 离线重新处理"
+)
+CLI_HELP_REPLAY = "指定 --record 录制的归档文件，不联网，直接使用归档中的原始结果重新处理。未指定 -id 时使用 replay_query 插件"
+CLI_HELP_REPLAY_PLUGIN_ID = (
+    "指定重放归档中哪个插件录制的记录。归档中有多个插件的记录时必须指定"
+)
+CLI_HELP_DNS_PREWARM = "开始查询前预先解析插件可能连接的全部 WHOIS 服务器主机名"
+CLI_HELP_DNS_PRECHECK = (
+    "查询 WHOIS 前先查询域名的 NS 记录，有有效委派的域名视为已注册，不再查询 WHOIS"
+)
+CLI_HELP_DNS_RESOLVER = "指定 --dns-precheck 使用的 DNS 服务器，格式为 host 或 host:port。未指定时使用系统配置的 DNS 服务器"
 CLI_HELP_QUIET = "使程序减少输出。--quiet 或 --quiet True 均可启用此选项"
 CLI_HELP_PLUGIN_ID = "指定插件 ID 来进行查询，可用 ID 有（下列 ID 用逗号分隔）：{ids}"
 
@@ -28,6 +53,13 @@ INFO_NOT_EXPIRED = "✅ {domain}  🆗 Not Expired"
 INFO_API_INTERNET_ERROR = "⚠️ {domain}  🛜 API Internet Error"
 INFO_API_LIMIT = "⚠️ {domain}  🚫 API Limit"
 INFO_API_ERROR = "⚠️ {domain}  🚫 API Error"
+INFO_DNS_DELEGATED = "✅ {domain}  🌐 Delegated"
+INFO_DNS_PREWARM = "🌐 DNS prewarm: {resolved}/{total} WHOIS servers resolved"
+INFO_RESUME = "⏯️ Resume from journal: {completed} completed, {retry} to retry"
+INFO_LOST_TASKS = (
+    "⚠️ {count} domains were not processed because worker processes exited early"
+)
+INFO_RETRY = "🔁 {domain}  ⏳ {error_class}, Retry {retry}/{max_retries} in {delay:.1f}s"
 
 PLUGIN_DIR_LOAD_ERROR = (
     "文件夹型插件 {plugin_dir_name} 加载出现错误，请联系对应插件作者修复这个问题"
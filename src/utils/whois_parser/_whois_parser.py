@@ -1,104 +1,141 @@
 import datetime
-from typing import Literal
+import re
+from typing import Literal, Optional
 
 from src.defined_types import Err, ParsedWhoisData, Result
 from src.defined_types.datetime_parser_result import DatetimeParserErrResult
 
 from ..date_utils import datetime_string_parser
 
+# 行首的字段名-字段类别 键值对，字段名后紧跟冒号
+_WHOIS_FIELD_KEYS: dict[str, str] = {
+    "Registrar Registration Expiration Date": "expiry_date",
+    "Expiration Time": "expiry_date",  # .cn
+    "Registry Expiry Date": "expiry_date",
+    "Expiry date": "expiry_date",  # .uk
+    "Expiry Date": "expiry_date",
+    "expire": "expiry_date",  # .mk
+    "Domain Status": "domain_status",
+    "Domain Name": "domain_name",
+    "Domain name": "domain_name",
+    "domain": "domain_name",
+    "Registrar": "registrar",
+    "Sponsoring Registrar": "registrar",  # .cn
+    "registrar": "registrar",
+    "Creation Date": "creation_date",
+    "Registration Time": "creation_date",  # .cn
+    "Registered on": "creation_date",  # .uk
+    "created": "creation_date",
+    "Name Server": "name_server",
+    "nserver": "name_server",
+}
 
-def whois_parser(raw_whois: str) -> ParsedWhoisData:
+# 以换行符开头，正则引擎会先快速查找换行符，只在行首尝试匹配字段名。使用时需在原始数据前加一个换行符
+_WHOIS_FIELD_PATTERN: re.Pattern[str] = re.compile(
+    r"\n[ \t]*("
+    + "|".join(re.escape(key) for key in sorted(_WHOIS_FIELD_KEYS, key=len, reverse=True))
+    + r"):[ \t]*([^\r\n]*)"
+)
+
+
+def whois_parser(raw_whois: str, domain: str = "") -> ParsedWhoisData:
     """解析原始 whois 数据
 
+    使用一个正则表达式遍历一次原始数据，同时得到域名状态、过期时间，以及注册商、注册时间、域名服务器
+
     Args:
         raw_whois (str): 原始 whois 数据
+        domain (str, optional): 查询的域名，直接填入结果
 
     Returns:
         ParsedWhoisData: 解析后的结构化 whois 数据
     """
-    domain_status = _check_domain_status(raw_whois)
-    if not domain_status[0]:
-        return {
-            "domain": "",
-            "status": domain_status,
-            "raw": raw_whois,
-            "registry_expiry_date": Err(
-                {
-                    "msg": "Date not found",
-                    "err": ValueError("Date not found"),
-                    "raw": raw_whois,
-                }
-            ),
-        }
-
-    if raw_whois.startswith("1") or raw_whois.startswith("0"):
-        # .ch .li 特殊规定 不提供可用的域数据
-        # https://www.nic.li/whois/domaincheck/#collapse-c25cbf2f-a663-11e6-89db-525400a7a801-2
-        return {
-            "domain": "",
-            "status": domain_status,
-            "raw": raw_whois,
-            "registry_expiry_date": Err(
-                {
-                    "msg": "Date not found",
-                    "err": ValueError("Date not found"),
-                    "raw": raw_whois,
-                }
-            ),
-        }
-
-    # 已注册 or 赎回期
-    return {
-        "domain": "",
-        "status": domain_status,
-        "raw": raw_whois,
-        "registry_expiry_date": _whois_registry_expiry_date_parser(raw_whois),
-    }
+    # .ch .li 特殊规定 不提供可用的域数据
+    # https://www.nic.li/whois/domaincheck/#collapse-c25cbf2f-a663-11e6-89db-525400a7a801-2
+    if raw_whois.startswith("1"):
+        return _build_parsed_whois_data(domain, (False, "unregistered"), raw_whois)
+    if raw_whois.startswith("0"):
+        return _build_parsed_whois_data(domain, (True, "registered"), raw_whois)
+
+    has_domain_name: bool = False
+    is_redemption: bool = False
+    expiry_date: Optional[str] = None
+    registrar: Optional[str] = None
+    creation_date: Optional[str] = None
+    name_servers: list[str] = []
+    for key, value in _WHOIS_FIELD_PATTERN.findall("\n" + raw_whois):
+        match _WHOIS_FIELD_KEYS[key]:
+            case "expiry_date":
+                # 使用第一个过期时间
+                if expiry_date is None:
+                    expiry_date = value.strip()
+            case "domain_status":
+                if value.startswith("redemptionPeriod"):
+                    is_redemption = True
+            case "domain_name":
+                has_domain_name = True
+            case "registrar":
+                if registrar is None and value.strip():
+                    registrar = value.strip()
+            case "creation_date":
+                if creation_date is None and value.strip():
+                    creation_date = value.strip()
+            case "name_server":
+                if value.strip():
+                    name_servers.append(value.strip().lower())
+
+    domain_status: tuple[bool, Literal["registered", "redemption", "unregistered"]]
+    if is_redemption:
+        domain_status = (True, "redemption")
+    elif has_domain_name:
+        domain_status = (True, "registered")
+    else:
+        # 未注册时不解析过期时间
+        return _build_parsed_whois_data(domain, (False, "unregistered"), raw_whois)
+
+    parsed_whois_data: ParsedWhoisData = _build_parsed_whois_data(
+        domain, domain_status, raw_whois, expiry_date
+    )
+    if registrar is not None:
+        parsed_whois_data["registrar"] = registrar
+    if creation_date is not None:
+        parsed_whois_data["creation_date"] = creation_date
+    if name_servers:
+        parsed_whois_data["name_servers"] = name_servers
+    return parsed_whois_data
 
 
-def _check_domain_status(
+def _build_parsed_whois_data(
+    domain: str,
+    domain_status: tuple[bool, Literal["registered", "redemption", "unregistered"]],
     raw_whois: str,
-) -> tuple[bool, Literal["registered", "redemption", "unregistered"]]:
-    """
-    检查域名是否处于赎回期、已注册或未注册状态。
+    expiry_date: Optional[str] = None,
+) -> ParsedWhoisData:
+    """生成解析结果，解析过期时间
 
     Args:
-        raw_whois (str): 原始 WHOIS 数据。
+        domain (str): 查询的域名
+        domain_status (tuple[bool, Literal["registered", "redemption", "unregistered"]]): 域名状态
+        raw_whois (str): 原始 whois 数据
+        expiry_date (Optional[str], optional): 过期时间字段的值。如果为 None，则为找不到过期时间
 
     Returns:
-        Tuple[bool, str]: 返回一个元组，第一个元素表示是否为未注册状态，未注册则为 False。第二个元素表示状态（"registered", "redemption", "unregistered"）。
+        ParsedWhoisData: 解析后的结构化 whois 数据
     """
-    # .ch .li 特殊规定
-    if raw_whois.startswith("1"):
-        return (False, "unregistered")
-    elif raw_whois.startswith("0"):
-        return (True, "registered")
-
-    if "Domain Status: redemptionPeriod" in raw_whois:
-        return (True, "redemption")
-    elif any(
-        keyword in raw_whois for keyword in ["Domain Name:", "domain:", "Domain name:"]
-    ):
-        return (True, "registered")
-    else:
-        return (False, "unregistered")
-
-
-def _whois_registry_expiry_date_parser(
-    raw_whois: str,
-) -> Result[datetime.datetime, DatetimeParserErrResult]:
-    # 一行一行遍历原始结果，找到包含指定开头的行
-    for line in raw_whois.split("\n"):
-        for prefix in [
-            "Registrar Registration Expiration Date:",
-            "Expiration Time:",
-            "Registry Expiry Date:",
-            "Expiry date:",
-            "Expiry Date:",
-            "expire:",  # .mk
-        ]:
-            if prefix in line:
-                return datetime_string_parser(line.strip().removeprefix(prefix).strip())
-    return Err(
-        {"msg": "Date not found", "err": ValueError("Date not found"), "raw": raw_whois}
+    registry_expiry_date: Result[datetime.datetime, DatetimeParserErrResult] = (
+        datetime_string_parser(expiry_date)
+        if expiry_date is not None
+        else Err(
+            {
+                "msg": "Date not found",
+                "err": ValueError("Date not found"),
+                "raw": raw_whois,
+            }
+        )
     )
+    return {
+        "domain": domain,
+        "status": domain_status,
+        "raw": raw_whois,
+        "registry_expiry_date": registry_expiry_date,
+    }
@@ -0,0 +1,5 @@
+from ._whois_servers import (
+    WHOIS_SERVER_LIST_FILE,
+    get_whois_server_dict,
+    parse_whois_server_list,
+)
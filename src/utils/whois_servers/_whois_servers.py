@@ -0,0 +1,42 @@
+import functools
+from pathlib import Path
+
+# 随程序发布的 后缀-WHOIS 服务器 对应表，使用 extra-scripts/get-whois-server-list 重新生成后替换此文件即可更新
+WHOIS_SERVER_LIST_FILE: Path = (
+    Path(__file__).resolve().parents[2] / "data" / "whois_server_list.tsv"
+)
+
+
+def parse_whois_server_list(text: str) -> dict[str, str]:
+    """解析对应表，每行为 后缀<TAB>WHOIS 服务器主机名，# 开头的行为注释
+
+    Args:
+        text (str): 对应表文件的内容
+
+    Returns:
+        dict[str, str]: 后缀-WHOIS 服务器主机名 键值对
+    """
+    whois_server_dict: dict[str, str] = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        suffix, _, whois_server = line.partition("\t")
+        whois_server_dict[suffix.strip().lower()] = whois_server.strip()
+    return whois_server_dict
+
+
+@functools.cache
+def get_whois_server_dict(path: Path = WHOIS_SERVER_LIST_FILE) -> dict[str, str]:
+    """读取对应表，第一次调用时才读取，之后进程内的全部插件共用同一份
+
+    Args:
+        path (Path, optional): 对应表文件路径
+
+    Returns:
+        dict[str, str]: 后缀-WHOIS 服务器主机名 键值对，请勿修改
+
+    Raises:
+        FileNotFoundError: 对应表文件不存在
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_whois_server_list(f.read())
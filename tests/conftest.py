@@ -0,0 +1,86 @@
+import types
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import pytest
+
+from src.main import main
+from src.plugin_manager import PluginManager
+
+
+@pytest.fixture
+def register_plugin(monkeypatch) -> Callable[..., types.ModuleType]:
+    """生成测试用插件并注册到 PluginManager，测试结束后自动移除。fork 方式启动的子进程同样可以使用
+
+    Example:
+        >>> plugin = register_plugin("fake", main=lambda domain: {"code": 200, "raw": ""})
+    """
+
+    def register(
+        id: str,
+        mode: str = "sync",
+        metadata: Optional[dict] = None,
+        **attrs,
+    ) -> types.ModuleType:
+        """
+        Args:
+            id (str): 插件 id
+            mode (str, optional): 插件类型，sync 或 async
+            metadata (Optional[dict], optional): METADATA 中的其他项，如 max_concurrency
+            **attrs: 插件的函数与属性，如 main、setup、get_whois_server
+
+        Returns:
+            types.ModuleType: 插件对象
+        """
+        plugin = types.ModuleType(id)
+        plugin.METADATA = {
+            "id": id,
+            "mode": mode,
+            "author": "test",
+            "help": "",
+            **(metadata or {}),
+        }
+        for name, value in attrs.items():
+            setattr(plugin, name, value)
+        monkeypatch.setitem(PluginManager()._loaded_plugin, id, plugin)
+        return plugin
+
+    return register
+
+
+@pytest.fixture
+def run_main(tmp_path) -> Callable[..., Path]:
+    """写入输入文件后调用 main，未指定的参数使用单进程、不输出文件的默认值
+
+    Example:
+        >>> run_main(100, "fake", num_processes=2)  # 查询 example0.com ~ example99.com
+    """
+
+    def run(domains: int | Iterable[str], plugin_id: str, **kwargs) -> Path:
+        """
+        Args:
+            domains (int | Iterable[str]): 输入文件的每一行。为整数时为 example0.com 起的这么多个域名
+            plugin_id (str): 使用的插件 id
+            **kwargs: main 的其他参数
+
+        Returns:
+            Path: 输入文件路径
+        """
+        if isinstance(domains, int):
+            domains = (f"example{i}.com" for i in range(domains))
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("\n".join(domains), encoding="utf-8")
+        main(
+            **{
+                "input_file": str(input_file),
+                "output_file": None,
+                "error_file": None,
+                "num_processes": 1,
+                "max_num_threads_per_process": None,
+                "plugin_id": plugin_id,
+                **kwargs,
+            }
+        )
+        return input_file
+
+    return run
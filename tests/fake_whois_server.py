@@ -0,0 +1,323 @@
+"""本地 WHOIS 服务器模拟器，用于在不联网的情况下测试与压测查询链路
+
+测试与基准测试用 redirect_builtin_plugins 让内置插件把全部查询发送到模拟服务器。
+
+按域名的第一段决定返回内容：
+  - free*、avail*：未注册
+  - redemption*：赎回期
+  - expired*：已注册但已过期
+  - baddate*：已注册但过期时间无法解析
+  - 其他：已注册，过期时间由域名决定（可用 unregistered_ratio 让一部分域名未注册）
+.ch .li 域名按 whois.nic.ch 4343 端口的协议返回状态码。
+
+Example:
+    python -m tests.fake_whois_server --port 4343 --latency 0.05 --throttle-rate 0.01
+"""
+
+import argparse
+import asyncio
+import datetime
+import random
+import socket
+import struct
+import sys
+import threading
+import zlib
+from typing import Any, Callable, Optional
+
+THROTTLE_RESPONSE: str = "Your access is too fast,please try again later.\r\n"
+NIC_CH_THROTTLE_RESPONSE: str = "-95: Access restricted\n"
+TRICKLE_CHUNK_SIZE: int = 64  # 慢速返回时每次发送的字节数
+LISTEN_BACKLOG: int = 4096
+
+
+def _stable_hash(domain: str) -> int:
+    return zlib.crc32(domain.encode("utf-8"))
+
+
+def render_response(
+    domain: str,
+    unregistered_ratio: float = 0.0,
+    today: Optional[datetime.date] = None,
+) -> str:
+    """生成域名对应的 WHOIS 响应，同一个域名总是得到相同的响应
+
+    Args:
+        domain (str): 查询的域名
+        unregistered_ratio (float, optional): 未按前缀指定状态的域名中，未注册的比例
+        today (Optional[datetime.date], optional): 计算过期时间使用的日期。如果为 None，则使用当天
+
+    Returns:
+        str: 原始 WHOIS 响应
+    """
+    domain = domain.strip().lower()
+    label: str = domain.split(".", 1)[0]
+    suffix: str = domain.rsplit(".", 1)[-1]
+    digest: int = _stable_hash(domain)
+    if today is None:
+        today = datetime.date.today()
+
+    is_unregistered: bool = label.startswith(("free", "avail")) or (
+        not label.startswith(("redemption", "expired", "baddate"))
+        and digest % 10000 < unregistered_ratio * 10000
+    )
+
+    # .ch .li 只返回是否可注册
+    if suffix in ("ch", "li"):
+        if is_unregistered:
+            return "1: Domain name can be registered\n"
+        return "0: Domain name cannot be registered\n"
+
+    if is_unregistered:
+        return f'No match for "{domain.upper()}".\r\n>>> Last update of whois database: {today.isoformat()}T00:00:00Z <<<\r\n'
+
+    expiry_date = today + datetime.timedelta(days=30 + digest % 3650)
+    status: str = "clientTransferProhibited"
+    if label.startswith("redemption"):
+        expiry_date = today - datetime.timedelta(days=10)
+        status = "redemptionPeriod"
+    elif label.startswith("expired"):
+        expiry_date = today - datetime.timedelta(days=1 + digest % 30)
+
+    # 不同注册局使用的格式，覆盖解析器支持的写法
+    expiry_line: str
+    match suffix:
+        case "cn":
+            expiry_line = f"Expiration Time: {expiry_date.isoformat()} 12:00:00"
+        case "uk":
+            expiry_line = f"    Expiry date:  {expiry_date.strftime('%d-%b-%Y')}"
+        case "mk":
+            expiry_line = f"expire:       {expiry_date.strftime('%d.%m.%Y')}"
+        case "org" | "info":
+            expiry_line = f"Registrar Registration Expiration Date: {expiry_date.isoformat()}T23:59:59Z"
+        case _:
+            expiry_line = f"Registry Expiry Date: {expiry_date.isoformat()}T04:00:00Z"
+    if label.startswith("baddate"):
+        expiry_line = "Registry Expiry Date: not-a-date"
+
+    return (
+        f"   Domain Name: {domain.upper()}\r\n"
+        f"   Registrar: Fake Registrar, Inc.\r\n"
+        f"   Creation Date: 2000-01-01T00:00:00Z\r\n"
+        f"   {expiry_line.strip()}\r\n"
+        f"   Domain Status: {status}\r\n"
+        f"   Name Server: NS1.{domain.upper()}\r\n"
+        f"   Name Server: NS2.{domain.upper()}\r\n"
+    )
+
+
+class FakeWhoisServer:
+    """基于 asyncio 的本地 WHOIS 服务器，可注入延迟、慢速返回、连接重置与查询过快限制
+
+    Example:
+        >>> async with FakeWhoisServer(latency=0.01) as server:
+        ...     await whois_request("example.com", "127.0.0.1", port=server.port)
+
+        >>> server = FakeWhoisServer().start_in_thread()
+        >>> redirect_builtin_plugins(server.address)
+        >>> server.stop()
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        trickle_interval: float = 0.0,
+        reset_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        unregistered_ratio: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            host (str, optional): 监听的地址
+            port (int, optional): 监听的端口，为 0 时自动选择空闲端口
+            latency (float, optional): 收到查询后等待多少秒再返回
+            trickle_interval (float, optional): 大于 0 时分块慢速返回，每块之间等待的秒数
+            reset_rate (float, optional): 直接重置连接的查询比例
+            throttle_rate (float, optional): 返回“查询过快”的查询比例
+            unregistered_ratio (float, optional): 未按前缀指定状态的域名中，未注册的比例
+            seed (Optional[int], optional): 随机数种子，用于复现注入的故障
+        """
+        self.host: str = host
+        self.port: int = port
+        self.latency: float = latency
+        self.trickle_interval: float = trickle_interval
+        self.reset_rate: float = reset_rate
+        self.throttle_rate: float = throttle_rate
+        self.unregistered_ratio: float = unregistered_ratio
+        self.request_count: int = 0  # 收到的查询数
+        self._random = random.Random(seed)
+        self._server: Optional[asyncio.Server] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        """host:port 格式的地址，可直接传给 redirect_builtin_plugins"""
+        return f"{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """开始监听，需在事件循环中调用"""
+        # 压测时连接数很多，加大等待队列，避免握手被丢弃后客户端等待重传
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, backlog=LISTEN_BACKLOG
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """停止监听"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeWhoisServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def start_in_thread(self) -> "FakeWhoisServer":
+        """在后台线程的事件循环中运行，用于被测代码自己运行事件循环（如 asyncio.run）的场景
+
+        Returns:
+            FakeWhoisServer: 自身，开始监听后返回
+        """
+        started = threading.Event()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self) -> None:
+        """停止后台线程中运行的服务器"""
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+            self._thread = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            domain: str = (await reader.readline()).decode("utf-8").strip()
+            self.request_count += 1
+            is_nic_ch: bool = domain.lower().endswith((".ch", ".li"))
+
+            if self.latency > 0:
+                await asyncio.sleep(self.latency)
+
+            if self._random.random() < self.reset_rate:
+                # SO_LINGER 为 0 时关闭连接会发送 RST，客户端收到 Connection reset
+                writer.get_extra_info("socket").setsockopt(
+                    socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                )
+                writer.transport.abort()
+                return
+
+            response: str
+            if self._random.random() < self.throttle_rate:
+                response = NIC_CH_THROTTLE_RESPONSE if is_nic_ch else THROTTLE_RESPONSE
+            else:
+                response = render_response(domain, self.unregistered_ratio)
+
+            data: bytes = response.encode("utf-8")
+            if self.trickle_interval > 0:
+                for i in range(0, len(data), TRICKLE_CHUNK_SIZE):
+                    writer.write(data[i : i + TRICKLE_CHUNK_SIZE])
+                    await writer.drain()
+                    await asyncio.sleep(self.trickle_interval)
+            else:
+                writer.write(data)
+                await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer.transport.abort()
+
+
+def redirect_builtin_plugins(
+    address: str, set_attr: Callable[[Any, str, Any], None] = setattr
+) -> None:
+    """让已导入的内置插件 async_query、sync_query 把全部查询发送到 address，而不是真实的 WHOIS 服务器
+
+    插件管理器与测试可能以不同的模块名导入同一个插件，因此替换每个已导入的插件模块中建立连接的函数。
+    使用 multiprocessing 的 fork 方式启动的子进程会继承替换结果。
+
+    Args:
+        address (str): 模拟服务器的 host:port 地址
+        set_attr (Callable[[Any, str, Any], None], optional): 替换属性的函数，测试中传入 monkeypatch.setattr 以便自动还原
+    """
+    import plugins.async_query
+    import plugins.sync_query
+
+    from src.utils.dns_cache import create_cached_connection, open_cached_connection
+
+    host, _, port = address.rpartition(":")
+
+    def open_connection(server: str, server_port: int):
+        return open_cached_connection(host, int(port))
+
+    def create_connection(server: str, server_port: int, timeout: float) -> socket.socket:
+        return create_cached_connection(host, int(port), timeout)
+
+    for name, module in list(sys.modules.items()):
+        if name.split(".")[:2] not in (
+            ["plugins", "async_query"],
+            ["plugins", "sync_query"],
+        ):
+            continue
+        if hasattr(module, "open_cached_connection"):
+            set_attr(module, "open_cached_connection", open_connection)
+        if hasattr(module, "create_cached_connection"):
+            set_attr(module, "create_cached_connection", create_connection)
+
+
+async def _serve_forever(server: FakeWhoisServer) -> None:
+    await server.start()
+    print(f"Fake WHOIS server listening on {server.address}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="本地 WHOIS 服务器模拟器")
+    parser.add_argument("--host", default="127.0.0.1", type=str)
+    parser.add_argument("--port", default=43, type=int)
+    parser.add_argument("--latency", default=0.0, type=float)
+    parser.add_argument("--trickle-interval", default=0.0, type=float)
+    parser.add_argument("--reset-rate", default=0.0, type=float)
+    parser.add_argument("--throttle-rate", default=0.0, type=float)
+    parser.add_argument("--unregistered-ratio", default=0.0, type=float)
+    parser.add_argument("--seed", default=None, type=int)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(
+            _serve_forever(
+                FakeWhoisServer(
+                    host=args.host,
+                    port=args.port,
+                    latency=args.latency,
+                    trickle_interval=args.trickle_interval,
+                    reset_rate=args.reset_rate,
+                    throttle_rate=args.throttle_rate,
+                    unregistered_ratio=args.unregistered_ratio,
+                    seed=args.seed,
+                )
+            )
+        )
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from src.defined_types import Err, Ok
+from src.plugin_caller import (
+    call_async_batch_plugin_by_id,
+    call_sync_batch_plugin_by_id,
+)
+
+from .fake_whois_server import render_response
+
+
+def _create_batch_plugin(register_plugin, mode: str, max_batch_size: int):
+    """生成一个批量型插件，记录每次调用的域名数。fail* 域名返回错误，missing* 域名不返回，
+    throttled* 域名以 code 200 返回限流提示"""
+    batch_sizes: list[int] = []
+
+    def answer(domains: list[str]) -> dict:
+        batch_sizes.append(len(domains))
+        rets: dict = {}
+        for domain in domains:
+            if domain.startswith("fail"):
+                rets[domain] = {"code": 403, "raw": "Forbidden"}
+            elif domain.startswith("throttled"):
+                rets[domain] = {"code": 200, "raw": "Queried interval is too short."}
+            elif not domain.startswith("missing"):
+                rets[domain] = {"code": 200, "raw": render_response(domain)}
+        return rets
+
+    async def main_batch_async(domains: list[str]) -> dict:
+        return answer(domains)
+
+    return register_plugin(
+        f"fake_batch_{mode}",
+        mode=mode,
+        metadata={"max_batch_size": max_batch_size},
+        main_batch=main_batch_async if mode == "async" else answer,
+        batch_sizes=batch_sizes,
+    )
+
+
+@pytest.fixture
+def batch_plugins(register_plugin):
+    return {
+        mode: _create_batch_plugin(register_plugin, mode, max_batch_size=100)
+        for mode in ("async", "sync")
+    }
+
+
+# 批量查询的结果按域名拆分，插件漏掉的域名视为服务器错误
+def test_call_batch_plugin(batch_plugins):
+    domains = ["example.com", "free-name.com", "fail-name.com", "missing-name.com"]
+    records: list[str] = []
+
+    for results in (
+        asyncio.run(
+            call_async_batch_plugin_by_id(
+                "fake_batch_async", domains, lambda domain, ret: records.append(domain)
+            )
+        ),
+        call_sync_batch_plugin_by_id("fake_batch_sync", domains),
+    ):
+        assert list(results) == domains
+        assert isinstance(results["example.com"], Ok)
+        assert results["example.com"].value["domain"] == "example.com"
+        assert results["free-name.com"].value["status"][1] == "unregistered"
+        assert isinstance(results["fail-name.com"], Err)
+        assert results["fail-name.com"].error["code"] == 403
+        assert results["missing-name.com"].error["code"] == 500
+
+    assert records == ["example.com", "free-name.com", "fail-name.com"]
+
+
+# 批量查询与单个查询一样，code 200 的限流提示按限流处理，不会误判为未注册
+def test_call_batch_plugin_throttled(batch_plugins):
+    results = call_sync_batch_plugin_by_id("fake_batch_sync", ["throttled-name.com"])
+    assert results["throttled-name.com"].error["code"] == 503
+
+
+# 插件整体抛出异常时，这一批的域名都得到异常结果
+def test_call_batch_plugin_exception(batch_plugins):
+    def main_batch(domains):
+        raise RuntimeError("boom")
+
+    batch_plugins["sync"].main_batch = main_batch
+    results = call_sync_batch_plugin_by_id("fake_batch_sync", ["a.com", "b.com"])
+    assert all(
+        isinstance(result, Err) and "err" in result.error for result in results.values()
+    )
+
+
+# 完整流水线：域名按批查询，每批不超过 max_batch_size
+@pytest.mark.parametrize("mode", ["async", "sync"])
+def test_main_with_batch_plugin(batch_plugins, run_main, mode, tmp_path):
+    domains = [f"example{i}.com" for i in range(230)] + ["free-a.com", "free-b.net"]
+    output_file = tmp_path / "output.txt"
+
+    run_main(domains, f"fake_batch_{mode}", output_file=str(output_file))
+
+    batch_sizes: list[int] = batch_plugins[mode].batch_sizes
+    assert sum(batch_sizes) == len(domains)
+    assert max(batch_sizes) <= 100
+    assert len(batch_sizes) < 10
+    assert sorted(output_file.read_text(encoding="utf-8").splitlines()) == [
+        "free-a.com",
+        "free-b.net",
+    ]
+
+
+# 不同 WHOIS 服务器的域名混在一起输入时，每批只包含同一个服务器的域名，并按该服务器限速
+def test_main_batch_grouped_by_server(register_plugin, run_main):
+    batches: list[list[str]] = []
+
+    async def main_batch(domains: list[str]) -> dict:
+        batches.append(domains)
+        return {
+            domain: {"code": 200, "raw": render_response(domain)} for domain in domains
+        }
+
+    register_plugin(
+        "fake_batch_servers",
+        mode="async",
+        metadata={"max_batch_size": 10},
+        main_batch=main_batch,
+        get_whois_server=lambda domain, whois_server: (
+            f"whois.nic.{domain.rsplit('.', 1)[1]}"
+        ),
+    )
+    domains = [f"example{i}.{tld}" for i in range(20) for tld in ("com", "net", "org")]
+
+    run_main(domains, "fake_batch_servers")
+
+    assert sorted(domain for batch in batches for domain in batch) == sorted(domains)
+    for batch in batches:
+        assert len({domain.rsplit(".", 1)[1] for domain in batch}) == 1
@@ -0,0 +1,106 @@
+import asyncio
+import multiprocessing
+
+from src.utils.file_utils import BufferedFileWriter, ChannelWriter
+
+
+# 关闭时写入全部剩余的行，并追加到已有内容之后
+def test_buffered_file_writer_close(tmp_path):
+    path = tmp_path / "output.txt"
+    path.write_text("old.com\n", encoding="utf-8")
+
+    async def run() -> None:
+        writer = BufferedFileWriter(str(path), flush_size=1000, flush_interval=60)
+        writer.start()
+        for i in range(10):
+            writer.write(f"{i}.com")
+        await writer.close()
+
+    asyncio.run(run())
+    assert path.read_text(encoding="utf-8").splitlines() == ["old.com"] + [
+        f"{i}.com" for i in range(10)
+    ]
+
+
+# 达到 flush_size 行或超过 flush_interval 秒时，无需关闭即写入文件
+def test_buffered_file_writer_flush(tmp_path):
+    path = tmp_path / "output.txt"
+
+    async def run() -> None:
+        writer = BufferedFileWriter(str(path), flush_size=3, flush_interval=0.05)
+        writer.start()
+        for i in range(3):
+            writer.write(f"{i}.com")
+        await asyncio.sleep(0.02)
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+        writer.write("3.com")
+        await asyncio.sleep(0.2)
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 4
+        await writer.close()
+
+    asyncio.run(run())
+
+
+# 写入协程被取消时依然写入全部已提交的行
+def test_buffered_file_writer_cancel(tmp_path):
+    path = tmp_path / "output.txt"
+
+    async def run() -> None:
+        writer = BufferedFileWriter(str(path), flush_size=1000, flush_interval=60)
+        writer.start()
+        writer.write("a.com")
+        writer.write("b.com")
+        await asyncio.sleep(0)
+        assert writer._task is not None
+        writer._task.cancel()
+        await asyncio.gather(writer._task, return_exceptions=True)
+
+    asyncio.run(run())
+    assert path.read_text(encoding="utf-8").splitlines() == ["a.com", "b.com"]
+
+
+# 指定 flush_before 时，每批写入前先写完依赖的写入器中此前提交的行
+def test_buffered_file_writer_flush_before(tmp_path):
+    output_path = tmp_path / "output.txt"
+    journal_path = tmp_path / "journal.jsonl"
+
+    async def run() -> None:
+        output_writer = BufferedFileWriter(
+            str(output_path), flush_size=1000, flush_interval=60
+        )
+        journal_writer = BufferedFileWriter(
+            str(journal_path),
+            flush_size=1000,
+            flush_interval=0.01,
+            flush_before=[output_writer],
+        )
+        output_writer.start()
+        journal_writer.start()
+        output_writer.write("a.com")
+        journal_writer.write("a.com")
+        await asyncio.sleep(0.2)
+        assert journal_path.read_text(encoding="utf-8").splitlines() == ["a.com"]
+        assert output_path.read_text(encoding="utf-8").splitlines() == ["a.com"]
+
+        await output_writer.close()
+        await journal_writer.close()
+
+    asyncio.run(run())
+
+
+# 指定 flush_before 时，每次发送前先发送依赖的写入器中的行
+def test_channel_writer_flush_before():
+    channel = multiprocessing.Queue()
+
+    async def run() -> None:
+        output_writer = ChannelWriter(channel, "output")
+        journal_writer = ChannelWriter(
+            channel, "journal", flush_size=1, flush_before=[output_writer]
+        )
+        output_writer.write("a.com")
+        journal_writer.write("a.com")
+
+    asyncio.run(run())
+    assert channel.get(timeout=1) == ("output", ["a.com"])
+    assert channel.get(timeout=1) == ("journal", ["a.com"])
@@ -118,3 +118,37 @@ def test_datetime_string_parser_timezone_offset():
     assert result.value.minute == 45
     assert result.value.second == 0
     assert result.value.tzinfo == datetime.timezone.utc
+
+
+# ISO 8601 与常见注册局写法不经过 dateutil，其余写法仍交给 dateutil
+def test_datetime_string_parser_fast_path(monkeypatch):
+    from src.utils.date_utils import _datetime_parser
+
+    _datetime_parser._parse_datetime_string.cache_clear()
+
+    def parse(*args, **kwargs):
+        raise AssertionError("dateutil called")
+
+    monkeypatch.setattr(_datetime_parser.parser, "parse", parse)
+    for date_string in (
+        "2033-12-23T07:59:05Z",
+        "2025-08-12T07:35:59.862263Z",
+        "2025-11-09 22:31:20+00:00",
+        "12-Feb-2026",
+        "2025/01/01",
+        "2021.03.15 13:45:00",
+    ):
+        assert isinstance(datetime_string_parser(date_string), Ok), date_string
+    assert isinstance(datetime_string_parser("2025-W01"), Err)
+    assert isinstance(datetime_string_parser("24.11.2025"), Err)
+
+
+# 相同的字符串只解析一次，首尾空白不影响缓存
+def test_datetime_string_parser_cache():
+    from src.utils.date_utils import _datetime_parser
+
+    _datetime_parser._parse_datetime_string.cache_clear()
+    first = datetime_string_parser("12-Feb-2026")
+    second = datetime_string_parser(" 12-Feb-2026\r")
+    assert first.value == second.value
+    assert _datetime_parser._parse_datetime_string.cache_info().hits == 1
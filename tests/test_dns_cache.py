@@ -0,0 +1,73 @@
+import asyncio
+import socket
+
+import pytest
+
+from src.utils.dns_cache import DnsCache
+
+ADDR_INFOS = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", 0))]
+
+
+# 解析结果在 ttl 内直接使用缓存，过期后重新解析
+def test_dns_cache_resolve(monkeypatch):
+    calls: list[str] = []
+
+    def fake_getaddrinfo(host, port, type=0):
+        calls.append(host)
+        return ADDR_INFOS
+
+    monkeypatch.setattr(socket, "getaddrinfo", fake_getaddrinfo)
+
+    cache = DnsCache(ttl=60)
+    assert cache.resolve("whois.example") == ADDR_INFOS
+    assert cache.resolve("whois.example") == ADDR_INFOS
+    assert calls == ["whois.example"]
+
+    cache = DnsCache(ttl=0)
+    cache.resolve("whois.example")
+    cache.resolve("whois.example")
+    assert len(calls) == 3
+
+
+# 解析失败也会缓存一小段时间
+def test_dns_cache_negative(monkeypatch):
+    calls: list[str] = []
+
+    def fake_getaddrinfo(host, port, type=0):
+        calls.append(host)
+        raise socket.gaierror(-2, "Name or service not known")
+
+    monkeypatch.setattr(socket, "getaddrinfo", fake_getaddrinfo)
+
+    cache = DnsCache(negative_ttl=60)
+    for _ in range(2):
+        with pytest.raises(socket.gaierror):
+            cache.resolve("missing.example")
+    assert calls == ["missing.example"]
+
+
+# 同一个主机名的并发异步解析只请求一次，预热时解析失败的忽略
+def test_dns_cache_resolve_async(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_getaddrinfo(self, host, port, type=0):
+        calls.append(host)
+        await asyncio.sleep(0.01)
+        if host.startswith("missing"):
+            raise socket.gaierror(-2, "Name or service not known")
+        return ADDR_INFOS
+
+    monkeypatch.setattr(asyncio.BaseEventLoop, "getaddrinfo", fake_getaddrinfo)
+
+    async def run() -> None:
+        cache = DnsCache()
+        results = await asyncio.gather(
+            *(cache.resolve_async("whois.example") for _ in range(10))
+        )
+        assert results == [ADDR_INFOS] * 10
+        assert calls == ["whois.example"]
+
+        assert await cache.prewarm(["a.example", "b.example", "missing.example"]) == 2
+        assert cache.resolve("a.example") == ADDR_INFOS
+
+    asyncio.run(run())
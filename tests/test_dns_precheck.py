@@ -0,0 +1,182 @@
+import asyncio
+import json
+import socketserver
+import struct
+import threading
+
+import pytest
+from tests.fake_whois_server import FakeWhoisServer, redirect_builtin_plugins
+
+from src.main import main
+from src.plugin_manager import PluginManager
+from src.utils.dns_precheck import (
+    DNS_TYPE_NS,
+    DnsPrecheck,
+    build_query,
+    parse_resolver_address,
+    parse_response,
+)
+
+
+def _build_stub_response(query: bytes) -> bytes | None:
+    """按域名的第一段生成响应：free* 不存在，nons* 没有 NS 记录，servfail* 解析失败，drop* 不响应，其他有 NS 记录"""
+    query_id: int = struct.unpack_from("!H", query)[0]
+    labels: list[str] = []
+    offset: int = 12
+    while query[offset]:
+        labels.append(query[offset + 1 : offset + 1 + query[offset]].decode())
+        offset += 1 + query[offset]
+    question: bytes = query[12 : offset + 5]
+    label: str = labels[0]
+
+    if label.startswith("drop"):
+        return None
+    rcode: int = 0
+    answers: list[bytes] = []
+    if label.startswith("free"):
+        rcode = 3
+    elif label.startswith("servfail"):
+        rcode = 2
+    elif not label.startswith("nons"):
+        for ns_label in (b"ns1", b"ns2"):
+            # 名称使用指向问题部分的压缩指针
+            rdata: bytes = bytes([len(ns_label)]) + ns_label + b"\xc0\x0c"
+            answers.append(
+                b"\xc0\x0c"
+                + struct.pack("!HHIH", DNS_TYPE_NS, 1, 3600, len(rdata))
+                + rdata
+            )
+    header: bytes = struct.pack(
+        "!HHHHHH", query_id, 0x8180 | rcode, 1, len(answers), 0, 0
+    )
+    return header + question + b"".join(answers)
+
+
+class StubDnsServer(socketserver.ThreadingUDPServer):
+    """在后台线程中运行的本地 DNS 服务器"""
+
+    def __init__(self):
+        self.query_count: int = 0
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(handler) -> None:
+                data, sock = handler.request
+                self.query_count += 1
+                response = _build_stub_response(data)
+                if response is not None:
+                    sock.sendto(response, handler.client_address)
+
+        super().__init__(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> str:
+        return f"127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self) -> "StubDnsServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def test_dns_message():
+    query: bytes = build_query("Example.com", DNS_TYPE_NS, 1234)
+    assert query[12:25] == b"\x07Example\x03com\x00"
+
+    response = parse_response(_build_stub_response(query) or b"")
+    assert response.query_id == 1234
+    assert response.rcode == 0
+    assert response.answers == [("example.com", DNS_TYPE_NS)] * 2
+
+    with pytest.raises(ValueError):
+        parse_response(query)  # 不是响应报文
+    with pytest.raises(ValueError):
+        build_query("a..com", DNS_TYPE_NS, 1)
+
+
+def test_parse_resolver_address():
+    assert parse_resolver_address("1.1.1.1") == ("1.1.1.1", 53)
+    assert parse_resolver_address("127.0.0.1:5353") == ("127.0.0.1", 5353)
+    assert parse_resolver_address("::1") == ("::1", 53)
+    assert parse_resolver_address("[::1]:5353") == ("::1", 5353)
+
+
+def test_dns_precheck_status():
+    async def run(address: str) -> list[str]:
+        precheck = DnsPrecheck(address, timeout=0.2)
+        try:
+            return await asyncio.gather(
+                precheck.check("example.com"),
+                precheck.check("free-name.com"),
+                precheck.check("nons-name.com"),
+                precheck.check("servfail-name.com"),
+                precheck.check("drop-name.com"),
+            )
+        finally:
+            precheck.close()
+
+    with StubDnsServer() as server:
+        assert asyncio.run(run(server.address)) == [
+            "delegated",
+            "nxdomain",
+            "undelegated",
+            "unknown",
+            "unknown",
+        ]
+        # 超时的查询会重发一次
+        assert server.query_count == 6
+
+
+# 有委派的域名不再查询 WHOIS，其余域名照常查询
+def test_main_with_dns_precheck(tmp_path, monkeypatch):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(
+        "\n".join(
+            [
+                "example.com",
+                "www.example.net",
+                "free-name.com",
+                "nons-name.org",
+                "servfail-name.com",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    output_file = tmp_path / "output.txt"
+    result_stream_file = tmp_path / "result.jsonl"
+
+    PluginManager().load_plugin(plugin_dir_path="plugins")
+    whois_server = FakeWhoisServer().start_in_thread()
+    try:
+        redirect_builtin_plugins(whois_server.address, monkeypatch.setattr)
+        with StubDnsServer() as dns_server:
+            main(
+                input_file=str(input_file),
+                output_file=str(output_file),
+                error_file=None,
+                num_processes=1,
+                max_num_threads_per_process=None,
+                plugin_id="async_query",
+                result_stream_file=str(result_stream_file),
+                dns_precheck=True,
+                dns_resolver=dns_server.address,
+            )
+    finally:
+        whois_server.stop()
+
+    assert whois_server.request_count == 3
+    assert output_file.read_text(encoding="utf-8").splitlines() == ["free-name.com"]
+    records = {
+        record["domain"]: record
+        for record in map(
+            json.loads, result_stream_file.read_text(encoding="utf-8").splitlines()
+        )
+    }
+    assert records["example.com"]["outcome"] == "delegated"
+    assert records["example.com"]["status"] == "registered"
+    assert records["example.com"]["attempts"] == 0
+    assert records["nons-name.org"]["attempts"] == 1
+    assert records["servfail-name.com"]["outcome"] == "not_expired"
@@ -0,0 +1,92 @@
+import pytest
+
+from src.utils.domain_trie import (
+    DomainMatch,
+    SuffixTrie,
+    find_whois_server,
+    get_domain_trie,
+)
+
+
+@pytest.fixture
+def trie() -> SuffixTrie:
+    trie = SuffixTrie()
+    trie.add_public_suffix_list(
+        [
+            "// ===BEGIN ICANN DOMAINS===",
+            "uk",
+            "co.uk",
+            "ck",
+            "*.ck",
+            "!www.ck",
+            "中国",
+            "// ===BEGIN PRIVATE DOMAINS===",
+            "github.io",
+        ]
+    )
+    trie.add_whois_servers(
+        {"uk": "whois.nic.uk", "co.uk": "whois.co.uk", "io": "whois.nic.io"}
+    )
+    return trie
+
+
+# 一次遍历得到可注册域名、公共后缀、是否为私有后缀与最长匹配的 WHOIS 服务器
+def test_match(trie):
+    assert trie.match("WWW.Example.CO.UK") == DomainMatch(
+        "example", "co.uk", False, "whois.co.uk"
+    )
+    assert trie.match("example.uk") == DomainMatch("example", "uk", False, "whois.nic.uk")
+    assert trie.match("blog.howiehz.github.io") == DomainMatch(
+        "howiehz", "github.io", True, "whois.nic.io"
+    )
+    assert trie.match("co.uk").registrable_domain == ""
+    assert trie.match("example.unknown") == DomainMatch("unknown", "", False, "")
+
+
+# 通配符与例外规则
+def test_match_wildcard(trie):
+    assert trie.match("a.b.ck")[:2] == ("a", "b.ck")
+    assert trie.match("a.www.ck")[:2] == ("www", "ck")
+
+
+# 非 ASCII 后缀同时匹配 Unicode 与 Punycode 写法
+def test_match_idn(trie):
+    assert trie.match("例子.中国")[:2] == ("例子", "中国")
+    assert trie.match("example.xn--fiqs8s")[:2] == ("example", "xn--fiqs8s")
+
+
+# 从链接中取出主机名，IP 地址不拆分
+def test_match_url(trie):
+    domain_match = trie.match_url("https://user@www.example.co.uk:8080/a?b#c")
+    assert domain_match.registrable_domain == "example.co.uk"
+    assert trie.match_url("http://1.2.3.4/path").domain == "1.2.3.4"
+    assert trie.match_url("http://[::1]:80/").domain == "[::1]"
+
+
+# 使用随程序发布的公共后缀列表时，结果与 tldextract 一致（期望值由 tldextract 5.1 得到）
+def test_match_same_as_tldextract():
+    for url, expected in (
+        ("https://www.example.com/path", ("example", "com", False)),
+        ("http://foo.bar.github.io", ("bar", "github.io", True)),
+        ("www.city.kawasaki.jp", ("city", "kawasaki.jp", False)),
+        ("a.b.kawasaki.jp", ("a", "b.kawasaki.jp", False)),
+        ("example.xn--fiqs8s", ("example", "xn--fiqs8s", False)),
+        ("例子.公司.cn", ("例子", "公司.cn", False)),
+        ("localhost", ("localhost", "", False)),
+        ("example.co.uk.", ("example", "co.uk", False)),
+        ("192.168.0.1", ("192.168.0.1", "", False)),
+    ):
+        domain_match = get_domain_trie().match_url(url)
+        assert (
+            domain_match.domain,
+            domain_match.suffix,
+            domain_match.is_private,
+        ) == expected, url
+
+
+# 提取可注册域名与查找 WHOIS 服务器共用同一棵后缀树，一次匹配同时得到两者
+def test_domain_trie_includes_whois_servers():
+    domain_match = get_domain_trie().match_url("https://www.example.com/path")
+    assert domain_match.registrable_domain == "example.com"
+    assert domain_match.whois_server == "whois.verisign-grs.com"
+    assert find_whois_server("www.example.com") == domain_match.whois_server
@@ -0,0 +1,64 @@
+from benchmarks.e2e_benchmark import (
+    build_matrix,
+    case_name,
+    compare_with_baseline,
+    percentile,
+)
+
+
+# 线程数只对同步型插件展开
+def test_build_matrix():
+    matrix = build_matrix(["async_query", "sync_query"], [1, 2], [8, 32], [10])
+    assert [case_name(case) for case in matrix] == [
+        "async_query-p1-tauto-n10",
+        "async_query-p2-tauto-n10",
+        "sync_query-p1-t8-n10",
+        "sync_query-p1-t32-n10",
+        "sync_query-p2-t8-n10",
+        "sync_query-p2-t32-n10",
+    ]
+
+
+def test_percentile():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0
+
+
+# 每秒处理域名数低于基线，或 p99 耗时、峰值内存、CPU 时间高于基线超过容差时报告性能下降
+def test_compare_with_baseline():
+    def result(case: str, domains_per_sec: float = 1000, **metrics: float):
+        return {
+            "case": case,
+            "domains_per_sec": domains_per_sec,
+            "latency_p50_ms": 5.0,
+            "latency_p99_ms": 10.0,
+            "peak_rss_mb": 50.0,
+            "cpu_time_sec": 1.0,
+            "wall_time_sec": 1.0,
+            **metrics,
+        }
+
+    baseline = [result(case) for case in ("a", "b", "c", "d", "e")]
+    results = [
+        result("a", 950, latency_p99_ms=14.0, peak_rss_mb=54.0, cpu_time_sec=1.1),
+        result("b", 800),
+        result("c", latency_p99_ms=20.0),
+        result("d", peak_rss_mb=80.0),
+        result("e", cpu_time_sec=2.0),
+        result("f", 1),
+    ]
+    regressions = compare_with_baseline(results, baseline)
+    assert [regression.split(" ")[:2] for regression in regressions] == [
+        ["b:", "domains_per_sec"],
+        ["c:", "latency_p99_ms"],
+        ["d:", "peak_rss_mb"],
+        ["e:", "cpu_time_sec"],
+    ]
+
+    # 指定的容差覆盖默认值
+    assert (
+        compare_with_baseline([result("b", 800)], baseline, {"domains_per_sec": 0.3})
+        == []
+    )
@@ -0,0 +1,144 @@
+import asyncio
+import datetime
+
+import plugins.async_query as async_query
+import plugins.sync_query as sync_query
+
+from src.defined_types import Err, Ok
+from src.main import main
+from src.plugin_manager import PluginManager
+from src.utils.date_utils import is_datetime_expired
+from src.utils.whois_parser import whois_parser
+
+from .fake_whois_server import (
+    FakeWhoisServer,
+    redirect_builtin_plugins,
+    render_response,
+)
+
+
+# 模拟的响应能被解析器正确解析
+def test_render_response():
+    today = datetime.date(2025, 1, 1)
+    cases = {
+        "example.com": "registered",
+        "example.cn": "registered",
+        "example.co.uk": "registered",
+        "example.mk": "registered",
+        "example.org": "registered",
+        "free-name.com": "unregistered",
+        "redemption-name.com": "redemption",
+        "example.ch": "registered",
+        "available.li": "unregistered",
+    }
+    for domain, status in cases.items():
+        parsed = whois_parser(render_response(domain, today=today))
+        assert parsed["status"][1] == status, domain
+
+    for domain, is_expired in (
+        ("example.com", False),
+        ("example.cn", False),
+        ("example.co.uk", False),
+        ("example.mk", False),
+        ("example.org", False),
+        ("expired-name.com", True),
+    ):
+        expiry_date = whois_parser(render_response(domain))["registry_expiry_date"]
+        assert isinstance(expiry_date, Ok), domain
+        assert is_datetime_expired(expiry_date.value) == Ok(is_expired), domain
+
+    expiry_date = whois_parser(render_response("baddate-name.com"))[
+        "registry_expiry_date"
+    ]
+    assert isinstance(expiry_date, Err)
+
+
+# 内置插件连接模拟服务器
+def test_plugins_with_fake_whois_server(monkeypatch):
+    async def run() -> None:
+        async with FakeWhoisServer() as server:
+            redirect_builtin_plugins(server.address, monkeypatch.setattr)
+            ret = await async_query.main("example.com")
+            assert ret["code"] == 200 and "Domain Name: EXAMPLE.COM" in ret["raw"]
+            ret = await async_query.main("free.ch")
+            assert ret["code"] == 200 and ret["raw"].startswith("1")
+
+            # 同步型插件会阻塞事件循环，放到线程中调用
+            ret = await asyncio.to_thread(sync_query.main, "free.com")
+            assert ret["code"] == 200 and "No match for" in ret["raw"]
+            assert server.request_count == 3
+
+    asyncio.run(run())
+
+
+# 注入查询过快限制、连接重置与慢速返回
+def test_fake_whois_server_faults(monkeypatch):
+    async def run() -> None:
+        async with FakeWhoisServer(throttle_rate=1) as server:
+            redirect_builtin_plugins(server.address, monkeypatch.setattr)
+            assert (await async_query.main("example.com"))["code"] == 503
+            assert (await async_query.main("example.ch"))["raw"].startswith("-95")
+
+        async with FakeWhoisServer(reset_rate=1) as server:
+            redirect_builtin_plugins(server.address, monkeypatch.setattr)
+            assert (await async_query.main("example.com"))["code"] == 503
+
+        async with FakeWhoisServer(trickle_interval=0.001) as server:
+            redirect_builtin_plugins(server.address, monkeypatch.setattr)
+            ret = await async_query.main("example.com")
+            assert ret["code"] == 200 and "Name Server" in ret["raw"]
+
+    asyncio.run(run())
+
+
+# 在后台线程中运行
+def test_fake_whois_server_in_thread(monkeypatch):
+    server = FakeWhoisServer().start_in_thread()
+    try:
+        redirect_builtin_plugins(server.address, monkeypatch.setattr)
+        assert sync_query.main("example.com")["code"] == 200
+    finally:
+        server.stop()
+
+
+# 完整流水线：读取输入文件、查询模拟服务器、写入输出文件
+def test_main_with_fake_whois_server(tmp_path, monkeypatch):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(
+        "\n".join(
+            [
+                "https://www.example.com/a",
+                "free-name.com",
+                "expired-name.net",
+                "redemption-name.org",
+                "baddate-name.com",
+                "available.ch",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    output_file = tmp_path / "output.txt"
+    error_file = tmp_path / "error.txt"
+
+    PluginManager().load_plugin(plugin_dir_path="plugins")
+    server = FakeWhoisServer().start_in_thread()
+    try:
+        redirect_builtin_plugins(server.address, monkeypatch.setattr)
+        main(
+            input_file=str(input_file),
+            output_file=str(output_file),
+            error_file=str(error_file),
+            num_processes=1,
+            max_num_threads_per_process=None,
+            plugin_id="async_query",
+        )
+    finally:
+        server.stop()
+
+    assert sorted(output_file.read_text(encoding="utf-8").splitlines()) == [
+        "available.ch",
+        "expired-name.net",
+        "free-name.com",
+        "redemption-name.org",
+    ]
+    assert error_file.read_text(encoding="utf-8").splitlines() == ["baddate-name.com"]
@@ -0,0 +1,169 @@
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from src.utils.journal import RETRY_OUTCOME, format_journal_entry, load_journal
+
+
+# 从运行日志恢复进度
+def test_load_journal(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    lines = [
+        format_journal_entry("a.com", "expired", 1),
+        format_journal_entry("b.com", RETRY_OUTCOME, 1),
+        format_journal_entry("c.com", RETRY_OUTCOME, 1),
+        format_journal_entry("b.com", "error", 2),
+        format_journal_entry("c.com", RETRY_OUTCOME, 2),
+        "",
+        "not json",
+        '{"domain": "d.com"}',
+        '{"domain": "e.com", "outco',  # 中断时只写了一半的行
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    state = load_journal(str(path))
+    assert state.completed_domains == {"a.com", "b.com"}
+    assert state.retry_attempts == {"c.com": 2}
+
+
+# 运行日志不存在时视为空日志
+def test_load_journal_missing(tmp_path):
+    state = load_journal(str(tmp_path / "missing.jsonl"))
+    assert state.completed_domains == set()
+    assert state.retry_attempts == {}
+
+
+# 中断后使用 --resume 继续：已完成的域名不再查询，等待重试的域名接着重试
+def test_resume_after_interrupt(tmp_path, register_plugin, run_main):
+    calls: list[str] = []
+    is_interrupted: bool = True
+
+    async def main_query(domain: str) -> dict:
+        calls.append(domain)
+        if is_interrupted and domain == "b.com":
+            return {"code": 200, "raw": "Your access is too fast,please try again later."}
+        if is_interrupted and domain == "f.com":
+            # 模拟查询到一半时用户按下 Ctrl+C
+            raise KeyboardInterrupt
+        return {"code": 200, "raw": f"No match for {domain}"}
+
+    register_plugin("fake_resume", mode="async", main=main_query)
+
+    domains = ["a.com", "b.com", "c.com", "d.com", "e.com", "f.com", "g.com", "h.com"]
+    output_file = tmp_path / "output.txt"
+    journal_file = tmp_path / "journal.jsonl"
+    run_kwargs = {
+        "output_file": str(output_file),
+        "max_concurrency_per_process": 1,
+        "journal_file": str(journal_file),
+    }
+
+    with pytest.raises(KeyboardInterrupt):
+        run_main(domains, "fake_resume", **run_kwargs)
+    assert calls == ["a.com", "b.com", "c.com", "d.com", "e.com", "f.com"]
+    state = load_journal(str(journal_file))
+    assert state.completed_domains == {"a.com", "c.com", "d.com", "e.com"}
+    assert state.retry_attempts == {"b.com": 1}
+
+    calls.clear()
+    is_interrupted = False
+    run_main(domains, "fake_resume", **run_kwargs, resume=True)
+    assert sorted(calls) == ["b.com", "f.com", "g.com", "h.com"]
+    state = load_journal(str(journal_file))
+    assert state.completed_domains == set(domains)
+    assert state.retry_attempts == {}
+    # 重试次数从上次中断时接着计算
+    assert (
+        format_journal_entry("b.com", "unregistered", 2)
+        in journal_file.read_text(encoding="utf-8").splitlines()
+    )
+    assert sorted(output_file.read_text(encoding="utf-8").splitlines()) == domains
+
+
+# 在子进程中运行 main 的脚本，插件每次查询耗时 10 毫秒，参数依次为输入、输出、运行日志文件路径与进程数
+KILL_SCRIPT: str = textwrap.dedent("""
+    import asyncio
+    import sys
+    import types
+
+    from src.main import main
+    from src.plugin_manager import PluginManager
+
+
+    async def main_query(domain: str) -> dict:
+        await asyncio.sleep(0.01)
+        return {"code": 200, "raw": f"No match for {domain}"}
+
+
+    plugin = types.ModuleType("fake_killed")
+    plugin.METADATA = {"id": "fake_killed", "mode": "async", "author": "test", "help": ""}
+    plugin.main = main_query
+    PluginManager()._loaded_plugin["fake_killed"] = plugin
+
+    input_file, output_file, journal_file, num_processes = sys.argv[1:]
+    main(
+        input_file=input_file,
+        output_file=output_file,
+        error_file=None,
+        num_processes=int(num_processes),
+        max_num_threads_per_process=None,
+        plugin_id="fake_killed",
+        max_concurrency_per_process=10,
+        journal_file=journal_file,
+    )
+    """)
+
+
+# 运行到一半被强制结束（SIGKILL）时，运行日志中已完成的域名都已写入输出文件，恢复时不会漏掉结果
+@pytest.mark.parametrize("num_processes", [1, 2])
+def test_journal_written_after_output_on_kill(tmp_path, num_processes):
+    script = tmp_path / "run.py"
+    script.write_text(KILL_SCRIPT, encoding="utf-8")
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(
+        "\n".join(f"example{i}.com" for i in range(20000)), encoding="utf-8"
+    )
+    output_file = tmp_path / "output.txt"
+    journal_file = tmp_path / "journal.jsonl"
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            str(script),
+            str(input_file),
+            str(output_file),
+            str(journal_file),
+            str(num_processes),
+        ],
+        cwd=Path(__file__).parent.parent,
+        env={
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(
+                [str(Path(__file__).parent.parent), os.environ.get("PYTHONPATH", "")]
+            ),
+        },
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    try:
+        # 运行日志第一次写入后再等一会，在写入器的两次写入之间结束全部进程
+        deadline = time.monotonic() + 30
+        while not journal_file.exists() or journal_file.stat().st_size == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        time.sleep(0.5)
+    finally:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+    state = load_journal(str(journal_file))
+    assert 0 < len(state.completed_domains) < 20000
+    output_domains = set(output_file.read_text(encoding="utf-8").splitlines())
+    assert state.completed_domains <= output_domains
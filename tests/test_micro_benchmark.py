@@ -0,0 +1,13 @@
+from benchmarks.micro_benchmark import build_corpus, build_stages, measure
+
+
+# 每个阶段都能在生成的输入上运行并给出结果
+def test_micro_benchmark_stages():
+    corpus = build_corpus(20)
+    assert len(corpus["datetimes"]) == len(corpus["date_strings"])
+    assert 0 < len(corpus["registered_responses"]) < len(corpus["raw_responses"])
+
+    for name, func, inputs in build_stages(corpus):
+        result = measure(name, func, inputs, min_time=0.001)
+        assert result["stage"] == name
+        assert result["ns_per_op"] > 0
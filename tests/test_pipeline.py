@@ -0,0 +1,87 @@
+import asyncio
+import os
+
+import pytest
+
+
+# 输入文件很大时，查询任务由固定数量的协程从有界队列中领取，不会为每一行都创建一个任务
+def test_pipeline_bounded(register_plugin, run_main):
+    num_domains = 5000
+    finished: list[str] = []
+    peak_task_count: list[int] = [0]
+
+    async def main_query(domain: str) -> dict:
+        peak_task_count[0] = max(peak_task_count[0], len(asyncio.all_tasks()))
+        await asyncio.sleep(0.001)
+        finished.append(domain)
+        return {"code": 200, "raw": f"No match for {domain}"}
+
+    register_plugin("fake_bounded", mode="async", main=main_query)
+
+    run_main(num_domains, "fake_bounded", max_concurrency_per_process=10)
+
+    assert len(finished) == num_domains
+    # 分发协程与查询任务各不超过并发数，其余为读取、重试、调度、写入等常驻协程
+    assert peak_task_count[0] <= 10 * 2 + 20
+
+
+# 多行对应同一个可注册域名时只查询一次，多进程模式下重复的行分到不同子进程也只查询一次
+@pytest.mark.parametrize("num_processes", [1, 3])
+def test_pipeline_deduplicate(tmp_path, register_plugin, run_main, num_processes):
+    calls_file = tmp_path / "calls.txt"
+
+    def main_query(domain: str) -> dict:
+        # 子进程中的调用记录在文件中，每行一次调用
+        with open(calls_file, "a", encoding="utf-8") as f:
+            f.write(f"{domain}\n")
+        return {"code": 200, "raw": f"No match for {domain}"}
+
+    register_plugin("fake_dedup", main=main_query)
+    output_file = tmp_path / "output.txt"
+    lines = [
+        line
+        for i in range(300)
+        for line in (
+            f"https://www.example{i}.com/a",
+            f"blog.example{i}.com/b?id=1",
+            f"example{i}.com",
+        )
+    ]
+
+    run_main(
+        lines, "fake_dedup", output_file=str(output_file), num_processes=num_processes
+    )
+
+    expected = sorted(f"example{i}.com" for i in range(300))
+    assert sorted(calls_file.read_text(encoding="utf-8").splitlines()) == expected
+    assert sorted(output_file.read_text(encoding="utf-8").splitlines()) == expected
+
+
+# 多进程模式下由主进程统一写入，每个域名的结果在输出文件或错误日志中恰好出现一次，且每行完整
+def test_pipeline_multiprocess_output_once(tmp_path, register_plugin, run_main):
+    def main_query(domain: str) -> dict:
+        if domain.startswith("fail"):
+            return {"code": 403, "raw": f"Forbidden pid:{os.getpid()}"}
+        return {"code": 200, "raw": f"No match for {domain} pid:{os.getpid()}"}
+
+    register_plugin("fake_merged", main=main_query)
+    output_file = tmp_path / "output.txt"
+    error_file = tmp_path / "error.txt"
+    free_domains = [f"free{i}.com" for i in range(1500)]
+    fail_domains = [f"fail{i}.com" for i in range(500)]
+
+    run_main(
+        free_domains + fail_domains,
+        "fake_merged",
+        output_file=str(output_file),
+        error_file=str(error_file),
+        num_processes=3,
+        max_retries=0,
+    )
+
+    assert sorted(output_file.read_text(encoding="utf-8").splitlines()) == sorted(
+        free_domains
+    )
+    assert sorted(error_file.read_text(encoding="utf-8").splitlines()) == sorted(
+        fail_domains
+    )
@@ -0,0 +1,88 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from src.utils.rate_limiter import load_rate_limit_config, scale_rate_limit_config
+from src.utils.replay import load_replay_archive
+
+
+@pytest.fixture
+def create_plugin(register_plugin):
+    """生成一个同步型插件，记录同时进行的查询数的峰值，返回值中带有进程号与线程号"""
+
+    def create(id: str, **metadata):
+        lock = threading.Lock()
+
+        def main_query(domain: str) -> dict:
+            with lock:
+                plugin.running += 1
+                plugin.peak = max(plugin.peak, plugin.running)
+            time.sleep(0.02)
+            with lock:
+                plugin.running -= 1
+            return {
+                "code": 200,
+                "raw": f"No match for {domain} pid:{os.getpid()} thread:{threading.get_ident()}",
+            }
+
+        plugin = register_plugin(
+            id, metadata=metadata, main=main_query, running=0, peak=0
+        )
+        return plugin
+
+    return create
+
+
+# 插件声明的最大并发数是上限，命令行指定更大的并发数也不会超过
+@pytest.mark.parametrize("max_concurrency_per_process", [None, 20])
+def test_plugin_max_concurrency(create_plugin, run_main, max_concurrency_per_process):
+    plugin = create_plugin("fake_capacity", max_concurrency=3)
+
+    run_main(30, "fake_capacity", max_concurrency_per_process=max_concurrency_per_process)
+    assert plugin.peak == 3
+
+
+# 插件声明的整体限速对全部查询生效，不区分 WHOIS 服务器
+def test_plugin_rate_limit(create_plugin, run_main):
+    create_plugin("fake_rate_limit", rate_limit={"rate": 50, "burst": 1})
+
+    start = time.monotonic()
+    run_main(11, "fake_rate_limit")
+    # 第一个查询立即开始，剩下 10 个各需 0.02 秒
+    assert time.monotonic() - start >= 0.19
+
+
+# executor 为 inline 时在事件循环所在的线程中调用，为 process 时在其他进程中调用，两者的返回值都能录制
+@pytest.mark.parametrize("executor", ["inline", "process"])
+def test_plugin_executor(create_plugin, run_main, tmp_path, executor):
+    plugin = create_plugin(f"fake_{executor}", executor=executor)
+    record_file = tmp_path / "record.jsonl"
+
+    run_main(5, f"fake_{executor}", record_file=str(record_file))
+
+    archive = load_replay_archive(str(record_file))
+    assert len(archive) == 5
+    pids = {ret["raw"].split("pid:")[1].split()[0] for ret in archive.values()}
+    threads = {ret["raw"].split("thread:")[1] for ret in archive.values()}
+    if executor == "inline":
+        assert pids == {str(os.getpid())}
+        assert threads == {str(threading.get_ident())}
+        assert plugin.peak == 1
+    else:
+        assert str(os.getpid()) not in pids
+
+
+# 插件声明的整体限速可被配置文件中的 plugin 项覆盖，并平均分给每个进程
+def test_load_plugin_rate_limit_config(tmp_path):
+    config = load_rate_limit_config(None, {"rate": 10, "burst": 4})
+    assert config["plugin"] == {"rate": 10, "burst": 4}
+    assert scale_rate_limit_config(config, 2)["plugin"] == {"rate": 5, "burst": 2}
+
+    config_file = tmp_path / "rate_limit.json"
+    config_file.write_text(json.dumps({"plugin": {"rate": 2}}), encoding="utf-8")
+    config = load_rate_limit_config(str(config_file), {"rate": 10, "burst": 4})
+    assert config["plugin"] == {"rate": 2, "burst": 4}
+    assert "plugin" not in load_rate_limit_config(None)
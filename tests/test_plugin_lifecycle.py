@@ -0,0 +1,90 @@
+import asyncio
+import os
+
+from src.plugin_manager import PluginManager
+
+
+# setup 在第一次查询前、teardown 在最后一次查询后调用，且在同一个事件循环中
+def test_plugin_setup_teardown(register_plugin, run_main):
+    events: list[tuple[str, object]] = []
+
+    def setup() -> None:
+        events.append(("setup", asyncio.get_running_loop()))
+
+    async def teardown() -> None:
+        events.append(("teardown", asyncio.get_running_loop()))
+
+    async def main_query(domain: str) -> dict:
+        events.append(("main", asyncio.get_running_loop()))
+        return {"code": 200, "raw": f"No match for {domain}"}
+
+    register_plugin(
+        "fake_lifecycle", mode="async", setup=setup, teardown=teardown, main=main_query
+    )
+
+    run_main(["a.com", "b.com", "c.com"], "fake_lifecycle")
+
+    assert [name for name, _ in events] == [
+        "setup",
+        "main",
+        "main",
+        "main",
+        "teardown",
+    ]
+    assert len({id(loop) for _, loop in events}) == 1
+
+
+# 没有定义 setup 与 teardown 的插件照常使用
+def test_plugin_without_hooks(register_plugin):
+    register_plugin("fake_no_hooks")
+
+    async def run() -> None:
+        await PluginManager().setup_plugin("fake_no_hooks")
+        await PluginManager().teardown_plugin("fake_no_hooks")
+
+    asyncio.run(run())
+
+
+# 在进程池中调用的插件，setup 与 teardown 在进程池的每个进程中各调用一次，主进程中不调用
+def test_plugin_setup_teardown_process_executor(register_plugin, run_main, tmp_path):
+    marker_dir = tmp_path / "markers"
+    marker_dir.mkdir()
+    state: dict = {}
+
+    def setup() -> None:
+        state["set_up"] = True
+        (marker_dir / f"setup-{os.getpid()}").touch()
+
+    def teardown() -> None:
+        (marker_dir / f"teardown-{os.getpid()}").touch()
+
+    def main_query(domain: str) -> dict:
+        if not state.get("set_up"):
+            return {"code": 500, "raw": "setup not called"}
+        return {"code": 200, "raw": f"No match for {domain} {os.getpid()}"}
+
+    register_plugin(
+        "fake_process_lifecycle",
+        metadata={"executor": "process"},
+        setup=setup,
+        teardown=teardown,
+        main=main_query,
+    )
+    output_file = tmp_path / "output.txt"
+    error_file = tmp_path / "error.txt"
+
+    run_main(
+        20,
+        "fake_process_lifecycle",
+        output_file=str(output_file),
+        error_file=str(error_file),
+        max_num_threads_per_process=2,
+    )
+
+    assert not error_file.exists() or error_file.read_text(encoding="utf-8") == ""
+    assert len(output_file.read_text(encoding="utf-8").splitlines()) == 20
+    setup_pids = {p.name.split("-")[1] for p in marker_dir.glob("setup-*")}
+    teardown_pids = {p.name.split("-")[1] for p in marker_dir.glob("teardown-*")}
+    assert setup_pids
+    assert str(os.getpid()) not in setup_pids
+    assert teardown_pids == setup_pids
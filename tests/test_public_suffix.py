@@ -0,0 +1,52 @@
+import socket
+
+import pytest
+
+from src.utils.domain_trie import get_domain_trie
+from src.utils.public_suffix import (
+    PUBLIC_SUFFIX_LIST_FILE,
+    get_public_suffix_list_version,
+)
+
+
+# 随程序发布的公共后缀列表带有版本号
+def test_public_suffix_list_version():
+    assert PUBLIC_SUFFIX_LIST_FILE.is_file()
+    assert get_public_suffix_list_version()
+
+
+# 提取可注册域名只读取本地公共后缀列表，不联网，也不读写 tldextract 的缓存目录
+def test_domain_trie_offline(tmp_path, monkeypatch):
+    def connect(*args, **kwargs):
+        raise AssertionError("network access")
+
+    monkeypatch.setattr(socket.socket, "connect", connect)
+    monkeypatch.setenv("TLDEXTRACT_CACHE", str(tmp_path / "cache"))
+
+    psl_file = tmp_path / "public_suffix_list.dat"
+    psl_file.write_text(
+        "// VERSION: test\n// ===BEGIN ICANN DOMAINS===\ncom\nco.uk\n"
+        "// ===BEGIN PRIVATE DOMAINS===\ngithub.io\n",
+        encoding="utf-8",
+    )
+    trie = get_domain_trie(psl_file)
+    assert get_domain_trie(psl_file) is trie
+    assert get_public_suffix_list_version(psl_file) == "test"
+
+    domain_match = trie.match_url("https://www.example.co.uk/path")
+    assert (domain_match.domain, domain_match.suffix) == ("example", "co.uk")
+    domain_match = trie.match_url("blog.howiehz.github.io")
+    assert (domain_match.domain, domain_match.suffix, domain_match.is_private) == (
+        "howiehz",
+        "github.io",
+        True,
+    )
+    assert not (tmp_path / "cache").exists()
+
+    # 默认列表同样不联网
+    assert get_domain_trie().match_url("a.b.example.com").domain == "example"
+
+
+def test_domain_trie_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        get_domain_trie(tmp_path / "missing.dat")
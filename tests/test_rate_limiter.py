@@ -0,0 +1,213 @@
+import asyncio
+import json
+import time
+
+from src.defined_types import RateLimitConfigDict
+from src.utils.dns_precheck import DnsPrecheck
+from src.utils.rate_limiter import (
+    ServerRateLimiter,
+    TokenBucket,
+    load_rate_limit_config,
+    scale_rate_limit_config,
+)
+
+
+# 令牌耗尽后按 rate 的速度发放令牌
+def test_token_bucket_rate():
+    async def run() -> float:
+        bucket = TokenBucket(rate=20, capacity=1)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # 第一个令牌立即可用，剩下 4 个各需 0.05 秒
+    assert asyncio.run(run()) >= 0.19
+
+
+# 同一服务器的并发数不超过 concurrency，不同服务器互不影响
+def test_server_rate_limiter_concurrency():
+    config: RateLimitConfigDict = {
+        "default": {"rate": 0, "concurrency": 2},
+        "servers": {"whois.example.com": {"concurrency": 1}},
+    }
+    running: dict[str, int] = {"whois.example.com": 0, "whois.example.net": 0}
+    peak: dict[str, int] = {"whois.example.com": 0, "whois.example.net": 0}
+
+    async def query(rate_limiter: ServerRateLimiter, server: str) -> None:
+        async with rate_limiter.limit(server):
+            running[server] += 1
+            peak[server] = max(peak[server], running[server])
+            await asyncio.sleep(0.01)
+            running[server] -= 1
+
+    async def run() -> None:
+        rate_limiter = ServerRateLimiter(config)
+        await asyncio.gather(
+            *(query(rate_limiter, "whois.example.com") for _ in range(5)),
+            *(query(rate_limiter, "whois.example.net") for _ in range(5)),
+        )
+
+    asyncio.run(run())
+    assert peak == {"whois.example.com": 1, "whois.example.net": 2}
+
+
+# 服务器为空时不限速
+def test_server_rate_limiter_no_server():
+    async def run() -> None:
+        rate_limiter = ServerRateLimiter(
+            {"default": {"rate": 0.001, "burst": 1, "concurrency": 1}, "servers": {}}
+        )
+        for _ in range(10):
+            async with rate_limiter.limit(None):
+                pass
+
+    asyncio.run(asyncio.wait_for(run(), timeout=1))
+
+
+# 限速配置平均分给每个进程
+def test_scale_rate_limit_config():
+    config = load_rate_limit_config(None)
+    config["servers"]["whois.example.com"] = {"rate": 3, "concurrency": 3}
+    scaled = scale_rate_limit_config(config, 2)
+    assert scaled["servers"]["whois.example.com"] == {"rate": 1.5, "concurrency": 2}
+    assert scaled["default"]["rate"] == config["default"]["rate"] / 2
+
+
+# 并发额度用完时 acquire 等待 release，令牌用完时等待补充，其他服务器不受影响
+def test_server_rate_limiter_acquire():
+    async def run() -> None:
+        rate_limiter = ServerRateLimiter(
+            {
+                "default": {"rate": 0, "concurrency": 0},
+                "servers": {
+                    "whois.slow.example": {"rate": 10, "burst": 1, "concurrency": 1}
+                },
+            }
+        )
+        start = time.monotonic()
+        await rate_limiter.acquire("whois.slow.example")
+        waiter = asyncio.create_task(rate_limiter.acquire("whois.slow.example"))
+        await asyncio.sleep(0.01)
+        # 并发数已满
+        assert not waiter.done()
+        # 其他服务器不受影响
+        await asyncio.wait_for(rate_limiter.acquire("whois.fast.example"), 0.01)
+
+        rate_limiter.release("whois.slow.example")
+        await waiter
+        # 令牌已用完，约 0.1 秒后补充
+        assert time.monotonic() - start >= 0.09
+
+    asyncio.run(run())
+
+
+# 默认不按服务器限速
+def test_default_rate_limit_unlimited():
+    async def run() -> None:
+        rate_limiter = ServerRateLimiter(load_rate_limit_config(None))
+        for _ in range(100):
+            await rate_limiter.acquire("whois.example.com")
+
+    asyncio.run(asyncio.wait_for(run(), timeout=1))
+
+
+# 某个服务器限速很低时，发往其他服务器的域名不被阻塞
+def test_slow_server_does_not_block_others(tmp_path, register_plugin, run_main):
+    finished_at: dict[str, float] = {}
+
+    async def main_query(domain: str) -> dict:
+        finished_at[domain] = time.monotonic()
+        return {"code": 200, "raw": f"No match for {domain}"}
+
+    register_plugin(
+        "fake_servers",
+        mode="async",
+        main=main_query,
+        get_whois_server=lambda domain, whois_server: (
+            "whois.slow.example" if domain.startswith("slow") else "whois.fast.example"
+        ),
+    )
+
+    config_file = tmp_path / "rate_limit.json"
+    config_file.write_text(
+        json.dumps(
+            {"servers": {"whois.slow.example": {"rate": 5, "burst": 1, "concurrency": 1}}}
+        ),
+        encoding="utf-8",
+    )
+    # 慢服务器的域名排在前面，排满慢服务器的队列也不应阻塞后面的域名
+    domains = [f"slow{i}.com" for i in range(5)] + [f"fast{i}.com" for i in range(50)]
+
+    start = time.monotonic()
+    run_main(
+        domains,
+        "fake_servers",
+        max_concurrency_per_process=2,
+        rate_limit_config_file=str(config_file),
+    )
+
+    assert len(finished_at) == len(domains)
+    assert max(finished_at[f"fast{i}.com"] for i in range(50)) - start < 0.5
+    # 5 次/秒，后 4 个各需 0.2 秒
+    assert max(finished_at[f"slow{i}.com"] for i in range(5)) - start >= 0.75
+
+
+# 限速很低的服务器的域名在各自的队列中等待，不会反复出入队列：每个域名只解析一次 WHOIS 服务器、只预检查一次，
+# 已取出但尚未得到结果的域名数保持有界
+def test_slow_server_queue_bounded(tmp_path, monkeypatch, register_plugin, run_main):
+    num_domains = 60
+    resolved: list[str] = []
+    prechecked: list[str] = []
+    finished: list[str] = []
+    peak_in_flight: list[int] = [0]
+
+    async def check(self, domain: str) -> str:
+        prechecked.append(domain)
+        return "undelegated"
+
+    def get_whois_server(domain: str, whois_server: str) -> str:
+        resolved.append(domain)
+        peak_in_flight[0] = max(peak_in_flight[0], len(resolved) - len(finished))
+        return "whois.slow.example"
+
+    async def main_query(domain: str) -> dict:
+        finished.append(domain)
+        return {"code": 200, "raw": f"No match for {domain}"}
+
+    monkeypatch.setattr(DnsPrecheck, "check", check)
+    register_plugin(
+        "fake_slow_server",
+        mode="async",
+        main=main_query,
+        get_whois_server=get_whois_server,
+    )
+    config_file = tmp_path / "rate_limit.json"
+    config_file.write_text(
+        json.dumps(
+            {
+                "servers": {
+                    "whois.slow.example": {"rate": 100, "burst": 1, "concurrency": 1}
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    start = time.process_time()
+    run_main(
+        num_domains,
+        "fake_slow_server",
+        max_concurrency_per_process=4,
+        rate_limit_config_file=str(config_file),
+        dns_precheck=True,
+        dns_resolver="127.0.0.1:53",
+    )
+
+    assert len(finished) == num_domains
+    assert sorted(resolved) == sorted(finished)
+    assert sorted(prechecked) == sorted(finished)
+    # 服务器队列、分发协程与调度协程中各自最多持有的域名数之和
+    assert peak_in_flight[0] <= 4 + 4 + 2
+    # 等待额度期间不占用 CPU
+    assert time.process_time() - start < 0.5
@@ -0,0 +1,195 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import plugins.rdap_query as rdap_query
+import pytest
+from plugins.rdap_query.bootstrap import (
+    RDAP_BOOTSTRAP_URL_ENV,
+    RDAP_CACHE_DIR_ENV,
+    get_cache_path,
+    parse_bootstrap,
+)
+
+from src.main import main
+from src.plugin_manager import PluginManager
+
+
+class FakeRdapServer(ThreadingHTTPServer):
+    """在后台线程中运行的本地 RDAP 服务器，同时提供对应表
+
+    按域名的第一段决定返回内容：free* 不存在，redemption* 赎回期，ratelimit* 查询过快，其他已注册
+    """
+
+    def __init__(self):
+        self.connection_count: int = 0
+        self.request_paths: list[str] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # 支持连接复用
+
+            def setup(handler) -> None:
+                self.connection_count += 1
+                super().setup()
+
+            def do_GET(handler) -> None:
+                self.request_paths.append(handler.path)
+                code, body = self._route(handler.path)
+                data = json.dumps(body).encode("utf-8")
+                handler.send_response(code)
+                handler.send_header("Content-Type", "application/rdap+json")
+                handler.send_header("Content-Length", str(len(data)))
+                handler.end_headers()
+                handler.wfile.write(data)
+
+            def log_message(handler, *args) -> None:
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def _route(self, path: str) -> tuple[int, dict]:
+        if path == "/dns.json":
+            return 200, {
+                "services": [
+                    [["com", "net"], [f"{self.base_url}/rdap/"]],
+                    [["uk"], [f"{self.base_url}/rdap/"]],
+                ]
+            }
+        domain = path.rsplit("/", 1)[-1]
+        label = domain.split(".", 1)[0]
+        if label.startswith("free"):
+            return 404, {"errorCode": 404, "title": "Not Found"}
+        if label.startswith("ratelimit"):
+            return 429, {"errorCode": 429, "title": "Too Many Requests"}
+        status, expiry_date = ["active"], "2099-01-01T00:00:00Z"
+        if label.startswith("redemption"):
+            status, expiry_date = ["redemption period"], "2020-01-01T00:00:00Z"
+        return 200, {
+            "objectClassName": "domain",
+            "ldhName": domain.upper(),
+            "status": status,
+            "events": [
+                {"eventAction": "registration", "eventDate": "2000-01-01T00:00:00Z"},
+                {"eventAction": "expiration", "eventDate": expiry_date},
+            ],
+        }
+
+    def __enter__(self) -> "FakeRdapServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+@pytest.fixture
+def rdap_server(tmp_path, monkeypatch):
+    with FakeRdapServer() as server:
+        monkeypatch.setenv(RDAP_BOOTSTRAP_URL_ENV, f"{server.base_url}/dns.json")
+        monkeypatch.setenv(RDAP_CACHE_DIR_ENV, str(tmp_path / "cache"))
+        monkeypatch.setattr(rdap_query, "_rdap_server_dict", None)
+        yield server
+
+
+def test_parse_bootstrap():
+    assert parse_bootstrap(
+        {
+            "services": [
+                [["COM", "net"], ["http://a/", "https://a/"]],
+                [["org"], ["http://b/"]],
+                [["empty"], []],
+            ]
+        }
+    ) == {"com": "https://a/", "net": "https://a/", "org": "http://b/"}
+
+
+def test_parse_rdap_domain():
+    assert rdap_query.parse_rdap_domain(
+        {
+            "status": ["client transfer prohibited"],
+            "events": [{"eventAction": "expiration", "eventDate": "2030-01-01"}],
+        }
+    ) == ("registered", "2030-01-01")
+    assert rdap_query.parse_rdap_domain({"status": ["pending delete"]}) == (
+        "redemption",
+        None,
+    )
+
+
+# 查询走同一个保持连接的 HTTP 客户端，返回结构化的状态与过期时间
+def test_rdap_query_main(rdap_server):
+    async def run() -> list[dict]:
+        await rdap_query.setup()
+        try:
+            return [
+                await rdap_query.main(domain)
+                for domain in (
+                    "example.com",
+                    "free-name.com",
+                    "redemption-name.net",
+                    "ratelimit-name.com",
+                    "example.co.uk",
+                    "example.unknown",
+                )
+            ]
+        finally:
+            await rdap_query.teardown()
+
+    rets = asyncio.run(run())
+    assert rets[0]["status"] == "registered"
+    assert rets[0]["expiry_date"] == "2099-01-01T00:00:00Z"
+    assert rets[1]["status"] == "unregistered"
+    assert rets[2]["status"] == "redemption"
+    assert rets[3]["code"] == 429
+    assert rets[4]["status"] == "registered"  # 使用 uk 的 RDAP 服务
+    assert rets[5]["code"] == 404
+
+    # 对应表只下载一次，之后的查询复用同一个连接
+    assert rdap_server.request_paths.count("/dns.json") == 1
+    assert rdap_server.connection_count == 2  # 下载对应表 1 个，查询 1 个
+    assert rdap_query.get_whois_server("example.com", "") == "127.0.0.1"
+    assert rdap_query._clients == {}  # teardown 后已全部关闭
+
+
+# 对应表缓存到本地，之后不再下载
+def test_rdap_bootstrap_cache(rdap_server, monkeypatch):
+    asyncio.run(rdap_query.get_rdap_server_dict())
+    with open(get_cache_path(), "r", encoding="utf-8") as f:
+        assert "services" in json.load(f)
+
+    monkeypatch.setattr(rdap_query, "_rdap_server_dict", None)
+    assert asyncio.run(rdap_query.get_rdap_server_dict())["com"].endswith("/rdap/")
+    assert rdap_server.request_paths.count("/dns.json") == 1
+
+
+# 完整流水线：结构化结果不经过 WHOIS 文本解析
+def test_main_with_rdap_query(rdap_server, tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(
+        "example.com\nfree-name.com\nredemption-name.net\n", encoding="utf-8"
+    )
+    output_file = tmp_path / "output.txt"
+    error_file = tmp_path / "error.txt"
+
+    PluginManager().load_plugin(plugin_dir_path="plugins")
+    main(
+        input_file=str(input_file),
+        output_file=str(output_file),
+        error_file=str(error_file),
+        num_processes=1,
+        max_num_threads_per_process=None,
+        plugin_id="rdap_query",
+    )
+
+    assert sorted(output_file.read_text(encoding="utf-8").splitlines()) == [
+        "free-name.com",
+        "redemption-name.net",
+    ]
+    assert error_file.read_text(encoding="utf-8") == ""
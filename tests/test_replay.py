@@ -0,0 +1,150 @@
+import asyncio
+import json
+
+import plugins.replay_query as replay_query
+import pytest
+
+from src.plugin_manager import PluginManager
+from src.utils.replay import (
+    REPLAY_FILE_ENV,
+    REPLAY_PLUGIN_ID_ENV,
+    format_record_entry,
+    load_replay_archive,
+)
+
+
+# 录制后读取归档，同一个域名使用最后一条记录
+def test_load_replay_archive(tmp_path):
+    path = tmp_path / "record.jsonl"
+    lines = [
+        format_record_entry("async_query", "a.com", {"code": 503, "raw": "timeout"}),
+        format_record_entry("async_query", "a.com", {"code": 200, "raw": "No match"}),
+        format_record_entry("sync_query", "b.com", {"code": 500, "raw": Exception("x")}),
+        '{"plugin_id": "async_query", "domain": "c.c',  # 中断时只写了一半的行
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    assert load_replay_archive(str(path), "async_query") == {
+        "a.com": {"code": 200, "raw": "No match"}
+    }
+    assert load_replay_archive(str(path), "sync_query") == {
+        "b.com": {"code": 500, "raw": "x"}
+    }
+
+
+# 归档中有多个插件的记录时必须指定插件，只有一个插件时可以不指定
+def test_load_replay_archive_plugin_id(tmp_path):
+    path = tmp_path / "record.jsonl"
+    lines = [
+        format_record_entry("async_query", "a.com", {"code": 200, "raw": "No match"}),
+        format_record_entry("sync_query", "a.com", {"code": 503, "raw": "timeout"}),
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+    with pytest.raises(ValueError, match="async_query, sync_query"):
+        load_replay_archive(str(path))
+    assert load_replay_archive(str(path), "async_query")["a.com"]["code"] == 200
+
+    path.write_text(lines[0], encoding="utf-8")
+    assert load_replay_archive(str(path))["a.com"]["code"] == 200
+
+
+# 归档文件不存在
+def test_load_replay_archive_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_replay_archive(str(tmp_path / "missing.jsonl"))
+
+
+# 重放插件从归档中返回原始结果
+def test_replay_plugin(tmp_path, monkeypatch):
+    path = tmp_path / "record.jsonl"
+    path.write_text(
+        format_record_entry("async_query", "a.com", {"code": 200, "raw": "No match"}),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv(REPLAY_FILE_ENV, str(path))
+
+    monkeypatch.setattr(replay_query, "_archive", None)
+
+    assert asyncio.run(replay_query.main("a.com")) == {"code": 200, "raw": "No match"}
+    assert asyncio.run(replay_query.main("b.com"))["code"] == 404
+
+
+# 重放插件按 REPLAY_PLUGIN_ID_ENV 选择插件，未选择且归档中有多个插件时在 setup 中报错
+def test_replay_plugin_id(tmp_path, monkeypatch):
+    path = tmp_path / "record.jsonl"
+    path.write_text(
+        "\n".join(
+            [
+                format_record_entry("async_query", "a.com", {"code": 200, "raw": "A"}),
+                format_record_entry("sync_query", "a.com", {"code": 200, "raw": "B"}),
+            ]
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv(REPLAY_FILE_ENV, str(path))
+    monkeypatch.delenv(REPLAY_PLUGIN_ID_ENV, raising=False)
+
+    monkeypatch.setattr(replay_query, "_archive", None)
+    with pytest.raises(ValueError):
+        replay_query.setup()
+
+    monkeypatch.setenv(REPLAY_PLUGIN_ID_ENV, "sync_query")
+    replay_query.setup()
+    assert asyncio.run(replay_query.main("a.com")) == {"code": 200, "raw": "B"}
+
+
+# 插件直接提供的 status 与 expiry_date 一同录制，重放时与实时查询的判断一致
+def test_record_replay_structured_result(
+    tmp_path, monkeypatch, register_plugin, run_main
+):
+    def main_query(domain: str) -> dict:
+        if domain.startswith("free"):
+            return {"code": 200, "raw": {"errorCode": 404}, "status": "unregistered"}
+        return {
+            "code": 200,
+            "raw": {"objectClassName": "domain", "ldhName": domain},
+            "status": "registered",
+            "expiry_date": "2999-01-01T00:00:00Z",
+        }
+
+    register_plugin("fake_structured", main=main_query)
+    domains = ["example.com", "free-name.com"]
+    record_file = tmp_path / "record.jsonl"
+
+    live_output_file = tmp_path / "live_output.txt"
+    run_main(
+        domains,
+        "fake_structured",
+        output_file=str(live_output_file),
+        record_file=str(record_file),
+    )
+
+    PluginManager().load_plugin(plugin_dir_path="plugins")
+    monkeypatch.setattr(
+        PluginManager().get_plugin_instance_by_id("replay_query"), "_archive", None
+    )
+    monkeypatch.setenv(REPLAY_FILE_ENV, str(record_file))
+    monkeypatch.delenv(REPLAY_PLUGIN_ID_ENV, raising=False)
+    replay_output_file = tmp_path / "replay_output.txt"
+    result_stream_file = tmp_path / "result.jsonl"
+    run_main(
+        domains,
+        "replay_query",
+        output_file=str(replay_output_file),
+        result_stream_file=str(result_stream_file),
+    )
+
+    assert replay_output_file.read_text(encoding="utf-8").splitlines() == [
+        "free-name.com"
+    ]
+    assert replay_output_file.read_text(encoding="utf-8") == live_output_file.read_text(
+        encoding="utf-8"
+    )
+    records = {
+        record["domain"]: record
+        for record in map(
+            json.loads, result_stream_file.read_text(encoding="utf-8").splitlines()
+        )
+    }
+    assert records["example.com"]["status"] == "registered"
+    assert records["example.com"]["expiry_date"].startswith("2999-01-01")
@@ -0,0 +1,125 @@
+import datetime
+import sqlite3
+import time
+
+from src.defined_types import Err, Ok
+from src.utils.result_cache import ResultCache, _result_cache, compute_expires_at
+from src.utils.result_cache._result_cache import (
+    ERROR_TTL,
+    MAX_REGISTERED_TTL,
+    RENEWAL_MARGIN,
+    SHORT_TTL,
+)
+from src.utils.retry import classify_error
+
+
+def _registered(domain: str, expiry_date: datetime.datetime):
+    return Ok(
+        {
+            "domain": domain,
+            "status": (True, "registered"),
+            "raw": "",
+            "registry_expiry_date": Ok(expiry_date),
+        }
+    )
+
+
+# 不同查询结果的缓存时间
+def test_compute_expires_at():
+    now = time.time()
+    utc = datetime.timezone.utc
+
+    far = datetime.datetime.fromtimestamp(now + 3 * 365 * 24 * 3600, tz=utc)
+    assert compute_expires_at(_registered("a.com", far), now) == now + MAX_REGISTERED_TTL
+
+    soon = datetime.datetime.fromtimestamp(now + 90 * 24 * 3600, tz=utc)
+    assert compute_expires_at(_registered("a.com", soon), now) == (
+        soon.timestamp() - RENEWAL_MARGIN
+    )
+
+    near = datetime.datetime.fromtimestamp(now + 24 * 3600, tz=utc)
+    assert compute_expires_at(_registered("a.com", near), now) == now + SHORT_TTL
+
+    unregistered = Ok(
+        {
+            "domain": "a.com",
+            "status": (False, "unregistered"),
+            "raw": "",
+            "registry_expiry_date": Err(
+                {"msg": "Date not found", "err": ValueError(), "raw": ""}
+            ),
+        }
+    )
+    assert compute_expires_at(unregistered, now) == now + SHORT_TTL
+
+    error = Err({"domain": "a.com", "msg": "Request timed out", "code": 503})
+    assert compute_expires_at(error, now) == now + ERROR_TTL
+
+
+# 写入后可以读出相同的结果，重新打开数据库后依然有效
+def test_result_cache_round_trip(tmp_path):
+    path = str(tmp_path / "cache.db")
+    expiry_date = datetime.datetime(3000, 1, 1, tzinfo=datetime.timezone.utc)
+
+    result_cache = ResultCache(path)
+    result_cache.put("a.com", _registered("a.com", expiry_date))
+    result_cache.put("b.com", Err({"domain": "b.com", "msg": "Not Found", "code": 404}))
+    result_cache.close()
+
+    result_cache = ResultCache(path)
+    cached = result_cache.get("a.com")
+    assert isinstance(cached, Ok)
+    assert cached.value["status"] == (True, "registered")
+    assert cached.value["registry_expiry_date"].value == expiry_date
+
+    cached_error = result_cache.get("b.com")
+    assert isinstance(cached_error, Err)
+    assert cached_error.error == {"domain": "b.com", "msg": "Not Found", "code": 404}
+
+    assert result_cache.get("c.com") is None
+    result_cache.close()
+
+
+# 其他连接长时间占用写锁时，写入留在内存中且仍可读出，锁释放后再提交，不会抛出异常
+def test_result_cache_locked(tmp_path, monkeypatch):
+    monkeypatch.setattr(_result_cache, "BUSY_TIMEOUT", 0.05)
+    path = str(tmp_path / "cache.db")
+    result_cache = ResultCache(path)
+
+    other = sqlite3.connect(path)
+    other.execute("BEGIN IMMEDIATE")
+    error = Err({"domain": "a.com", "msg": "Not Found", "code": 404})
+    result_cache.put("a.com", error)
+    result_cache.commit()
+    assert result_cache.get("a.com").error["code"] == 404
+    other.rollback()
+    other.close()
+
+    result_cache.close()
+    assert ResultCache(path).get("a.com").error["code"] == 404
+
+
+# 多进程模式下子进程把要缓存的结果发送给主进程，由主进程统一写入
+def test_result_cache_multiprocess(tmp_path, register_plugin, run_main):
+    register_plugin(
+        "fake_cache", main=lambda domain: {"code": 200, "raw": f"No match for {domain}"}
+    )
+
+    cache_file = tmp_path / "cache.db"
+    run_main(50, "fake_cache", num_processes=2, cache_file=str(cache_file))
+
+    result_cache = ResultCache(str(cache_file))
+    for i in range(50):
+        assert result_cache.get(f"example{i}.com").value["status"][1] == "unregistered"
+    result_cache.close()
+
+
+# 缓存中的错误与实时查询的错误分类相同
+def test_result_cache_error_class(tmp_path):
+    error = Err({"domain": "a.com", "msg": "No WHOIS server for a.com", "code": 500})
+    result_cache = ResultCache(str(tmp_path / "cache.db"))
+    result_cache.put("a.com", error)
+    cached_error = result_cache.get("a.com")
+    result_cache.close()
+
+    assert classify_error(cached_error.error) == classify_error(error.error)
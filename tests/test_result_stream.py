@@ -0,0 +1,52 @@
+import datetime
+import json
+
+from src.defined_types import Err, Ok
+from src.utils.result_stream import build_result_record, format_result_record
+
+
+# 查询成功时记录状态与过期时间
+def test_build_result_record_ok():
+    expiry_date = datetime.datetime(2030, 1, 2, tzinfo=datetime.timezone.utc)
+    record = build_result_record(
+        domain="a.com",
+        outcome="not_expired",
+        query_result=Ok(
+            {
+                "domain": "a.com",
+                "status": (True, "registered"),
+                "raw": "",
+                "registry_expiry_date": Ok(expiry_date),
+            }
+        ),
+        plugin_id="async_query",
+        whois_server="whois.verisign-grs.com",
+        attempts=1,
+        latency=0.12345,
+        cached=False,
+    )
+    assert record["status"] == "registered"
+    assert record["expiry_date"] == "2030-01-02T00:00:00+00:00"
+    assert record["error_class"] is None
+    assert record["error"] is None
+    assert record["latency"] == 0.123
+    assert json.loads(format_result_record(record)) == record
+
+
+# 查询失败时记录错误分类与错误信息
+def test_build_result_record_err():
+    record = build_result_record(
+        domain="a.com",
+        outcome="error",
+        query_result=Err({"domain": "a.com", "msg": "Too Many Requests", "code": 429}),
+        plugin_id="async_query",
+        whois_server=None,
+        attempts=4,
+        latency=1.0,
+        cached=False,
+    )
+    assert record["status"] is None
+    assert record["expiry_date"] is None
+    assert record["error_class"] == "rate_limited"
+    assert record["error"] == "Too Many Requests"
+    assert record["attempts"] == 4
@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+import pytest
+
+from src.utils.retry import RetryPolicy, RetryQueue, classify_error
+
+
+# 错误分类
+@pytest.mark.parametrize(
+    "error, error_class",
+    [
+        (
+            {
+                "domain": "a.cn",
+                "msg": "Your access is too fast,please try again later.",
+                "code": 503,
+            },
+            "rate_limited",
+        ),
+        ({"domain": "a.ch", "msg": "-95 Access restricted", "code": 503}, "rate_limited"),
+        ({"domain": "a.com", "msg": "Request timed out", "code": 503}, "network"),
+        ({"domain": "a.com", "msg": "Empty query result", "code": 200}, "empty"),
+        ({"domain": "a.com", "msg": "", "code": 500}, "server_error"),
+        ({"domain": "a.com", "msg": "Not Found", "code": 404}, "api_error"),
+        (
+            {"domain": "a.unknown", "msg": "No WHOIS server for a.unknown", "code": 500},
+            "invalid_query",
+        ),
+        ({"domain": "a.ch", "msg": "-1 Invalid enquiry", "code": 503}, "invalid_query"),
+        ({"domain": "a.ch", "msg": "-99 Temporary server error", "code": 503}, "network"),
+        ({"domain": "a.com", "err": ValueError()}, "exception"),
+    ],
+)
+def test_classify_error(error, error_class):
+    assert classify_error(error) == error_class
+
+
+# 超出重试次数或不可重试的错误不重试
+def test_retry_policy_should_retry():
+    retry_policy = RetryPolicy(max_retries=2)
+    assert retry_policy.should_retry("network", 1)
+    assert retry_policy.should_retry("network", 2)
+    assert not retry_policy.should_retry("network", 3)
+    assert not retry_policy.should_retry("api_error", 1)
+    assert not retry_policy.should_retry("invalid_query", 1)
+    assert not RetryPolicy(max_retries=0).should_retry("rate_limited", 1)
+
+
+# 等待时间指数增长且不超过上限
+def test_retry_policy_get_delay():
+    retry_policy = RetryPolicy(max_retries=10, base_delays={"network": 1.0}, max_delay=5)
+    for attempts, upper in [(1, 1), (2, 2), (3, 4), (4, 5), (10, 5)]:
+        delay = retry_policy.get_delay("network", attempts)
+        assert upper / 2 <= delay <= upper
+
+
+# 元素按到期时间送回目标队列
+def test_retry_queue_order():
+    async def run() -> list[str]:
+        retry_queue: RetryQueue[str] = RetryQueue()
+        target_queue: asyncio.Queue[str] = asyncio.Queue()
+        runner = asyncio.create_task(retry_queue.run(target_queue))
+
+        start = time.monotonic()
+        retry_queue.push("late", 0.1)
+        retry_queue.push("early", 0.02)
+        results = [await target_queue.get(), await target_queue.get()]
+        assert time.monotonic() - start >= 0.1
+
+        retry_queue.close()
+        await asyncio.wait_for(runner, timeout=1)
+        return results
+
+    assert asyncio.run(run()) == ["early", "late"]
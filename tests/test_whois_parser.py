@@ -154,3 +154,32 @@ def test_whois_parser(raw_whois, status, domain, registry_expiry_date):
     assert parsed_whois_data["domain"] == ""
     assert parsed_whois_data["raw"] == raw_whois
     assert parsed_whois_data["registry_expiry_date"].value == registry_expiry_date
+
+
+# 一次遍历同时得到注册商、注册时间与域名服务器，查询的域名直接填入结果
+def test_whois_parser_extra_fields():
+    parsed_whois_data: ParsedWhoisData = whois_parser(raw_whois_b, "barku.re")
+    assert parsed_whois_data["domain"] == "barku.re"
+    assert parsed_whois_data["registrar"] == "TLD Registrar Solutions Ltd"
+    assert parsed_whois_data["creation_date"] == "2022-08-12T07:35:59Z"
+    assert parsed_whois_data["name_servers"] == [
+        "alex.ns.cloudflare.com",
+        "rihana.ns.cloudflare.com",
+    ]
+    assert "registrar" not in whois_parser("No match for example.com")
+
+
+# 字段名须在行首，赎回期优先于已注册；未注册时不解析过期时间
+def test_whois_parser_status():
+    raw_whois = (
+        "Domain Name: EXAMPLE.COM\r\n"
+        + "Registry Expiry Date: 2025-08-13T04:00:00Z\r\n"
+        + "Domain Status: redemptionPeriod https://icann.org/epp#redemptionPeriod\r\n"
+    )
+    assert whois_parser(raw_whois)["status"] == (True, "redemption")
+
+    parsed_whois_data = whois_parser(
+        ">>> Registry Expiry Date: 2025-08-13T04:00:00Z\r\nNo match\r\n"
+    )
+    assert parsed_whois_data["status"] == (False, "unregistered")
+    assert parsed_whois_data["registry_expiry_date"].error["msg"] == "Date not found"
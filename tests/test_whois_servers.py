@@ -0,0 +1,75 @@
+import json
+
+import plugins.async_query as async_query
+import plugins.sync_query as sync_query
+
+from src.utils.domain_trie import find_whois_server, get_domain_trie
+from src.utils.whois_servers import get_whois_server_dict, parse_whois_server_list
+
+
+def test_parse_whois_server_list():
+    assert parse_whois_server_list(
+        "# comment\n\nCOM\twhois.verisign-grs.com\nco.uk\twhois.nic.uk \n"
+    ) == {"com": "whois.verisign-grs.com", "co.uk": "whois.nic.uk"}
+
+
+# 对应表第一次查找时才读取，按最长匹配的后缀查找
+def test_find_whois_server(tmp_path):
+    table = tmp_path / "whois_server_list.tsv"
+    table.write_text("uk\twhois.nic.uk\nco.uk\twhois.co.uk\n中国\twhois.cnnic.cn\n")
+
+    assert find_whois_server("www.example.co.uk", table) == "whois.co.uk"
+    assert find_whois_server("EXAMPLE.UK", table) == "whois.nic.uk"
+    assert find_whois_server("example.xn--fiqs8s", table) == "whois.cnnic.cn"
+    assert find_whois_server("example.unknown", table) == ""
+
+
+# 内置插件共用随程序发布的对应表，get_whois_server 直接使用主程序读取输入时查到的服务器
+def test_builtin_plugins_share_table():
+    assert len(get_whois_server_dict()) > 1000
+    for plugin in (async_query, sync_query):
+        assert (
+            plugin.get_whois_server("example.com", "whois.verisign-grs.com")
+            == "whois.verisign-grs.com"
+        )
+        assert plugin.get_whois_server("example.ch", "whois.nic.ch") == "whois.nic.ch"
+        assert plugin.get_all_whois_servers() >= set(get_whois_server_dict().values())
+
+
+# 只查找 WHOIS 服务器时不读取公共后缀列表
+def test_find_whois_server_without_public_suffix_list():
+    get_domain_trie.cache_clear()
+    assert find_whois_server("www.example.com") == "whois.verisign-grs.com"
+    assert get_domain_trie.cache_info().currsize == 0
+
+
+# 读取输入时查到的 WHOIS 服务器传给插件的 get_whois_server，每个域名只调用一次，结果流中使用其返回值
+def test_whois_server_passed_to_plugin(tmp_path, register_plugin, run_main):
+    calls: list[tuple[str, str]] = []
+
+    def get_whois_server(domain: str, whois_server: str) -> str:
+        calls.append((domain, whois_server))
+        return whois_server
+
+    register_plugin(
+        "fake_whois_server_hook",
+        main=lambda domain: {"code": 200, "raw": f"No match for {domain}"},
+        get_whois_server=get_whois_server,
+    )
+    result_stream_file = tmp_path / "result.jsonl"
+
+    run_main(
+        ["https://www.example.com/a", "example.co.uk", "www.example.net"],
+        "fake_whois_server_hook",
+        result_stream_file=str(result_stream_file),
+    )
+
+    assert sorted(calls) == [
+        ("example.co.uk", "whois.nic.uk"),
+        ("example.com", "whois.verisign-grs.com"),
+        ("example.net", "whois.verisign-grs.com"),
+    ]
+    records = map(json.loads, result_stream_file.read_text(encoding="utf-8").splitlines())
+    assert {record["domain"]: record["whois_server"] for record in records} == {
+        domain: whois_server for domain, whois_server in calls
+    }
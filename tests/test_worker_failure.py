@@ -0,0 +1,24 @@
+import time
+
+
+# 多进程模式下全部子进程在 setup 时退出，主进程不再阻塞在分发任务上，已分发的域名写入错误日志
+def test_all_workers_fail(tmp_path, register_plugin, run_main):
+    def setup() -> None:
+        # 等待主进程填满任务队列后再退出
+        time.sleep(0.5)
+        raise RuntimeError("setup failed")
+
+    register_plugin(
+        "fake_broken",
+        setup=setup,
+        main=lambda domain: {"code": 200, "raw": f"No match for {domain}"},
+    )
+
+    error_file = tmp_path / "error.txt"
+    input_file = run_main(
+        1000, "fake_broken", error_file=str(error_file), num_processes=2
+    )
+
+    lost_domains = error_file.read_text(encoding="utf-8").splitlines()
+    assert lost_domains
+    assert set(lost_domains) <= set(input_file.read_text(encoding="utf-8").splitlines())